@@ -3,12 +3,16 @@ const cors = require("cors");
 
 const sendRoute = require("./routes/send");
 const healthRoute = require("./routes/health");
+const mediaRoute = require("./routes/media");
+const statsRoute = require("./routes/stats");
 
 const app = express();
 app.use(cors());
-app.use(express.json());
+app.use(express.json({ limit: process.env.JSON_BODY_LIMIT || "5mb" }));
 
 app.use("/send", sendRoute);
 app.use("/health", healthRoute);
+app.use("/media", mediaRoute);
+app.use("/stats", statsRoute);
 
 module.exports = app;
@@ -0,0 +1,49 @@
+const express = require("express");
+const { MediaError, hasMedia, storeMedia } = require("../services/mediaStore");
+const logger = require("../utils/logger");
+
+const router = express.Router();
+
+function sendError(res, err) {
+  if (err instanceof MediaError) {
+    return res.status(err.status).json({
+      success: false,
+      error: { code: err.code, message: err.message }
+    });
+  }
+
+  logger.error("Media upload failed", { error: err.message });
+  return res.status(500).json({
+    success: false,
+    error: { code: "MEDIA_UPLOAD_FAILED", message: err.message }
+  });
+}
+
+// 200 when the media is stored, 404 otherwise. Lets clients skip uploads.
+router.head("/:id", (req, res) => {
+  try {
+    res.status(hasMedia(req.params.id) ? 200 : 404).end();
+  } catch (err) {
+    res.status(err.status || 500).end();
+  }
+});
+
+// Raw body (application/octet-stream), streamed to disk and verified
+// against the id. Uploading existing media is a no-op.
+router.put("/:id", async (req, res) => {
+  const { id } = req.params;
+
+  try {
+    if (hasMedia(id)) {
+      req.resume();
+      return res.status(200).json({ success: true, media_id: id });
+    }
+
+    const stored = await storeMedia(id, req);
+    return res.status(201).json({ success: true, ...stored });
+  } catch (err) {
+    return sendError(res, err);
+  }
+});
+
+module.exports = router;
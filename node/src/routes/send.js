@@ -4,36 +4,62 @@ const logger = require("../utils/logger");
 
 const router = express.Router();
 
-router.post("/", async (req, res) => {
-  if (req.body.metadata?.reference_id === "FORCE_LOGICAL_FAIL") {
-    return res.json({
-      success: false,
-      error: {
-        code: "WHATSAPP_REJECTED",
-        message: "Forced logical failure for testing"
+const BATCH_MAX_SIZE = parseInt(process.env.BATCH_MAX_SIZE || "500", 10);
+
+// Returns null when the message is valid, otherwise { status, body }.
+function validateMessage(message) {
+  if (message?.metadata?.reference_id === "FORCE_LOGICAL_FAIL") {
+    return {
+      status: 200,
+      body: {
+        success: false,
+        error: {
+          code: "WHATSAPP_REJECTED",
+          message: "Forced logical failure for testing"
+        }
       }
-    });
+    };
   }
 
-  const { recipient, content, attachment } = req.body;
+  const { recipient, content, attachment } = message || {};
 
   if (!recipient || !content) {
-    return res.status(400).json({
-      success: false,
-      error: "recipient and content are required"
-    });
+    return {
+      status: 400,
+      body: {
+        success: false,
+        error: "recipient and content are required"
+      }
+    };
   }
 
-  if (attachment && typeof attachment.path !== "string") {
-    return res.status(400).json({
-      success: false,
-      error: {
-        code: "INVALID_ATTACHMENT",
-        message: "attachment.path is required"
+  if (
+    attachment &&
+    typeof attachment.path !== "string" &&
+    typeof attachment.media_id !== "string"
+  ) {
+    return {
+      status: 400,
+      body: {
+        success: false,
+        error: {
+          code: "INVALID_ATTACHMENT",
+          message: "attachment.path or attachment.media_id is required"
+        }
       }
-    });
+    };
+  }
+
+  return null;
+}
+
+router.post("/", async (req, res) => {
+  const invalid = validateMessage(req.body);
+  if (invalid) {
+    return res.status(invalid.status).json(invalid.body);
   }
 
+  const { recipient, content, attachment } = req.body;
 
   try {
     const result = await sendMessage(recipient, content, attachment);
@@ -51,4 +77,69 @@ router.post("/", async (req, res) => {
   }
 });
 
+// Sends many messages in one request. Items are delivered in order and
+// each gets its own result; one failing item never fails the batch.
+router.post("/batch", async (req, res) => {
+  const messages = req.body?.messages;
+
+  if (!Array.isArray(messages) || messages.length === 0) {
+    return res.status(400).json({
+      success: false,
+      error: {
+        code: "INVALID_BATCH",
+        message: "messages must be a non-empty array"
+      }
+    });
+  }
+
+  if (messages.length > BATCH_MAX_SIZE) {
+    return res.status(413).json({
+      success: false,
+      error: {
+        code: "BATCH_TOO_LARGE",
+        message: `batch size must be <= ${BATCH_MAX_SIZE}`
+      }
+    });
+  }
+
+  const results = [];
+
+  for (const message of messages) {
+    const invalid = validateMessage(message);
+    if (invalid) {
+      const error = invalid.body.error;
+      results.push({
+        success: false,
+        error:
+          typeof error === "string"
+            ? { code: "INVALID_MESSAGE", message: error }
+            : error
+      });
+      continue;
+    }
+
+    const { recipient, content, attachment } = message;
+
+    try {
+      const result = await sendMessage(recipient, content, attachment);
+      results.push({ success: true, ...result });
+    } catch (err) {
+      logger.error("Batch item send failed", { error: err.message });
+      results.push({
+        success: false,
+        error: {
+          code: "PROVIDER_UNAVAILABLE",
+          message: err.message
+        }
+      });
+    }
+  }
+
+  return res.json({
+    success: true,
+    provider: "whatsapp",
+    results
+  });
+});
+
 module.exports = router;
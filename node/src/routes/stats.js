@@ -0,0 +1,14 @@
+const express = require("express");
+const { mediaCache } = require("../services/mediaCache");
+
+const router = express.Router();
+
+router.get("/", (req, res) => {
+  res.json({
+    provider: "whatsapp",
+    media_cache: mediaCache.stats(),
+    timestamp: new Date().toISOString()
+  });
+});
+
+module.exports = router;
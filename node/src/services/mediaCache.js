@@ -0,0 +1,85 @@
+const fs = require("fs");
+
+const MEDIA_CACHE_MAX_BYTES = parseInt(
+  process.env.MEDIA_CACHE_MAX_BYTES || String(256 * 1024 * 1024),
+  10
+);
+const MEDIA_CACHE_MAX_ENTRIES = parseInt(
+  process.env.MEDIA_CACHE_MAX_ENTRIES || "1000",
+  10
+);
+
+// LRU cache of loaded MessageMedia, keyed by path + mtime + size so a
+// replaced file is loaded again. Memory is counted as the length of the
+// base64 payload; least recently used entries are evicted past the cap.
+class MediaCache {
+  constructor({
+    maxBytes = MEDIA_CACHE_MAX_BYTES,
+    maxEntries = MEDIA_CACHE_MAX_ENTRIES
+  } = {}) {
+    this.maxBytes = maxBytes;
+    this.maxEntries = maxEntries;
+    this.entries = new Map(); // insertion order = recency
+    this.bytes = 0;
+    this.hits = 0;
+    this.misses = 0;
+    this.evictions = 0;
+  }
+
+  // Returns the cached media for `filePath`, or `load(filePath)`.
+  // Throws ENOENT like fs.statSync when the file does not exist.
+  get(filePath, load) {
+    const stat = fs.statSync(filePath);
+    const key = `${filePath}:${stat.mtimeMs}:${stat.size}`;
+
+    const cached = this.entries.get(key);
+    if (cached) {
+      this.hits += 1;
+      this.entries.delete(key);
+      this.entries.set(key, cached);
+      return cached.media;
+    }
+
+    this.misses += 1;
+    const media = load(filePath);
+    const size = media.data.length;
+
+    if (size <= this.maxBytes) {
+      this.entries.set(key, { media, size });
+      this.bytes += size;
+      this._evict();
+    }
+
+    return media;
+  }
+
+  _evict() {
+    for (const [key, entry] of this.entries) {
+      if (this.bytes <= this.maxBytes && this.entries.size <= this.maxEntries) {
+        break;
+      }
+      this.entries.delete(key);
+      this.bytes -= entry.size;
+      this.evictions += 1;
+    }
+  }
+
+  clear() {
+    this.entries.clear();
+    this.bytes = 0;
+  }
+
+  stats() {
+    return {
+      hits: this.hits,
+      misses: this.misses,
+      evictions: this.evictions,
+      entries: this.entries.size,
+      bytes: this.bytes,
+      max_bytes: this.maxBytes,
+      max_entries: this.maxEntries
+    };
+  }
+}
+
+module.exports = { MediaCache, mediaCache: new MediaCache() };
@@ -0,0 +1,78 @@
+const crypto = require("crypto");
+const fs = require("fs");
+const path = require("path");
+const { Transform } = require("stream");
+const { pipeline } = require("stream/promises");
+
+// Uploaded attachments, one file per content hash (hex SHA-256).
+const MEDIA_DIR = process.env.MEDIA_DIR || path.join(process.cwd(), "media");
+const MEDIA_MAX_BYTES = parseInt(
+  process.env.MEDIA_MAX_BYTES || String(64 * 1024 * 1024),
+  10
+);
+
+const MEDIA_ID = /^[a-f0-9]{64}$/;
+
+class MediaError extends Error {
+  constructor(status, code, message) {
+    super(message);
+    this.status = status;
+    this.code = code;
+  }
+}
+
+function isMediaId(id) {
+  return typeof id === "string" && MEDIA_ID.test(id);
+}
+
+function mediaPath(id) {
+  if (!isMediaId(id)) {
+    throw new MediaError(400, "INVALID_MEDIA_ID", "media id must be a hex SHA-256");
+  }
+  return path.join(MEDIA_DIR, id);
+}
+
+function hasMedia(id) {
+  return fs.existsSync(mediaPath(id));
+}
+
+// Streams `source` to disk while hashing it; the file only becomes
+// visible under its id once the hash matches.
+async function storeMedia(id, source) {
+  const target = mediaPath(id);
+  const temp = `${target}.${process.pid}.${Date.now()}.part`;
+  const hash = crypto.createHash("sha256");
+  let size = 0;
+
+  const verify = new Transform({
+    transform(chunk, encoding, callback) {
+      size += chunk.length;
+      if (size > MEDIA_MAX_BYTES) {
+        return callback(
+          new MediaError(413, "MEDIA_TOO_LARGE", `media must be <= ${MEDIA_MAX_BYTES} bytes`)
+        );
+      }
+      hash.update(chunk);
+      callback(null, chunk);
+    }
+  });
+
+  await fs.promises.mkdir(MEDIA_DIR, { recursive: true });
+
+  try {
+    await pipeline(source, verify, fs.createWriteStream(temp));
+
+    if (hash.digest("hex") !== id) {
+      throw new MediaError(400, "HASH_MISMATCH", "content does not match media id");
+    }
+
+    await fs.promises.rename(temp, target);
+  } catch (err) {
+    await fs.promises.rm(temp, { force: true });
+    throw err;
+  }
+
+  return { media_id: id, size };
+}
+
+module.exports = { MediaError, isMediaId, mediaPath, hasMedia, storeMedia };
@@ -1,8 +1,49 @@
-const fs = require("fs");
 const path = require("path");
 const { MessageMedia } = require("whatsapp-web.js");
 const client = require("../whatsapp/client");
+const { mediaPath } = require("./mediaStore");
+const { mediaCache } = require("./mediaCache");
 
+// Encoding an attachment is done once per file version, not once per
+// recipient: loaded media is kept in the LRU media cache.
+function loadMedia(filePath) {
+  try {
+    return mediaCache.get(filePath, (p) => MessageMedia.fromFilePath(p));
+  } catch (err) {
+    if (err.code === "ENOENT") {
+      return null;
+    }
+    throw err;
+  }
+}
+
+function loadSharedMedia(attachment) {
+  const filePath = attachment.path;
+  const media = loadMedia(filePath);
+
+  if (!media) {
+    throw new Error(`Attachment not found: ${filePath}`);
+  }
+
+  return media;
+}
+
+// Media uploaded through PUT /media/:id (upload mode)
+function loadUploadedMedia(attachment) {
+  const media = loadMedia(mediaPath(attachment.media_id));
+
+  if (!media) {
+    throw new Error(`Media not found: ${attachment.media_id}`);
+  }
+
+  // Stored files have no extension: type and name come with the send.
+  // The base64 payload is shared with the cached entry, not copied.
+  return new MessageMedia(
+    attachment.mime_type || "application/octet-stream",
+    media.data,
+    attachment.filename || attachment.media_id
+  );
+}
 
 async function sendMessage(to, text, attachment = null) {
   if (!client.info) {
@@ -11,14 +52,9 @@ async function sendMessage(to, text, attachment = null) {
 
   const chatId = to.includes("@c.us") ? to : `${to}@c.us`;
   if (attachment) {
-    const filePath = attachment.path;
-    console.log(`File path: ${filePath}`)
-
-    if (!fs.existsSync(filePath)) {
-      throw new Error(`Attachment not found: ${filePath}`);
-    }
-
-    const media = MessageMedia.fromFilePath(filePath);
+    const media = attachment.media_id
+      ? loadUploadedMedia(attachment)
+      : loadSharedMedia(attachment);
 
     const options = {};
     if (text) {
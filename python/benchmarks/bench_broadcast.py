@@ -0,0 +1,92 @@
+"""
+bench_broadcast.py
+
+Cost of sending one 4 KB text to many recipients:
+
+- WhatsApp request body encoding per message: individual `Message`s
+  vs. messages of a `Broadcast` (payload template)
+- Memory held by N individual messages vs. N broadcast messages
+
+Each timing is the best of 5 runs.
+
+Run from the `python/` directory:
+
+    python -m benchmarks.bench_broadcast
+"""
+
+import time
+import tracemalloc
+
+from broadcastio.core.broadcast import Broadcast
+from broadcastio.core.message import Message
+from broadcastio.providers.whatsapp import WhatsAppProvider
+from benchmarks.common import report
+
+N = 20_000
+REPEAT = 5
+CONTENT_BYTES = 4096
+
+
+def _content() -> str:
+    # Built at run time, so every Message can own a separate copy
+    return "".join(chr(ord("a") + i % 26) for i in range(CONTENT_BYTES))
+
+
+def _individual(recipients):
+    return [
+        Message(recipient=r, content=_content(), metadata={"tags": ["promo"]})
+        for r in recipients
+    ]
+
+
+def _encode(wa: WhatsAppProvider, messages) -> float:
+    started = time.perf_counter()
+    for message in messages:
+        wa._encode(message)
+    return time.perf_counter() - started
+
+
+def bench_encode() -> None:
+    recipients = [str(i) for i in range(N)]
+    individual = _individual(recipients)
+    broadcast = list(Broadcast(_content(), recipients, metadata={"tags": ["promo"]}))
+
+    wa = WhatsAppProvider("http://localhost:1")
+    single = shared = float("inf")
+    for _ in range(REPEAT):
+        single = min(single, _encode(wa, individual))
+        shared = min(shared, _encode(wa, broadcast))
+    wa.close()
+
+    report("encode Message", single, N)
+    report("encode BroadcastMessage", shared, N)
+
+
+def _held(build) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    messages = build()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del messages
+    return held
+
+
+def bench_memory() -> None:
+    recipients = [str(i) for i in range(N)]
+    single = _held(lambda: _individual(recipients))
+    shared = _held(
+        lambda: list(Broadcast(_content(), recipients, metadata={"tags": ["promo"]}))
+    )
+
+    print(f"{'memory per Message':<36} {single / N:7.0f} B")
+    print(f"{'memory per BroadcastMessage':<36} {shared / N:7.0f} B")
+
+
+def main() -> None:
+    bench_encode()
+    bench_memory()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+bench_metrics.py
+
+Cost of the built-in metrics registry:
+
+- raw `Metrics.record_attempt()` calls (the per-attempt hot path),
+  net of the benchmark loop itself
+- the same, with 4 threads recording concurrently
+- `Orchestrator.send()` with and without `metrics=` (null provider),
+  and the difference
+- `snapshot()` / `to_prometheus()` after the run
+
+Each figure is the best of 5 runs.
+
+Run from the `python/` directory:
+
+    python -m benchmarks.bench_metrics
+"""
+
+import contextlib
+import io
+import threading
+import time
+
+from broadcastio.core.message import Message
+from broadcastio.core.metrics import Metrics
+from broadcastio.core.orchestrator import Orchestrator
+from benchmarks.common import NullProvider, report
+
+N = 200_000
+REPEAT = 5
+
+
+def _best(fn, *args) -> float:
+    """
+    Fastest of REPEAT runs: the machine's noise only ever adds time.
+    """
+    return min(fn(*args) for _ in range(REPEAT))
+
+
+def _loop(ops: int) -> float:
+    started = time.perf_counter()
+    for _ in range(ops):
+        pass
+    return time.perf_counter() - started
+
+
+def _record(metrics: Metrics, ops: int) -> float:
+    record = metrics.record_attempt
+    codes = [None] * 9 + ["PROVIDER_UNAVAILABLE"]
+    latencies = [float(i % 2000) for i in range(1000)]
+    started = time.perf_counter()
+    for i in range(ops):
+        record("wa", codes[i % 10], latencies[i % 1000], False)
+    return time.perf_counter() - started
+
+
+def bench_record() -> Metrics:
+    metrics = Metrics()
+    elapsed = _best(_record, metrics, N) - _best(_loop, N)
+    report("Metrics.record_attempt", elapsed, N)
+    return metrics
+
+
+def bench_contended(threads: int = 4) -> None:
+    metrics = Metrics()
+    per_thread = N // threads
+
+    def run() -> float:
+        workers = [
+            threading.Thread(target=_record, args=(metrics, per_thread))
+            for _ in range(threads)
+        ]
+        started = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        return time.perf_counter() - started
+
+    report(
+        f"record_attempt, {threads} threads (total)",
+        _best(run),
+        per_thread * threads,
+    )
+
+
+def _send(orch: Orchestrator, message: Message, ops: int) -> float:
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        for _ in range(ops):
+            orch.send(message)
+        return time.perf_counter() - started
+
+
+def bench_orchestrator() -> None:
+    message = Message(recipient="123", content="hello")
+    count = N // 10
+
+    plain_orch = Orchestrator([NullProvider()])
+    measured_orch = Orchestrator([NullProvider()], metrics=Metrics())
+
+    # Alternate the two so both see the same machine load
+    plain = measured = float("inf")
+    for _ in range(REPEAT):
+        plain = min(plain, _send(plain_orch, message, count))
+        measured = min(measured, _send(measured_orch, message, count))
+
+    report("send() without metrics", plain, count)
+    report("send() with metrics", measured, count)
+    report("metrics overhead per send", measured - plain, count)
+
+
+def bench_export(metrics: Metrics) -> None:
+    count = 1000
+    started = time.perf_counter()
+    for _ in range(count):
+        metrics.snapshot()
+    report("snapshot()", time.perf_counter() - started, count)
+
+    started = time.perf_counter()
+    for _ in range(count):
+        metrics.to_prometheus()
+    report("to_prometheus()", time.perf_counter() - started, count)
+
+
+def main() -> None:
+    metrics = bench_record()
+    bench_contended()
+    bench_orchestrator()
+    bench_export(metrics)
+
+
+if __name__ == "__main__":
+    main()
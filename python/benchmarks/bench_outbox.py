@@ -0,0 +1,63 @@
+"""
+bench_outbox.py
+
+Throughput of the SQLite outbox:
+
+- `Outbox.enqueue_many()` in transactions of 1k rows
+- `Outbox.drain()` with 1, 4 and 8 workers, through an Orchestrator
+  with a no-op provider (so the numbers are outbox overhead)
+
+Run from the `python/` directory:
+
+    python -m benchmarks.bench_outbox
+"""
+
+import os
+import tempfile
+import time
+
+from broadcastio.core.message import Message, MessageMetadata
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.outbox import Outbox
+from benchmarks.common import NullProvider, report
+
+N = 50_000
+
+
+def _messages(count):
+    return [
+        Message(
+            recipient=str(i),
+            content=f"hello {i}",
+            metadata=MessageMetadata(reference_id=f"ref-{i}", tags=["bench"]),
+        )
+        for i in range(count)
+    ]
+
+
+def bench_enqueue(path: str) -> None:
+    messages = _messages(N)
+    with Outbox(path) as outbox:
+        started = time.perf_counter()
+        outbox.enqueue_many(messages, batch_size=1000)
+        report("enqueue_many (batches of 1k)", time.perf_counter() - started, N)
+
+
+def bench_drain(path: str, workers: int) -> None:
+    orch = Orchestrator([NullProvider()])
+    with Outbox(path) as outbox:
+        outbox.enqueue_many(_messages(N))
+        started = time.perf_counter()
+        processed = outbox.drain(orch, workers=workers, batch_size=200)
+        report(f"drain, {workers} worker(s)", time.perf_counter() - started, processed)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        bench_enqueue(os.path.join(tmp, "enqueue.db"))
+        for workers in (1, 4, 8):
+            bench_drain(os.path.join(tmp, f"drain-{workers}.db"), workers)
+
+
+if __name__ == "__main__":
+    main()
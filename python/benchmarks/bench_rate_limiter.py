@@ -0,0 +1,109 @@
+"""
+bench_rate_limiter.py
+
+Overhead of the token-bucket limiter, with the limit set high enough
+(1M msg/s) that it never actually throttles:
+
+- raw `TokenBucket.try_acquire()` / `reserve()` calls
+- per-recipient `KeyedTokenBuckets.reserve()` over 10k recipients
+- the same, with 4 threads contending for one bucket
+- `Orchestrator.send()` with and without limits (DummyProvider)
+
+Run from the `python/` directory:
+
+    python -m benchmarks.bench_rate_limiter
+"""
+
+import contextlib
+import io
+import threading
+import time
+
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.ratelimit import KeyedTokenBuckets, RateLimit, TokenBucket
+from benchmarks.common import NullProvider, report
+
+N = 200_000
+UNLIMITED = RateLimit(rate=1_000_000, burst=1_000_000)
+
+
+def bench_bucket() -> None:
+    bucket = TokenBucket(UNLIMITED)
+    acquire = bucket.try_acquire
+    started = time.perf_counter()
+    for _ in range(N):
+        acquire()
+    report("TokenBucket.try_acquire", time.perf_counter() - started, N)
+
+    bucket = TokenBucket(UNLIMITED)
+    reserve = bucket.reserve
+    started = time.perf_counter()
+    for _ in range(N):
+        reserve()
+    report("TokenBucket.reserve", time.perf_counter() - started, N)
+
+
+def bench_keyed() -> None:
+    buckets = KeyedTokenBuckets(UNLIMITED)
+    recipients = [str(i) for i in range(10_000)]
+    reserve = buckets.reserve
+    started = time.perf_counter()
+    for i in range(N):
+        reserve(recipients[i % 10_000])
+    report("KeyedTokenBuckets.reserve (10k keys)", time.perf_counter() - started, N)
+
+
+def bench_contended(threads: int = 4) -> None:
+    bucket = TokenBucket(UNLIMITED)
+    per_thread = N // threads
+
+    def worker():
+        acquire = bucket.try_acquire
+        for _ in range(per_thread):
+            acquire()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    report(
+        f"try_acquire, {threads} threads (total)",
+        time.perf_counter() - started,
+        per_thread * threads,
+    )
+
+
+def bench_orchestrator() -> None:
+    message = Message(recipient="123", content="hello")
+    count = N // 4
+
+    for label, options in (
+        ("send() without limits", {}),
+        (
+            "send() with provider+recipient limits",
+            {
+                "rate_limits": {"null": UNLIMITED},
+                "recipient_rate_limit": UNLIMITED,
+            },
+        ),
+    ):
+        orch = Orchestrator([NullProvider()], **options)
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            for _ in range(count):
+                orch.send(message)
+        report(label, time.perf_counter() - started, count)
+
+
+def main() -> None:
+    bench_bucket()
+    bench_keyed()
+    bench_contended()
+    bench_orchestrator()
+
+
+if __name__ == "__main__":
+    main()
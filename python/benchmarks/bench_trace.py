@@ -0,0 +1,81 @@
+"""
+bench_trace.py
+
+Per-send cost of delivery tracing:
+
+- `Orchestrator.send()` with `trace=False` and `trace=True`, and the
+  difference (null provider, one attempt per send)
+- `Orchestrator.send()` exporting a 1% sample through `TraceExporter`
+- `DeliveryTrace.to_dict()`
+
+Each figure is the best of 5 runs.
+
+Run from the `python/` directory:
+
+    python -m benchmarks.bench_trace
+"""
+
+import contextlib
+import io
+import time
+
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.trace import DeliveryTrace
+from broadcastio.core.trace_export import TraceExporter
+from benchmarks.common import NullProvider, report
+
+N = 50_000
+REPEAT = 5
+
+
+def _send(orch: Orchestrator, message: Message, trace: bool) -> float:
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        for _ in range(N):
+            orch.send(message, trace=trace)
+        return time.perf_counter() - started
+
+
+def bench_send() -> None:
+    orch = Orchestrator([NullProvider()])
+    message = Message(recipient="123", content="hello")
+
+    exporter = TraceExporter(lambda records: None, sample_rate=0.01)
+    exported = Orchestrator([NullProvider()], trace_exporter=exporter)
+
+    # Alternate the runs so all see the same machine load
+    plain = traced = sampled = float("inf")
+    for _ in range(REPEAT):
+        plain = min(plain, _send(orch, message, False))
+        traced = min(traced, _send(orch, message, True))
+        sampled = min(sampled, _send(exported, message, False))
+    exporter.close()
+
+    report("send(trace=False)", plain, N)
+    report("send(trace=True)", traced, N)
+    report("tracing overhead per send", traced - plain, N)
+    report("send() with 1% TraceExporter", sampled, N)
+
+
+def _to_dict(trace: DeliveryTrace) -> float:
+    started = time.perf_counter()
+    for _ in range(N):
+        trace.to_dict()
+    return time.perf_counter() - started
+
+
+def bench_to_dict() -> None:
+    orch = Orchestrator([NullProvider()])
+    with contextlib.redirect_stdout(io.StringIO()):
+        trace = orch.send(Message(recipient="123", content="hello"), trace=True).trace
+    report("DeliveryTrace.to_dict()", min(_to_dict(trace) for _ in range(REPEAT)), N)
+
+
+def main() -> None:
+    bench_send()
+    bench_to_dict()
+
+
+if __name__ == "__main__":
+    main()
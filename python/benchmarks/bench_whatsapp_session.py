@@ -0,0 +1,69 @@
+"""
+bench_whatsapp_session.py
+
+Per-message latency of WhatsAppProvider against a local stub service:
+a fresh connection per request (module-level `requests.post`, the old
+behavior) vs the provider's pooled keep-alive session.
+
+Run from the `python/` directory:
+
+    python -m benchmarks.bench_whatsapp_session
+"""
+
+import statistics
+import time
+
+import requests
+
+from broadcastio.core.message import Message
+from broadcastio.providers.whatsapp import WhatsAppProvider
+from tests.helpers import StubWhatsAppService
+
+N = 2000
+
+
+def _report(label: str, samples) -> None:
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"{label:<28} p50={p50 * 1e6:8.0f}us  p99={p99 * 1e6:8.0f}us")
+
+
+def bench_unpooled(url: str, message: Message) -> list:
+    payload = {"recipient": message.recipient, "content": message.content}
+    samples = []
+    for _ in range(N):
+        started = time.perf_counter()
+        requests.post(f"{url}/send", json=payload, timeout=5).json()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def bench_pooled(url: str, message: Message) -> list:
+    samples = []
+    with WhatsAppProvider(url) as wa:
+        for _ in range(N):
+            started = time.perf_counter()
+            wa.send(message)
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main() -> None:
+    message = Message(recipient="123", content="hello")
+
+    with StubWhatsAppService() as service:
+        unpooled = bench_unpooled(service.url, message)
+        pooled = bench_pooled(service.url, message)
+
+    print(f"{N} sequential sends against {service.url}")
+    _report("new connection per send", unpooled)
+    _report("pooled keep-alive session", pooled)
+    print(
+        "speedup (p50): "
+        f"{statistics.median(unpooled) / statistics.median(pooled):.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
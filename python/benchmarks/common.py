@@ -0,0 +1,24 @@
+"""
+common.py
+
+Shared pieces of the benchmarks: a provider that does no I/O, so the
+numbers measure broadcastio itself, and the one-line report format.
+"""
+
+from broadcastio.core.health import ProviderHealth
+from broadcastio.core.result import DeliveryResult
+from broadcastio.providers.base import MessageProvider
+
+
+class NullProvider(MessageProvider):
+    name = "null"
+
+    def health(self) -> ProviderHealth:
+        return ProviderHealth(provider=self.name, ready=True)
+
+    def send(self, message):
+        return DeliveryResult(success=True, provider=self.name)
+
+
+def report(label: str, elapsed: float, ops: int) -> None:
+    print(f"{label:<36} {elapsed / ops * 1e9:7.0f} ns/op  {ops / elapsed:12,.0f} ops/s")
@@ -0,0 +1,237 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from broadcastio.core.exceptions import BroadcastioError, ValidationError
+from broadcastio.core.health import ProviderHealth
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.result import DeliveryResult
+from broadcastio.providers.async_base import AsyncMessageProvider, SyncProviderAdapter
+from broadcastio.providers.base import MessageProvider
+
+
+class AsyncOrchestrator(Orchestrator):
+    """
+    asyncio counterpart of `Orchestrator`.
+
+    Same validation, health, retry, fallback, tracing and hook semantics,
+    with coroutine `send()` / `send_many()`:
+    - retries back off with `asyncio.sleep`
+    - in-flight deliveries are capped by a semaphore
+    - synchronous providers run in an executor via `SyncProviderAdapter`
+
+    Hooks are still called synchronously and must not block.
+    """
+
+    def __init__(
+        self,
+        providers: List[Union[AsyncMessageProvider, MessageProvider]],
+        *,
+        max_concurrency: int = 100,
+        executor: Optional[Executor] = None,
+        **options: Any,
+    ):
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ValidationError("max_concurrency must be an integer >= 1")
+
+        if options.get("hedge_policy") is not None:
+            raise ValidationError("hedge_policy is not supported by AsyncOrchestrator")
+
+        super().__init__(
+            [
+                (
+                    provider
+                    if isinstance(provider, AsyncMessageProvider)
+                    else SyncProviderAdapter(provider, executor)
+                )
+                for provider in providers
+            ],
+            **options,
+        )
+
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._health_tasks: Dict[str, asyncio.Future] = {}
+        self._idempotency_tasks: Dict[str, asyncio.Future] = {}
+
+    async def _get_provider_health_async(
+        self, provider: AsyncMessageProvider
+    ) -> ProviderHealth:
+        if self.health_monitor is not None:
+            return self.health_monitor.get(provider)
+
+        health = self._cached_health(provider, datetime.now(timezone.utc))
+        if health is not None:
+            return health
+
+        # Single-flight across coroutines sharing this orchestrator
+        probe = self._health_tasks.get(provider.name)
+        if probe is None:
+            probe = asyncio.ensure_future(self._probe_health_async(provider))
+            self._health_tasks[provider.name] = probe
+            probe.add_done_callback(
+                lambda _: self._health_tasks.pop(provider.name, None)
+            )
+
+        return await asyncio.shield(probe)
+
+    async def _probe_health_async(
+        self, provider: AsyncMessageProvider
+    ) -> ProviderHealth:
+        now = datetime.now(timezone.utc)
+        health = await provider.health()
+        with self._health_lock:
+            self._health_cache[provider.name] = (now, health)
+        return health
+
+    async def _iter_providers_async(self) -> List[AsyncMessageProvider]:
+        healths = await asyncio.gather(
+            *(self._get_provider_health_async(p) for p in self.providers)
+        )
+        return self._select_providers(self.providers, list(healths))
+
+    async def _call_provider_async(
+        self, provider: AsyncMessageProvider, message: Message
+    ) -> DeliveryResult:
+        routing = self.routing
+        if routing is not None:
+            routing.on_start(provider.name)
+
+        try:
+            return await provider.send(message)
+        except BroadcastioError:
+            # Configuration / misuse → stop immediately
+            raise
+        except Exception as exc:
+            return self._error_result(provider, exc)
+        finally:
+            if routing is not None:
+                routing.on_finish(provider.name)
+
+    async def send(  # type: ignore[override]
+        self, message: Message, *, trace: bool = False
+    ) -> DeliveryResult:
+        self._validate_message(message)
+
+        if self.idempotency is None:
+            return await self._deliver_async(message, trace)
+
+        key = message.metadata.reference_id
+        result = self.idempotency.get(key)
+        if result is not None:
+            return result
+
+        # Single-flight across coroutines sending the same key
+        flight = self._idempotency_tasks.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(
+                self._deliver_and_store_async(message, trace)
+            )
+            self._idempotency_tasks[key] = flight
+            flight.add_done_callback(lambda _: self._idempotency_tasks.pop(key, None))
+
+        return await asyncio.shield(flight)
+
+    async def _deliver_and_store_async(
+        self, message: Message, trace: bool
+    ) -> DeliveryResult:
+        result = await self._deliver_async(message, trace)
+        if result.success:
+            self.idempotency.put(message.metadata.reference_id, result)
+        return result
+
+    async def _deliver_async(self, message: Message, trace: bool) -> DeliveryResult:
+        async with self._semaphore:
+            run = self._start_run(message, await self._iter_providers_async(), trace)
+
+            while run.result is None:
+                delay = self._acquire_attempt(run)
+                if delay is None:
+                    continue
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                started_ns = time.perf_counter_ns()
+                result = await self._call_provider_async(run.provider, message)
+                finished_ns = time.perf_counter_ns()
+
+                delay = self._complete_attempt(run, result, started_ns, finished_ns)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+        return run.result
+
+    async def send_many(  # type: ignore[override]
+        self,
+        messages: Iterable[Message],
+        *,
+        trace: bool = False,
+    ) -> List[DeliveryResult]:
+        """
+        Send many messages concurrently, at most `max_concurrency` at a time.
+
+        Results are returned in input order.
+        """
+        results: List[Optional[DeliveryResult]] = []
+
+        async for index, result in self.iter_send_many(messages, trace=trace):
+            if index >= len(results):
+                results.extend([None] * (index + 1 - len(results)))
+            results[index] = result
+
+        return results  # type: ignore[return-value]
+
+    async def iter_send_many(  # type: ignore[override]
+        self,
+        messages: Iterable[Message],
+        *,
+        trace: bool = False,
+    ) -> AsyncIterator[Tuple[int, DeliveryResult]]:
+        """
+        Yield `(index, DeliveryResult)` pairs as deliveries complete.
+
+        `messages` is consumed lazily: at most `2 * max_concurrency` tasks
+        exist at any time. Exceptions raised by `send()` propagate and
+        cancel the remaining tasks.
+        """
+        window = self.max_concurrency * 2
+        indexes: Dict[asyncio.Task, int] = {}
+        pending: Set[asyncio.Task] = set()
+
+        try:
+            for index, message in enumerate(messages):
+                task = asyncio.ensure_future(self.send(message, trace=trace))
+                indexes[task] = index
+                pending.add(task)
+
+                if len(pending) >= window:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        yield indexes.pop(task), task.result()
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield indexes.pop(task), task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
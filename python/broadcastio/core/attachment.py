@@ -1,5 +1,14 @@
+import hashlib
+import mmap
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
+
+from broadcastio.core.exceptions import AttachmentError, ValidationError
 
 
 @dataclass
@@ -7,8 +16,176 @@ class Attachment:
     # Path as seen by PYTHON (host)
     host_path: str
 
-    # Path as seen by PROVIDER (container)
-    provider_path: str
+    # Path as seen by PROVIDER (container); not needed when the
+    # provider uploads the file (e.g. WhatsAppProvider upload mode)
+    provider_path: Optional[str] = None
 
     filename: Optional[str] = None
     mime_type: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "host_path": self.host_path,
+            "provider_path": self.provider_path,
+            "filename": self.filename,
+            "mime_type": self.mime_type,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Attachment":
+        return cls(
+            host_path=data["host_path"],
+            provider_path=data.get("provider_path"),
+            filename=data.get("filename"),
+            mime_type=data.get("mime_type"),
+        )
+
+
+@dataclass(frozen=True)
+class AttachmentInfo:
+    """
+    A version of an attachment file, identified by its size and mtime.
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+
+
+class _Entry:
+    __slots__ = ("info", "checked_at", "sha256")
+
+    def __init__(self, info: AttachmentInfo, checked_at: float):
+        self.info = info
+        self.checked_at = checked_at
+        self.sha256: Optional[str] = None
+
+
+class AttachmentCache:
+    """
+    Caches attachment validation by path.
+
+    `check()` stats a file at most once per `ttl` seconds; after that,
+    it stats it again and keeps the cached entry if size and mtime are
+    unchanged. `sha256()` hashes a file version once. At most
+    `max_entries` paths are kept (least recently used dropped first).
+
+    Share one cache between the Orchestrator and providers so repeated
+    attachments (the same report to 20k recipients) cost one stat per
+    `ttl` and one hash.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 5.0,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if ttl < 0:
+            raise ValidationError("AttachmentCache.ttl must be >= 0")
+
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise ValidationError("AttachmentCache.max_entries must be an integer >= 1")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        # path -> _Entry
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stat_calls = 0
+        self.hashes = 0
+
+    def check(self, path: str) -> Optional[AttachmentInfo]:
+        """
+        Return the current version of a regular file, or None if
+        `path` is missing or not a regular file.
+        """
+        entry = self._entry(path)
+        return entry.info if entry is not None else None
+
+    def _entry(self, path: str) -> Optional[_Entry]:
+        now = self._clock()
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and now - entry.checked_at < self.ttl:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry
+            self.stat_calls += 1
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+
+        with self._lock:
+            if st is None or not stat.S_ISREG(st.st_mode):
+                self._entries.pop(path, None)
+                return None
+
+            entry = self._entries.get(path)
+            if (
+                entry is None
+                or entry.info.size != st.st_size
+                or entry.info.mtime_ns != st.st_mtime_ns
+            ):
+                # New or changed file: drop its hash
+                entry = _Entry(AttachmentInfo(path, st.st_size, st.st_mtime_ns), now)
+                self._entries[path] = entry
+            else:
+                entry.checked_at = now
+
+            self._entries.move_to_end(path)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return entry
+
+    def sha256(self, path: str) -> str:
+        """
+        Hex SHA-256 of the file's current version, hashed once per
+        version. Raises AttachmentError if the file is missing.
+        """
+        entry = self._entry(path)
+        if entry is None:
+            raise AttachmentError(f"Attachment not found: {path}")
+
+        digest = entry.sha256
+        if digest is None:
+            digest = _hash_file(path)
+            with self._lock:
+                self.hashes += 1
+                entry.sha256 = digest
+        return digest
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Forget `path`, or every path.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _hash_file(path: str) -> str:
+    with open(path, "rb") as fh, map_file(fh) as data:
+        return hashlib.sha256(data).hexdigest()
+
+
+def map_file(fh) -> "mmap.mmap | memoryview":
+    """
+    Read-only memory map of an open binary file, so it can be hashed or
+    streamed without copying it into memory. Empty files (which can't
+    be mapped) give an empty memoryview.
+    """
+    if os.fstat(fh.fileno()).st_size == 0:
+        return memoryview(b"")
+    return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
@@ -0,0 +1,91 @@
+from typing import Iterable, Iterator, Optional
+
+from broadcastio.core.attachment import Attachment
+from broadcastio.core.exceptions import ValidationError
+from broadcastio.core.message import Message, MessageMetadata, _metadata_from_dict
+
+
+class BroadcastMessage(Message):
+    """
+    A `Message` produced by a `Broadcast`.
+
+    Shares `content`, `attachment` and the metadata `tags` / `extra`
+    with its broadcast; only the recipient and the `reference_id` are
+    its own. `index` is the recipient's position in the broadcast.
+    """
+
+    __slots__ = ("broadcast", "index")
+
+    def __init__(self, broadcast: "Broadcast", index: int, recipient: str):
+        metadata = broadcast.metadata
+        suffix = recipient if broadcast.key_by_recipient else index
+        Message.__init__(
+            self,
+            recipient=recipient,
+            content=broadcast.content,
+            metadata=MessageMetadata(
+                priority=metadata.priority,
+                reference_id=f"{metadata.reference_id}:{suffix}",
+                tags=metadata.tags,
+                extra=metadata.extra,
+            ),
+            attachment=broadcast.attachment,
+        )
+        self.broadcast = broadcast
+        self.index = index
+
+
+class Broadcast:
+    """
+    The same content (and attachment) sent to many recipients.
+
+    Iterating a broadcast yields one `BroadcastMessage` per recipient,
+    created lazily from `recipients`, so any iterable (including a
+    generator) can be used and the content is never copied. Pass it to
+    `Orchestrator.send_many()` / `iter_send_many()`: results come back
+    per recipient, in recipient order.
+
+    Each recipient's `reference_id` is `"<broadcast reference_id>:<index>"`,
+    or `"<broadcast reference_id>:<recipient>"` with `key_by_recipient`:
+    the key then stays with the recipient when the list is reordered or
+    edited, but recipients must be unique.
+    A broadcast over a one-shot iterable can only be sent once.
+    """
+
+    def __init__(
+        self,
+        content: str,
+        recipients: Iterable[str],
+        *,
+        attachment: Optional[Attachment] = None,
+        metadata: MessageMetadata | dict | None = None,
+        key_by_recipient: bool = False,
+    ):
+        if not content and not attachment:
+            raise ValidationError("Broadcast must have content or an attachment")
+
+        if isinstance(recipients, str):
+            raise ValidationError("recipients must be an iterable of recipients")
+
+        if metadata is None:
+            metadata = MessageMetadata()
+        elif isinstance(metadata, dict):
+            metadata = _metadata_from_dict(metadata)
+        elif not isinstance(metadata, MessageMetadata):
+            raise TypeError("metadata must be MessageMetadata, dict, or None")
+
+        self.content = content
+        self.recipients = recipients
+        self.attachment = attachment
+        self.metadata = metadata
+        self.key_by_recipient = key_by_recipient
+
+    def __iter__(self) -> Iterator[BroadcastMessage]:
+        for index, recipient in enumerate(self.recipients):
+            yield BroadcastMessage(self, index, recipient)
+
+    def __repr__(self) -> str:
+        return (
+            f"Broadcast(content={self.content!r}, attachment={self.attachment!r}, "
+            f"metadata={self.metadata!r})"
+        )
@@ -0,0 +1,312 @@
+import csv
+import json
+import os
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, Optional, Union
+
+from broadcastio.core.attachment import Attachment
+from broadcastio.core.broadcast import Broadcast
+from broadcastio.core.exceptions import BroadcastioError, ValidationError
+from broadcastio.core.message import Message, MessageMetadata
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.result import DeliveryResult
+
+_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+_OUTPUT_FIELDS = [
+    "index",
+    "recipient",
+    "success",
+    "provider",
+    "message_id",
+    "error_code",
+    "error_message",
+]
+
+# Separators commonly found in exported phone numbers
+_PHONE_PUNCTUATION = str.maketrans("", "", " -().\t")
+
+
+def _format(path: str, format: Optional[str]) -> str:
+    if format is None:
+        format = _FORMATS.get(os.path.splitext(path)[1].lower())
+
+    if format not in ("csv", "jsonl"):
+        raise ValidationError(f"Cannot tell whether {path} is CSV or JSONL")
+    return format
+
+
+def read_rows(path: str, *, format: Optional[str] = None) -> Iterator[dict]:
+    """
+    Stream the rows of a CSV (with a header line) or JSONL file as
+    dicts, one at a time. Blank JSONL lines are skipped.
+    """
+    format = _format(path, format)
+
+    with open(path, newline="" if format == "csv" else None, encoding="utf-8") as fh:
+        if format == "csv":
+            yield from csv.DictReader(fh)
+            return
+
+        for line_no, line in enumerate(fh, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                raise ValidationError(f"{path}:{line_no}: invalid JSON: {exc}")
+            if not isinstance(row, dict):
+                raise ValidationError(f"{path}:{line_no}: expected a JSON object")
+            yield row
+
+
+def normalize_recipient(value) -> Optional[str]:
+    """
+    Default recipient normalization: phone numbers lose spaces, dashes,
+    dots, parentheses and a leading `+`; WhatsApp IDs (`...@c.us`) are
+    only stripped. Returns None for an unusable value.
+    """
+    if value is None:
+        return None
+
+    value = str(value).strip()
+    if "@" in value:
+        return value or None
+
+    value = value.translate(_PHONE_PUNCTUATION).lstrip("+")
+    return value if value.isdigit() else None
+
+
+@dataclass
+class CampaignSummary:
+    rows: int = 0
+    invalid: int = 0
+    duplicates: int = 0
+    sent: int = 0
+    failed: int = 0
+
+
+class Campaign:
+    """
+    Send one message per row of a CSV / JSONL recipient file.
+
+    The file is streamed through a generator pipeline (read → normalize
+    → dedupe → build messages) into `Orchestrator.iter_send_many()`, so
+    only a bounded window of rows is in flight however large the file
+    is. Results are appended to the output file as they arrive.
+
+    `content` is either a string, sent to every recipient as one
+    `Broadcast`, or a callable building the text from the row.
+
+    Each recipient's `reference_id` is `"<campaign_id>:<recipient>"`
+    (normalized), independent of its position in the file: re-running
+    an edited file with the same `campaign_id` and an idempotency store
+    skips exactly the recipients already delivered.
+
+    Deduplication keeps every distinct recipient in memory (about 100
+    bytes each); pass `dedupe=False` for files known to be unique.
+    """
+
+    def __init__(
+        self,
+        orchestrator: Orchestrator,
+        content: Union[str, Callable[[dict], str]],
+        *,
+        recipient_field: str = "recipient",
+        attachment: Optional[Attachment] = None,
+        campaign_id: Optional[str] = None,
+        normalize: Callable[[object], Optional[str]] = normalize_recipient,
+        dedupe: bool = True,
+        priority: int = 5,
+        tags: Optional[list] = None,
+        max_workers: int = 8,
+        batch_size: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        if not callable(content) and not content and not attachment:
+            raise ValidationError("Campaign must have content or an attachment")
+
+        self.orchestrator = orchestrator
+        self.content = content
+        self.recipient_field = recipient_field
+        self.attachment = attachment
+        self.campaign_id = campaign_id or str(uuid.uuid4())
+        self.normalize = normalize
+        self.dedupe = dedupe
+        self.priority = priority
+        self.tags = tags
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+
+    # ------------------------------------------------------------------
+    # Pipeline stages
+    # ------------------------------------------------------------------
+
+    def _recipients(
+        self, rows: Iterable[dict], summary: CampaignSummary
+    ) -> Iterator[tuple]:
+        """
+        Yield `(recipient, row)` for valid rows, first occurrence only.
+        """
+        seen = set()
+        for row in rows:
+            summary.rows += 1
+            recipient = self.normalize(row.get(self.recipient_field))
+            if recipient is None:
+                summary.invalid += 1
+                continue
+
+            if self.dedupe:
+                if recipient in seen:
+                    summary.duplicates += 1
+                    continue
+                seen.add(recipient)
+
+            yield recipient, row
+
+    def _personalized(
+        self, recipients: Iterator[tuple], summary: CampaignSummary
+    ) -> Iterator[tuple]:
+        """
+        Yield `(recipient, message)` built with the `content` callable.
+        Rows whose content cannot be built, or whose message does not
+        validate, are counted as `invalid` instead of aborting the run.
+        """
+        validate = self.orchestrator._validate_message
+        for recipient, row in recipients:
+            try:
+                content = self.content(row)
+            except Exception:
+                summary.invalid += 1
+                continue
+
+            message = Message(
+                recipient=recipient,
+                content=content,
+                metadata=MessageMetadata(
+                    priority=self.priority,
+                    reference_id=f"{self.campaign_id}:{recipient}",
+                    tags=self.tags,
+                ),
+                attachment=self.attachment,
+            )
+            try:
+                validate(message)
+            except BroadcastioError:
+                summary.invalid += 1
+                continue
+
+            yield recipient, message
+
+    def _messages(
+        self,
+        recipients: Iterator[tuple],
+        in_flight: Dict[int, str],
+        summary: CampaignSummary,
+    ) -> Iterable[Message]:
+        """
+        Messages for the recipients, remembering each one's recipient by
+        index until its result is written.
+        """
+
+        def track(items):
+            for index, (recipient, item) in enumerate(items):
+                in_flight[index] = recipient
+                yield item
+
+        if not callable(self.content):
+            return Broadcast(
+                self.content,
+                track((recipient, recipient) for recipient, _ in recipients),
+                attachment=self.attachment,
+                metadata=MessageMetadata(
+                    priority=self.priority,
+                    reference_id=self.campaign_id,
+                    tags=self.tags,
+                ),
+                key_by_recipient=True,
+            )
+
+        return track(self._personalized(recipients, summary))
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+
+    def iter_results(
+        self, rows: Iterable[dict], summary: Optional[CampaignSummary] = None
+    ) -> Iterator[tuple]:
+        """
+        Deliver `rows` and stream `(index, recipient, DeliveryResult)`
+        as deliveries complete. Counts go into `summary` when given.
+        """
+        summary = summary if summary is not None else CampaignSummary()
+        in_flight: Dict[int, str] = {}
+        messages = self._messages(self._recipients(rows, summary), in_flight, summary)
+
+        for index, result in self.orchestrator.iter_send_many(
+            messages,
+            max_workers=self.max_workers,
+            batch_size=self.batch_size,
+            max_in_flight=self.max_in_flight,
+        ):
+            if result.success:
+                summary.sent += 1
+            else:
+                summary.failed += 1
+            yield index, in_flight.pop(index), result
+
+    def run(
+        self,
+        source: str,
+        output: str,
+        *,
+        format: Optional[str] = None,
+        output_format: Optional[str] = None,
+    ) -> CampaignSummary:
+        """
+        Deliver every recipient of `source` and write one record per
+        delivery to `output` (CSV or JSONL, by extension unless given),
+        in completion order. Each record is flushed as it is written, so
+        a crash loses no written record. Invalid rows (no usable
+        recipient, `content(row)` failing or returning an invalid
+        message) and duplicate rows are only counted.
+        """
+        summary = CampaignSummary()
+        output_format = _format(output, output_format)
+        rows = read_rows(source, format=format)
+
+        with open(output, "w", newline="", encoding="utf-8") as fh:
+            write = _writer(fh, output_format)
+            for index, recipient, result in self.iter_results(rows, summary):
+                write(_record(index, recipient, result))
+                fh.flush()
+
+        return summary
+
+
+def _record(index: int, recipient: str, result: DeliveryResult) -> dict:
+    error = result.error
+    return {
+        "index": index,
+        "recipient": recipient,
+        "success": result.success,
+        "provider": result.provider,
+        "message_id": result.message_id,
+        "error_code": error.code if error else None,
+        "error_message": error.message if error else None,
+    }
+
+
+def _writer(fh, format: str) -> Callable[[dict], None]:
+    if format == "csv":
+        writer = csv.DictWriter(fh, fieldnames=_OUTPUT_FIELDS)
+        writer.writeheader()
+        return writer.writerow
+
+    def write(record: dict) -> None:
+        fh.write(json.dumps(record) + "\n")
+
+    return write
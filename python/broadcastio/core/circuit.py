@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Deque, Optional, Set
+
+from broadcastio.core.exceptions import ErrorCode, ValidationError
+
+
+class CircuitState:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    """
+    Defines when a provider's circuit opens and how it recovers.
+
+    The circuit opens after `failure_threshold` consecutive failures, or
+    when the failure rate over the last `window_size` calls reaches
+    `failure_rate_threshold` (once at least `min_calls` were seen).
+    After `cooldown` seconds it lets `half_open_max_calls` trial requests
+    through: if they all succeed it closes, any failure re-opens it.
+    """
+
+    failure_threshold: int = 5
+    failure_rate_threshold: Optional[float] = 0.5
+    window_size: int = 20
+    min_calls: int = 10
+    cooldown: float = 30.0
+    half_open_max_calls: int = 1
+    failure_codes: Optional[Set[str]] = None
+
+    def __post_init__(self) -> None:
+        self._validate()
+
+    def _validate(self) -> None:
+        if not isinstance(self.failure_threshold, int) or self.failure_threshold < 1:
+            raise ValidationError(
+                "CircuitBreakerPolicy.failure_threshold must be an integer >= 1"
+            )
+
+        if self.failure_rate_threshold is not None and not (
+            0 < self.failure_rate_threshold <= 1
+        ):
+            raise ValidationError(
+                "CircuitBreakerPolicy.failure_rate_threshold must be in (0, 1]"
+            )
+
+        if not isinstance(self.window_size, int) or self.window_size < 1:
+            raise ValidationError(
+                "CircuitBreakerPolicy.window_size must be an integer >= 1"
+            )
+
+        if not isinstance(self.min_calls, int) or not (
+            1 <= self.min_calls <= self.window_size
+        ):
+            raise ValidationError(
+                "CircuitBreakerPolicy.min_calls must be between 1 and window_size"
+            )
+
+        if self.cooldown < 0:
+            raise ValidationError("CircuitBreakerPolicy.cooldown must be >= 0")
+
+        if (
+            not isinstance(self.half_open_max_calls, int)
+            or self.half_open_max_calls < 1
+        ):
+            raise ValidationError(
+                "CircuitBreakerPolicy.half_open_max_calls must be an integer >= 1"
+            )
+
+    def is_failure(self, error_code: Optional[str]) -> bool:
+        """
+        Returns True if a failed attempt with this code counts against
+        the circuit. By default only unavailability does: logical
+        rejections mean the provider is up.
+        """
+        if self.failure_codes is None:
+            return error_code == ErrorCode.PROVIDER_UNAVAILABLE
+
+        return error_code in self.failure_codes
+
+
+@dataclass
+class CircuitStateChange:
+    provider: str
+    previous: str
+    current: str
+    reason: str
+    changed_at: datetime
+
+    def to_dict(self) -> dict:
+        return {
+            "provider": self.provider,
+            "previous": self.previous,
+            "current": self.current,
+            "reason": self.reason,
+            "changed_at": self.changed_at.isoformat(),
+        }
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker for a single provider.
+
+    Thread-safe. State changes are reported through `on_change`, called
+    outside the internal lock.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        policy: CircuitBreakerPolicy,
+        *,
+        on_change: Optional[Callable[[CircuitStateChange], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.provider = provider
+        self.policy = policy
+        self.on_change = on_change
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._consecutive_failures = 0
+        self._outcomes: Deque[bool] = deque(maxlen=policy.window_size)
+        self._window_failures = 0
+        self._half_open_permits = 0
+        self._half_open_successes = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            change = self._maybe_half_open()
+            state = self._state
+        self._notify(change)
+        return state
+
+    def allow(self) -> bool:
+        """
+        Returns True if a request may be sent now. In half-open state this
+        consumes one of the limited trial permits.
+        """
+        with self._lock:
+            change = self._maybe_half_open()
+
+            if self._state == CircuitState.CLOSED:
+                allowed = True
+            elif self._state == CircuitState.OPEN:
+                allowed = False
+            elif self._half_open_permits < self.policy.half_open_max_calls:
+                self._half_open_permits += 1
+                allowed = True
+            else:
+                allowed = False
+
+        self._notify(change)
+        return allowed
+
+    def record(self, success: bool) -> None:
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                change = self._record_trial(success)
+            elif self._state == CircuitState.CLOSED:
+                change = self._record_closed(success)
+            else:
+                change = None
+
+        self._notify(change)
+
+    def record_success(self) -> None:
+        self.record(True)
+
+    def record_failure(self) -> None:
+        self.record(False)
+
+    # ------------------------------------------------------------------
+    # Internal (called with the lock held)
+    # ------------------------------------------------------------------
+
+    def _record_closed(self, success: bool) -> Optional[CircuitStateChange]:
+        if len(self._outcomes) == self._outcomes.maxlen and not self._outcomes[0]:
+            self._window_failures -= 1
+        self._outcomes.append(success)
+
+        if success:
+            self._consecutive_failures = 0
+            return None
+
+        self._window_failures += 1
+        self._consecutive_failures += 1
+
+        if self._consecutive_failures >= self.policy.failure_threshold:
+            return self._open(f"{self._consecutive_failures} consecutive failures")
+
+        rate_threshold = self.policy.failure_rate_threshold
+        calls = len(self._outcomes)
+        if (
+            rate_threshold is not None
+            and calls >= self.policy.min_calls
+            and self._window_failures / calls >= rate_threshold
+        ):
+            return self._open(
+                f"failure rate {self._window_failures}/{calls} "
+                f">= {rate_threshold:.0%}"
+            )
+
+        return None
+
+    def _record_trial(self, success: bool) -> Optional[CircuitStateChange]:
+        if not success:
+            return self._open("half-open trial failed")
+
+        self._half_open_successes += 1
+        if self._half_open_successes >= self.policy.half_open_max_calls:
+            return self._transition(CircuitState.CLOSED, "half-open trials succeeded")
+
+        return None
+
+    def _maybe_half_open(self) -> Optional[CircuitStateChange]:
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.policy.cooldown
+        ):
+            return self._transition(CircuitState.HALF_OPEN, "cooldown elapsed")
+        return None
+
+    def _open(self, reason: str) -> CircuitStateChange:
+        self._opened_at = self._clock()
+        return self._transition(CircuitState.OPEN, reason)
+
+    def _transition(self, state: str, reason: str) -> CircuitStateChange:
+        change = CircuitStateChange(
+            provider=self.provider,
+            previous=self._state,
+            current=state,
+            reason=reason,
+            changed_at=datetime.now(timezone.utc),
+        )
+
+        self._state = state
+        self._consecutive_failures = 0
+        self._outcomes.clear()
+        self._window_failures = 0
+        self._half_open_permits = 0
+        self._half_open_successes = 0
+        return change
+
+    def _notify(self, change: Optional[CircuitStateChange]) -> None:
+        if change is None or self.on_change is None:
+            return
+        try:
+            self.on_change(change)
+        except Exception:
+            # Hooks must NEVER affect orchestration
+            pass
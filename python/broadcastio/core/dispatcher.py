@@ -0,0 +1,237 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import Counter
+from concurrent.futures import CancelledError, Future
+from typing import Dict, List
+
+from broadcastio.core.exceptions import OrchestrationError, ValidationError
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.result import DeliveryResult
+
+
+class PriorityDispatcher:
+    """
+    Priority queue in front of an `Orchestrator`.
+
+    Messages are delivered by a pool of worker threads in order of
+    `MessageMetadata.priority` (higher first). Waiting messages age:
+    every `aging` seconds in the queue is worth one priority level, so
+    low priorities are delayed under load but never starved.
+
+    Each message keeps the usual validation, retry, fallback and hook
+    behavior of `Orchestrator.send()`. Retry backoff does not hold a
+    worker: the message is parked on the orchestrator's retry scheduler
+    and re-queued (with its original position) when due.
+    """
+
+    def __init__(
+        self,
+        orchestrator: Orchestrator,
+        *,
+        workers: int = 4,
+        aging: float = 30.0,
+    ):
+        if not isinstance(workers, int) or workers < 1:
+            raise ValidationError("PriorityDispatcher.workers must be an integer >= 1")
+
+        if aging <= 0:
+            raise ValidationError("PriorityDispatcher.aging must be > 0")
+
+        self.orchestrator = orchestrator
+        self.workers = workers
+        self.aging = aging
+
+        if orchestrator.hedge_policy is not None:
+            # Size the hedge pool for these workers
+            orchestrator._get_hedge_executor(workers)
+
+        # (sort_key, sequence, priority, message, trace, future, run)
+        self._heap: List[tuple] = []
+        self._sequence = itertools.count()
+        self._depths: Counter = Counter()
+        self._in_flight = 0
+        self._retrying = 0
+        self._cancelled = False
+        self._condition = threading.Condition()
+        self._closed = False
+
+        self._threads = [
+            threading.Thread(
+                target=self._work,
+                name=f"broadcastio-dispatcher-{i}",
+                daemon=True,
+            )
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(
+        self, message: Message, *, trace: bool = False
+    ) -> "Future[DeliveryResult]":
+        """
+        Queue a message for delivery and return a future for its result.
+
+        Exceptions raised by `send()` (validation, misconfiguration) are
+        set on the future.
+        """
+        priority = message.metadata.priority
+        future: Future = Future()
+
+        # Higher priority and longer waits both move a message forward
+        sort_key = time.monotonic() - priority * self.aging
+
+        with self._condition:
+            if self._closed:
+                raise OrchestrationError("PriorityDispatcher is closed")
+
+            heapq.heappush(
+                self._heap,
+                (
+                    sort_key,
+                    next(self._sequence),
+                    priority,
+                    message,
+                    trace,
+                    future,
+                    None,
+                ),
+            )
+            self._depths[priority] += 1
+            self._condition.notify()
+
+        return future
+
+    enqueue = submit
+
+    def queue_depths(self) -> Dict[int, int]:
+        """
+        Number of queued messages per priority, including retries that
+        are due.
+        """
+        with self._condition:
+            return {p: n for p, n in sorted(self._depths.items()) if n}
+
+    @property
+    def depth(self) -> int:
+        with self._condition:
+            return len(self._heap)
+
+    @property
+    def in_flight(self) -> int:
+        with self._condition:
+            return self._in_flight
+
+    @property
+    def retrying(self) -> int:
+        """
+        Messages waiting for their next retry attempt.
+        """
+        with self._condition:
+            return self._retrying
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while not self._heap and not (self._closed and not self._retrying):
+                    self._condition.wait()
+
+                if not self._heap:
+                    return
+
+                entry = heapq.heappop(self._heap)
+                self._depths[entry[2]] -= 1
+                self._in_flight += 1
+
+            try:
+                self._deliver(entry)
+            finally:
+                with self._condition:
+                    self._in_flight -= 1
+
+    def _deliver(self, entry: tuple) -> None:
+        sort_key, sequence, priority, message, trace, future, run = entry
+        orchestrator = self.orchestrator
+
+        if run is None and not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            if run is None:
+                if orchestrator.idempotency is not None:
+                    # Duplicates wait on a shared delivery: keep send()
+                    future.set_result(orchestrator.send(message, trace=trace))
+                    return
+
+                orchestrator._validate_message(message)
+                run = orchestrator._start_run(
+                    message, orchestrator._iter_providers(), trace
+                )
+
+            delay = orchestrator._advance(run)
+        except BaseException as exc:
+            future.set_exception(exc)
+            return
+
+        if run.result is not None:
+            future.set_result(run.result)
+            return
+
+        with self._condition:
+            self._retrying += 1
+
+        orchestrator.retry_scheduler().call_later(
+            delay,
+            self._requeue,
+            (sort_key, sequence, priority, message, trace, future, run),
+        )
+
+    def _requeue(self, entry: tuple) -> None:
+        with self._condition:
+            self._retrying -= 1
+
+            if self._cancelled:
+                # Already running, so it can't be cancelled the usual way
+                entry[5].set_exception(CancelledError())
+            else:
+                heapq.heappush(self._heap, entry)
+                self._depths[entry[2]] += 1
+
+            if self._closed:
+                # Idle workers may be waiting for the last retry to exit
+                self._condition.notify_all()
+            else:
+                self._condition.notify()
+
+    def close(self, *, wait: bool = True, cancel_pending: bool = False) -> None:
+        """
+        Stop accepting messages. Queued and retrying messages are still
+        delivered unless `cancel_pending=True`.
+        """
+        with self._condition:
+            self._closed = True
+
+            if cancel_pending:
+                self._cancelled = True
+                for *_, future, run in self._heap:
+                    if run is None:
+                        future.cancel()
+                    else:
+                        future.set_exception(CancelledError())
+                self._heap.clear()
+                self._depths.clear()
+
+            self._condition.notify_all()
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def __enter__(self) -> "PriorityDispatcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -5,3 +5,7 @@ class ErrorCode:
     PROVIDER_MISCONFIGURED = "PROVIDER_MISCONFIGURED"
     PROVIDER_UNAVAILABLE = "PROVIDER_UNAVAILABLE"
     INVALID_MESSAGE = "INVALID_MESSAGE"
+    CIRCUIT_OPEN = "CIRCUIT_OPEN"
+    RATE_LIMITED = "RATE_LIMITED"
+    HEDGE_CANCELLED = "HEDGE_CANCELLED"
+    BATCH_OUTCOME_UNKNOWN = "BATCH_OUTCOME_UNKNOWN"
@@ -14,3 +14,11 @@ class DeliveryError:
             "message": self.message,
             "details": self.details,
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DeliveryError":
+        return cls(
+            code=data["code"],
+            message=data["message"],
+            details=data.get("details"),
+        )
@@ -1,12 +1,173 @@
-from dataclasses import dataclass
-from typing import Optional
+import asyncio
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 from datetime import datetime, timezone
 
+from broadcastio.core.exceptions import ValidationError
+
 
 @dataclass
 class ProviderHealth:
     provider: str
     ready: bool
 
-    checked_at: datetime = datetime.now(timezone.utc)
+    checked_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     details: Optional[str] = None
+
+    # Circuit breaker state, when the orchestrator uses one
+    circuit: Optional[str] = None
+
+
+class HealthMonitor:
+    """
+    Refreshes provider health in the background.
+
+    All providers are probed in parallel every `interval` seconds on a
+    daemon thread. Readers always get the latest snapshot immediately,
+    even when it is stale (stale-while-revalidate): a snapshot older than
+    `stale_after` seconds only wakes the monitor for an early refresh.
+
+    Providers never probed yet are reported as ready, so the first
+    messages are not blocked before the initial refresh completes.
+    """
+
+    def __init__(
+        self,
+        interval: float = 10.0,
+        *,
+        stale_after: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ):
+        if interval <= 0:
+            raise ValidationError("HealthMonitor.interval must be > 0")
+
+        self.interval = interval
+        self.stale_after = stale_after if stale_after is not None else interval * 2
+        self.max_workers = max_workers
+
+        self._providers: List = []
+        self._snapshot: Dict[str, ProviderHealth] = {}
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def watch(self, providers: List) -> None:
+        """
+        Add providers to the monitored set (by name, duplicates ignored).
+        """
+        with self._lock:
+            known = {p.name for p in self._providers}
+            self._providers.extend(p for p in providers if p.name not in known)
+
+    def start(self, *, wait: bool = True) -> "HealthMonitor":
+        """
+        Start the refresh thread. With `wait=True`, the first refresh
+        completes before returning.
+        """
+        with self._lock:
+            if self.running:
+                return self
+
+            self._stopped.clear()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers or max(len(self._providers), 1),
+                thread_name_prefix="broadcastio-health",
+            )
+
+        if wait:
+            self.refresh()
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name="broadcastio-health-monitor",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "HealthMonitor":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+            if self._stopped.is_set():
+                break
+
+            self.refresh()
+
+    def _probe(self, provider) -> ProviderHealth:
+        try:
+            health = provider.health()
+            if inspect.isawaitable(health):
+                # Async providers are probed on a private event loop
+                health = asyncio.run(health)
+            return health
+        except Exception as exc:
+            return ProviderHealth(provider=provider.name, ready=False, details=str(exc))
+
+    def refresh(self) -> Dict[str, ProviderHealth]:
+        """
+        Probe all watched providers in parallel and update the snapshot.
+        """
+        providers = list(self._providers)
+        executor = self._executor
+
+        if executor is None:
+            healths = [self._probe(provider) for provider in providers]
+        else:
+            healths = list(executor.map(self._probe, providers))
+
+        for provider, health in zip(providers, healths):
+            self._snapshot[provider.name] = health
+
+        return dict(self._snapshot)
+
+    def get(self, provider) -> ProviderHealth:
+        """
+        Return the latest known health without blocking on a probe.
+        """
+        health = self._snapshot.get(provider.name)
+
+        if health is None:
+            return ProviderHealth(
+                provider=provider.name,
+                ready=True,
+                details="health not checked yet",
+            )
+
+        age = (datetime.now(timezone.utc) - health.checked_at).total_seconds()
+        if age > self.stale_after:
+            # Serve stale, revalidate in the background
+            self._wake.set()
+
+        return health
+
+    def snapshot(self) -> Dict[str, ProviderHealth]:
+        return dict(self._snapshot)
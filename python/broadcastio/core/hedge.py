@@ -0,0 +1,111 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional
+
+from broadcastio.core.exceptions import ValidationError
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """
+    When to race the next provider against a slow primary.
+
+    The hedge fires after `delay` seconds, or, with `percentile`, after
+    that percentile of the primary's recent successful latencies (the
+    last `window` samples, once `min_samples` were seen; `delay` is used
+    until then). At most `max_rate` of sends may hedge, with bursts of up
+    to `burst` hedges.
+    """
+
+    delay: Optional[float] = None
+    percentile: Optional[float] = None
+    min_samples: int = 20
+    window: int = 200
+    max_rate: float = 0.1
+    burst: int = 10
+    max_workers: int = 32
+
+    def __post_init__(self) -> None:
+        self._validate()
+
+    def _validate(self) -> None:
+        if self.delay is None and self.percentile is None:
+            raise ValidationError("HedgePolicy requires delay or percentile")
+
+        if self.delay is not None and self.delay < 0:
+            raise ValidationError("HedgePolicy.delay must be >= 0")
+
+        if self.percentile is not None and not (0 < self.percentile < 100):
+            raise ValidationError("HedgePolicy.percentile must be in (0, 100)")
+
+        if not isinstance(self.window, int) or self.window < 1:
+            raise ValidationError("HedgePolicy.window must be an integer >= 1")
+
+        if not isinstance(self.min_samples, int) or not (
+            1 <= self.min_samples <= self.window
+        ):
+            raise ValidationError(
+                "HedgePolicy.min_samples must be between 1 and window"
+            )
+
+        if not (0 <= self.max_rate <= 1):
+            raise ValidationError("HedgePolicy.max_rate must be in [0, 1]")
+
+        if not isinstance(self.burst, int) or self.burst < 1:
+            raise ValidationError("HedgePolicy.burst must be an integer >= 1")
+
+        if not isinstance(self.max_workers, int) or self.max_workers < 2:
+            raise ValidationError("HedgePolicy.max_workers must be an integer >= 2")
+
+
+class HedgeTracker:
+    """
+    Thread-safe state behind a `HedgePolicy`: recent latencies per
+    provider and the hedge-rate tokens.
+    """
+
+    def __init__(self, policy: HedgePolicy):
+        self.policy = policy
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._tokens = float(policy.burst)
+        self._lock = threading.Lock()
+
+    def observe(self, provider: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._latencies.get(provider)
+            if samples is None:
+                samples = self._latencies[provider] = deque(maxlen=self.policy.window)
+            samples.append(seconds)
+
+    def delay(self, provider: str) -> Optional[float]:
+        """
+        Seconds to wait for `provider` before hedging, or None to not
+        hedge (no fixed delay and not enough samples yet).
+        """
+        policy = self.policy
+        if policy.percentile is None:
+            return policy.delay
+
+        with self._lock:
+            samples = self._latencies.get(provider)
+            if samples is None or len(samples) < policy.min_samples:
+                return policy.delay
+            ordered = sorted(samples)
+
+        index = min(int(len(ordered) * policy.percentile / 100), len(ordered) - 1)
+        return ordered[index]
+
+    def deposit(self) -> None:
+        """
+        Record a send that could hedge.
+        """
+        with self._lock:
+            self._tokens = min(self._tokens + self.policy.max_rate, self.policy.burst)
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
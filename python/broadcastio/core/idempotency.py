@@ -0,0 +1,177 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from broadcastio.core.exceptions import ValidationError
+from broadcastio.core.result import DeliveryResult
+
+
+class IdempotencyStore(ABC):
+    """
+    Remembers the result of delivered messages, keyed by
+    `MessageMetadata.reference_id`.
+
+    Implementations must be thread-safe.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[DeliveryResult]:
+        """
+        Return the stored result for `key`, or None if unknown or expired.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: str, result: DeliveryResult) -> None:
+        raise NotImplementedError
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """
+    In-process LRU cache with a TTL.
+
+    At most `max_entries` results are kept; the least recently used is
+    dropped first. Entries older than `ttl` seconds are ignored.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 100_000,
+        ttl: Optional[float] = 24 * 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise ValidationError("max_entries must be an integer >= 1")
+
+        if ttl is not None and ttl <= 0:
+            raise ValidationError("ttl must be None or > 0")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        # key -> (stored_at, DeliveryResult)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[DeliveryResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, result = entry
+            if self.ttl is not None and self._clock() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: str, result: DeliveryResult) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteIdempotencyStore(IdempotencyStore):
+    """
+    Idempotency keys in a SQLite file, shared by every process that
+    opens it.
+
+    Results are stored as JSON. Expired rows are ignored on read and
+    removed by `purge()`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        ttl: Optional[float] = 24 * 3600,
+        timeout: float = 30.0,
+    ):
+        if ttl is not None and ttl <= 0:
+            raise ValidationError("ttl must be None or > 0")
+
+        self.path = path
+        self.ttl = ttl
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS idempotency ("
+            "key TEXT PRIMARY KEY, result TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def get(self, key: str) -> Optional[DeliveryResult]:
+        row = (
+            self._connection()
+            .execute("SELECT result, stored_at FROM idempotency WHERE key = ?", (key,))
+            .fetchone()
+        )
+        if row is None:
+            return None
+
+        payload, stored_at = row
+        if self.ttl is not None and time.time() - stored_at >= self.ttl:
+            return None
+
+        return DeliveryResult.from_dict(json.loads(payload))
+
+    def put(self, key: str, result: DeliveryResult) -> None:
+        self._connection().execute(
+            "INSERT OR REPLACE INTO idempotency (key, result, stored_at) "
+            "VALUES (?, ?, ?)",
+            (key, json.dumps(result.to_dict()), time.time()),
+        )
+
+    def purge(self) -> int:
+        """
+        Delete expired keys. Returns the number of rows removed.
+        """
+        if self.ttl is None:
+            return 0
+
+        return (
+            self._connection()
+            .execute(
+                "DELETE FROM idempotency WHERE stored_at < ?",
+                (time.time() - self.ttl,),
+            )
+            .rowcount
+        )
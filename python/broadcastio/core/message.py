@@ -1,3 +1,4 @@
+import threading
 import uuid
 import warnings
 from dataclasses import dataclass, field
@@ -7,22 +8,131 @@ from broadcastio.core.attachment import Attachment
 from broadcastio.core.exceptions import ValidationError
 
 
-@dataclass
+class _ReadOnlyList(list):
+    """
+    Shared empty default for `MessageMetadata.tags`.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("default tags are shared and read-only; assign a new list")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+
+class _ReadOnlyDict(dict):
+    """
+    Shared empty default for `MessageMetadata.extra`.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("default extra is shared and read-only; assign a new dict")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+
+_NO_TAGS: List[str] = _ReadOnlyList()
+_NO_EXTRA: Dict[str, Any] = _ReadOnlyDict()
+
+_METADATA_KEYS = frozenset({"priority", "reference_id", "tags"})
+
+# Guards the first read of a lazy reference_id
+_reference_lock = threading.Lock()
+
+
+@dataclass(slots=True, init=False)
 class MessageMetadata:
-    # Higher = more important (1–10)
+    """
+    Delivery metadata of a message.
+
+    - priority: higher = more important (1–10)
+    - reference_id: for tracing logs across systems; a UUID4 is
+      generated on first access when none is given
+    - tags: free-form labels, e.g. ["alert", "prod"]
+    - extra: anything else you might need later
+
+    Empty `tags` / `extra` default to shared read-only instances: assign
+    a new list / dict instead of mutating them.
+    """
+
+    # Own __init__: an unset reference_id slot is generated on first read
     priority: int = 5
+    reference_id: Optional[str] = None
+    tags: Optional[List[str]] = None
+    extra: Optional[Dict[str, Any]] = None
+
+    def __init__(
+        self,
+        priority: int = 5,
+        reference_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.priority = priority
+        if reference_id is not None:
+            self.reference_id = reference_id
+        self.tags = tags if tags is not None else _NO_TAGS
+        self.extra = extra if extra is not None else _NO_EXTRA
+
+    def __getstate__(self) -> tuple:
+        # Reading reference_id generates it first: copies and unpickled
+        # messages keep the original's ID
+        return (self.priority, self.reference_id, self.tags, self.extra)
+
+    def __setstate__(self, state: tuple) -> None:
+        self.priority, self.reference_id, self.tags, self.extra = state
+
+    def __getattr__(self, name: str):
+        # Only called for unset attributes, i.e. a reference_id not read
+        # yet (asdict() and == read it through here too)
+        if name != "reference_id":
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+        # Concurrent first reads must agree on one ID
+        with _reference_lock:
+            try:
+                return _REFERENCE_ID.__get__(self)
+            except AttributeError:
+                reference_id = self.reference_id = str(uuid.uuid4())
+                return reference_id
 
-    # For tracing logs across systems
-    reference_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    def to_dict(self) -> dict:
+        return {
+            "priority": self.priority,
+            "reference_id": self.reference_id,
+            "tags": list(self.tags),
+            "extra": dict(self.extra),
+        }
 
-    # Free-form labels: ["alert", "prod"]
-    tags: List[str] = field(default_factory=list)
 
-    # Anything else you might need later
-    extra: Dict[str, Any] = field(default_factory=dict)
+# The slot behind MessageMetadata.reference_id, read without __getattr__
+_REFERENCE_ID = MessageMetadata.__dict__["reference_id"]
 
 
-@dataclass
+def _metadata_from_dict(metadata: dict) -> MessageMetadata:
+    # Keys other than priority / reference_id / tags go to extra
+    extra = None
+    if not _METADATA_KEYS.issuperset(metadata):
+        extra = dict(metadata)
+        for key in _METADATA_KEYS:
+            extra.pop(key, None)
+
+    return MessageMetadata(
+        priority=metadata.get("priority", 5),
+        reference_id=metadata.get("reference_id"),
+        tags=metadata.get("tags"),
+        extra=extra,
+    )
+
+
+@dataclass(slots=True)
 class Message:
     recipient: str
     content: str
@@ -38,16 +148,7 @@ class Message:
             pass  # already correct
 
         elif isinstance(self.metadata, dict):
-            self.metadata = MessageMetadata(
-                priority=self.metadata.get("priority", 5),
-                reference_id=self.metadata.get("reference_id", str(uuid.uuid4())),
-                tags=self.metadata.get("tags", []),
-                extra={
-                    k: v
-                    for k, v in self.metadata.items()
-                    if k not in {"priority", "reference_id", "tags"}
-                },
-            )
+            self.metadata = _metadata_from_dict(self.metadata)
         elif not isinstance(self.recipient, str) or not self.recipient.strip():
             raise ValidationError("recipient must be a non-empty string")
         elif self.recipient.isdigit() and len(self.recipient) > 10:
@@ -58,3 +159,28 @@ class Message:
             )
         else:
             raise TypeError("metadata must be MessageMetadata, dict, or None")
+
+    def to_dict(self) -> dict:
+        return {
+            "recipient": self.recipient,
+            "content": self.content,
+            "metadata": self.metadata.to_dict(),
+            "attachment": self.attachment.to_dict() if self.attachment else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Message":
+        metadata = data.get("metadata") or {}
+        attachment = data.get("attachment")
+
+        return cls(
+            recipient=data["recipient"],
+            content=data["content"],
+            metadata=MessageMetadata(
+                priority=metadata.get("priority", 5),
+                reference_id=metadata.get("reference_id") or None,
+                tags=list(metadata["tags"]) if metadata.get("tags") else None,
+                extra=dict(metadata["extra"]) if metadata.get("extra") else None,
+            ),
+            attachment=Attachment.from_dict(attachment) if attachment else None,
+        )
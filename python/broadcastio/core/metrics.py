@@ -0,0 +1,309 @@
+import threading
+from bisect import bisect_left
+from math import ceil
+from typing import Dict, List, Optional, Tuple
+
+# Log-linear latency buckets (ms): 4 linear steps per power of two,
+# up to ~57s. Values above the last bound go to +Inf.
+_SUB_BUCKETS = 4
+BUCKET_BOUNDS: Tuple[float, ...] = tuple(
+    [0.5]
+    + [
+        (2**exponent) * (1 + step / _SUB_BUCKETS)
+        for exponent in range(16)
+        for step in range(_SUB_BUCKETS)
+    ]
+)
+
+# Every bound is a multiple of 0.25ms, so the bucket of a latency only
+# depends on ceil(latency * 4): precompute it for latencies up to ~4s.
+_QUARTERS = 4 * 4096
+_BUCKET_OF_QUARTER = [bisect_left(BUCKET_BOUNDS, q / 4) for q in range(_QUARTERS)]
+
+_OK = "ok"
+
+# Shards of threads that exited are folded once there are this many
+_MAX_SHARDS = 64
+
+
+def _bucket_index(duration_ms: float) -> int:
+    if duration_ms <= 0:
+        return 0
+    return bisect_left(BUCKET_BOUNDS, duration_ms)
+
+
+class _ProviderCounters:
+    __slots__ = ("codes", "buckets", "latency_sum", "retries", "fallbacks")
+
+    def __init__(self):
+        # error code -> attempts; "ok" for successes
+        self.codes: Dict[str, int] = {}
+        # len(BUCKET_BOUNDS) + 1, the last one is +Inf
+        self.buckets: List[int] = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.latency_sum = 0.0
+        self.retries = 0
+        self.fallbacks = 0
+
+    def merge_into(self, target: "_ProviderCounters") -> None:
+        for code, count in list(self.codes.items()):
+            target.codes[code] = target.codes.get(code, 0) + count
+        merged = target.buckets
+        for i, count in enumerate(self.buckets):
+            merged[i] += count
+        target.latency_sum += self.latency_sum
+        target.retries += self.retries
+        target.fallbacks += self.fallbacks
+
+
+class _Shard:
+    """
+    Counters written by a single thread, without locking.
+    """
+
+    __slots__ = ("providers", "messages", "in_flight")
+
+    def __init__(self):
+        self.providers: Dict[str, _ProviderCounters] = {}
+        # outcome ("success" / "failure") -> count
+        self.messages: Dict[str, int] = {}
+        self.in_flight = 0
+
+    def counters(self, provider: str) -> _ProviderCounters:
+        counters = self.providers.get(provider)
+        if counters is None:
+            counters = self.providers[provider] = _ProviderCounters()
+        return counters
+
+    def merge_into(self, target: "_Shard") -> None:
+        for provider, counters in list(self.providers.items()):
+            counters.merge_into(target.counters(provider))
+        for outcome, count in list(self.messages.items()):
+            target.messages[outcome] = target.messages.get(outcome, 0) + count
+        target.in_flight += self.in_flight
+
+
+class Metrics:
+    """
+    In-process delivery metrics.
+
+    - attempts per provider and error code
+    - log-linear latency histogram per provider
+    - retries and fallbacks per provider
+    - delivered / failed messages and messages in flight
+
+    The hot path is sharded per thread: each thread updates its own
+    counters without a lock, and `snapshot()` merges them. Readings are
+    eventually consistent while sends are running.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        # (thread, shard)
+        self._shards: List[Tuple[threading.Thread, _Shard]] = []
+        # Counters of threads that exited
+        self._retired = _Shard()
+        self._lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            pass
+
+        shard = self._local.shard = _Shard()
+        with self._lock:
+            if len(self._shards) >= _MAX_SHARDS:
+                self._fold_exited()
+            self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def _fold_exited(self) -> None:
+        # Called with the lock held. Exited threads no longer write.
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                shard.merge_into(self._retired)
+        self._shards = alive
+
+    # ------------------------------------------------------------------
+    # Hot path (called by the Orchestrator)
+    # ------------------------------------------------------------------
+
+    def record_attempt(
+        self,
+        provider: str,
+        error_code: Optional[str],
+        duration_ms: float,
+        retry: bool = False,
+    ) -> None:
+        try:
+            counters = self._local.shard.providers[provider]
+        except (AttributeError, KeyError):
+            counters = self._shard().counters(provider)
+
+        codes = counters.codes
+        code = error_code or _OK
+        codes[code] = codes.get(code, 0) + 1
+
+        quarters = ceil(duration_ms * 4)
+        if 0 <= quarters < _QUARTERS:
+            counters.buckets[_BUCKET_OF_QUARTER[quarters]] += 1
+        else:
+            counters.buckets[_bucket_index(duration_ms)] += 1
+        counters.latency_sum += duration_ms
+
+        if retry:
+            counters.retries += 1
+
+    def record_fallback(self, provider: str) -> None:
+        """
+        `provider` was given up on and the next one will be tried.
+        """
+        self._shard().counters(provider).fallbacks += 1
+
+    def message_started(self) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._shard()
+        shard.in_flight += 1
+
+    def message_finished(self, success: bool) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._shard()
+        shard.in_flight -= 1
+        outcome = "success" if success else "failure"
+        shard.messages[outcome] = shard.messages.get(outcome, 0) + 1
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _merged(self) -> _Shard:
+        total = _Shard()
+        with self._lock:
+            self._fold_exited()
+            self._retired.merge_into(total)
+            for _, shard in self._shards:
+                shard.merge_into(total)
+        return total
+
+    def snapshot(self) -> dict:
+        """
+        Merged metrics as plain data (JSON-serializable).
+        """
+        total = self._merged()
+        providers = sorted(total.providers.items())
+
+        return {
+            "attempts": {
+                name: dict(sorted(counters.codes.items()))
+                for name, counters in providers
+                if counters.codes
+            },
+            "latency_ms": {
+                name: {
+                    "count": sum(counters.buckets),
+                    "sum_ms": counters.latency_sum,
+                    "buckets": {
+                        _bound_label(i): count
+                        for i, count in enumerate(counters.buckets)
+                        if count
+                    },
+                }
+                for name, counters in providers
+                if counters.codes
+            },
+            "retries": {
+                name: counters.retries
+                for name, counters in providers
+                if counters.retries
+            },
+            "fallbacks": {
+                name: counters.fallbacks
+                for name, counters in providers
+                if counters.fallbacks
+            },
+            "messages": dict(sorted(total.messages.items())),
+            "in_flight": total.in_flight,
+        }
+
+    def to_prometheus(self, prefix: str = "broadcastio") -> str:
+        """
+        Metrics in the Prometheus text exposition format.
+        """
+        total = self._merged()
+        providers = [
+            (_escape(name), counters)
+            for name, counters in sorted(total.providers.items())
+        ]
+        lines: List[str] = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        header("attempts_total", "counter", "Provider attempts by error code.")
+        for name, counters in providers:
+            for code, count in sorted(counters.codes.items()):
+                lines.append(
+                    f'{prefix}_attempts_total{{provider="{name}",'
+                    f'code="{_escape(code)}"}} {count}'
+                )
+
+        header("attempt_duration_ms", "histogram", "Provider attempt latency in ms.")
+        for name, counters in providers:
+            if not counters.codes:
+                continue
+            cumulative = 0
+            for i, count in enumerate(counters.buckets):
+                cumulative += count
+                lines.append(
+                    f"{prefix}_attempt_duration_ms_bucket"
+                    f'{{provider="{name}",le="{_bound_label(i)}"}} {cumulative}'
+                )
+            lines.append(
+                f'{prefix}_attempt_duration_ms_sum{{provider="{name}"}} '
+                f"{counters.latency_sum}"
+            )
+            lines.append(
+                f'{prefix}_attempt_duration_ms_count{{provider="{name}"}} {cumulative}'
+            )
+
+        header("retries_total", "counter", "Retry attempts by provider.")
+        for name, counters in providers:
+            if counters.retries:
+                lines.append(
+                    f'{prefix}_retries_total{{provider="{name}"}} {counters.retries}'
+                )
+
+        header("fallbacks_total", "counter", "Fallbacks away from a provider.")
+        for name, counters in providers:
+            if counters.fallbacks:
+                lines.append(
+                    f'{prefix}_fallbacks_total{{provider="{name}"}} '
+                    f"{counters.fallbacks}"
+                )
+
+        header("messages_total", "counter", "Finished messages by outcome.")
+        for outcome, count in sorted(total.messages.items()):
+            lines.append(f'{prefix}_messages_total{{outcome="{outcome}"}} {count}')
+
+        header("in_flight", "gauge", "Messages being delivered.")
+        lines.append(f"{prefix}_in_flight {total.in_flight}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _bound_label(index: int) -> str:
+    if index >= len(BUCKET_BOUNDS):
+        return "+Inf"
+    return f"{BUCKET_BOUNDS[index]:g}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
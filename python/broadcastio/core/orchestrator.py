@@ -1,9 +1,24 @@
 import os
+import random
+import threading
 import time
 import requests
+import urllib3
+from itertools import islice
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from broadcastio.core.attachment import AttachmentCache
+from broadcastio.core.broadcast import Broadcast
+from broadcastio.core.circuit import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitState,
+    CircuitStateChange,
+)
 from broadcastio.core.exceptions import (
     AttachmentError,
     BroadcastioError,
@@ -11,13 +26,22 @@ from broadcastio.core.exceptions import (
     OrchestrationError,
     ValidationError,
 )
-from broadcastio.core.health import ProviderHealth
+from broadcastio.core.health import HealthMonitor, ProviderHealth
+from broadcastio.core.hedge import HedgePolicy, HedgeTracker
+from broadcastio.core.idempotency import IdempotencyStore
 from broadcastio.core.message import Message
+from broadcastio.core.metrics import Metrics
+from broadcastio.core.ratelimit import KeyedTokenBuckets, RateLimit, TokenBucket
 from broadcastio.core.result import DeliveryError, DeliveryResult
-from broadcastio.core.retry import RetryPolicy
+from broadcastio.core.retry import RetryBudget, RetryBudgetTokens, RetryPolicy
+from broadcastio.core.routing import RoutingStrategy
+from broadcastio.core.scheduler import RetryScheduler
 from broadcastio.core.trace import DeliveryAttempt, DeliveryTrace
+from broadcastio.core.trace_export import TraceExporter
 from broadcastio.providers.base import MessageProvider
 
+_RATE_LIMIT_MODES = {"wait", "fallback"}
+
 
 class Orchestrator:
     """
@@ -26,10 +50,17 @@ class Orchestrator:
     Responsibilities:
     - Message validation
     - Health-aware provider selection
-    - Retry orchestration (per provider)
-    - Fallback routing
-    - Delivery tracing
+    - Retry orchestration (per provider), with jitter and a shared budget
+    - Fallback routing, optionally reordered by a routing strategy
+    - Delivery tracing, with sampled background export
     - Observability hooks
+    - Concurrent batch delivery
+    - Optional background health monitoring
+    - Per-provider circuit breaking
+    - Per-provider and per-recipient rate limiting
+    - Optional hedging of slow first attempts
+    - Optional idempotent delivery keyed by reference_id
+    - Optional built-in metrics
     """
 
     def __init__(
@@ -42,14 +73,33 @@ class Orchestrator:
         on_attempt: Optional[Callable[[DeliveryAttempt], None]] = None,
         on_success: Optional[Callable[[DeliveryResult], None]] = None,
         on_failure: Optional[Callable[[DeliveryResult], None]] = None,
+        health_monitor: Optional[HealthMonitor] = None,
+        circuit_breaker: Optional[CircuitBreakerPolicy] = None,
+        on_circuit_change: Optional[Callable[[CircuitStateChange], None]] = None,
+        rate_limits: Optional[Dict[str, RateLimit]] = None,
+        recipient_rate_limit: Optional[RateLimit] = None,
+        rate_limit_mode: str = "wait",
+        idempotency: Optional[IdempotencyStore] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        routing: Optional[RoutingStrategy] = None,
+        metrics: Optional[Metrics] = None,
+        trace_exporter: Optional[TraceExporter] = None,
+        attachment_cache: Optional[AttachmentCache] = None,
     ):
         if not providers:
             raise OrchestrationError("Orchestrator requires at least one provider")
 
         self.providers = providers
         self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget
+        self._retry_tokens = RetryBudgetTokens(retry_budget) if retry_budget else None
         self.health_ttl = health_ttl
         self.require_healthy = require_healthy
+        self.routing = routing
+        self.metrics = metrics
+        self.trace_exporter = trace_exporter
+        self.attachment_cache = attachment_cache
 
         self.on_attempt = on_attempt
         self.on_success = on_success
@@ -57,52 +107,232 @@ class Orchestrator:
 
         # provider_name -> (checked_at, ProviderHealth)
         self._health_cache: Dict[str, Tuple[datetime, ProviderHealth]] = {}
+        # provider_name -> in-flight probe shared by concurrent callers
+        self._health_probes: Dict[str, Future] = {}
+        self._health_lock = threading.Lock()
 
-    def _validate_message(self, message: Message) -> None:
+        # Background health: send() only reads the monitor's snapshot
+        self.health_monitor = health_monitor
+        self._owns_health_monitor = False
+        if health_monitor is not None:
+            health_monitor.watch(self.providers)
+            if not health_monitor.running:
+                health_monitor.start()
+                self._owns_health_monitor = True
+
+        # provider_name -> CircuitBreaker
+        self.circuit_breaker = circuit_breaker
+        self.on_circuit_change = on_circuit_change
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        if circuit_breaker is not None:
+            for provider in self.providers:
+                self._breakers[provider.name] = CircuitBreaker(
+                    provider.name,
+                    circuit_breaker,
+                    on_change=lambda change: self._safe_call_hook(
+                        self.on_circuit_change, change
+                    ),
+                )
+
+        # provider_name -> TokenBucket
+        if rate_limit_mode not in _RATE_LIMIT_MODES:
+            raise ValidationError(f"rate_limit_mode must be one of {_RATE_LIMIT_MODES}")
+
+        unknown = set(rate_limits or {}) - {provider.name for provider in providers}
+        if unknown:
+            raise ValidationError(f"rate_limits has unknown providers: {unknown}")
+
+        self.rate_limit_mode = rate_limit_mode
+        self._rate_buckets: Dict[str, TokenBucket] = {
+            name: TokenBucket(limit) for name, limit in (rate_limits or {}).items()
+        }
+        self._recipient_buckets = (
+            KeyedTokenBuckets(recipient_rate_limit) if recipient_rate_limit else None
+        )
+
+        # reference_id -> in-flight delivery shared by concurrent duplicates
+        self.idempotency = idempotency
+        self._idempotency_flights: Dict[str, Future] = {}
+        self._idempotency_lock = threading.Lock()
+
+        # Hedged first attempts run on their own pool, created on first use
+        self.hedge_policy = hedge_policy
+        self._hedge = HedgeTracker(hedge_policy) if hedge_policy else None
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_workers = 0
+        self._hedge_executor_lock = threading.Lock()
+
+        # Timer thread parking batch deliveries between retries, created
+        # on first use
+        self._retry_scheduler: Optional[RetryScheduler] = None
+        self._retry_scheduler_lock = threading.Lock()
+
+    def close(self) -> None:
+        """
+        Stop background resources started by this orchestrator.
+        """
+        if self._owns_health_monitor and self.health_monitor is not None:
+            self.health_monitor.stop()
+            self._owns_health_monitor = False
+
+        with self._retry_scheduler_lock:
+            if self._retry_scheduler is not None:
+                self._retry_scheduler.close()
+                self._retry_scheduler = None
+
+        with self._hedge_executor_lock:
+            if self._hedge_executor is not None:
+                self._hedge_executor.shutdown(wait=False)
+                self._hedge_executor = None
+
+    def retry_scheduler(self) -> RetryScheduler:
+        """
+        Shared timer used to schedule retries without blocking workers.
+        """
+        with self._retry_scheduler_lock:
+            if self._retry_scheduler is None:
+                self._retry_scheduler = RetryScheduler()
+            return self._retry_scheduler
+
+    def __enter__(self) -> "Orchestrator":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _validate_recipient(self, message: Message) -> None:
         if not message.recipient:
             raise ValidationError("Message recipient is required")
 
-        if not message.content and not message.attachment:
+    def _validate_content(self, content: str, attachment) -> None:
+        if not content and not attachment:
             raise ValidationError("Message must have content or an attachment")
 
-        if message.attachment:
-            if not os.path.isfile(message.attachment.host_path):
-                raise AttachmentError(
-                    f"Attachment not found: {message.attachment.host_path}"
-                )
+        if attachment:
+            path = attachment.host_path
+            cache = self.attachment_cache
+            if not (cache.check(path) if cache is not None else os.path.isfile(path)):
+                raise AttachmentError(f"Attachment not found: {attachment.host_path}")
 
-            if not message.attachment.provider_path:
+            if not attachment.provider_path and any(
+                getattr(provider, "requires_provider_path", True)
+                for provider in self.providers
+            ):
                 raise AttachmentError("Attachment provider_path is required")
 
+    def _validate_message(self, message: Message) -> None:
+        self._validate_recipient(message)
+        self._validate_content(message.content, message.attachment)
+
+    def _cached_health(
+        self, provider: MessageProvider, now: datetime
+    ) -> Optional[ProviderHealth]:
+        if self.health_ttl is None:
+            return None
+
+        cached = self._health_cache.get(provider.name)
+        if cached:
+            checked_at, health = cached
+            if now - checked_at < timedelta(seconds=self.health_ttl):
+                return health
+
+        return None
+
     def _get_provider_health(self, provider: MessageProvider) -> ProviderHealth:
-        now = datetime.now(timezone.utc)
+        if self.health_monitor is not None:
+            return self.health_monitor.get(provider)
 
-        if self.health_ttl is not None:
-            cached = self._health_cache.get(provider.name)
-            if cached:
-                checked_at, health = cached
-                if now - checked_at < timedelta(seconds=self.health_ttl):
-                    return health
+        health = self._cached_health(provider, datetime.now(timezone.utc))
+        if health is not None:
+            return health
 
-        health = provider.health()
-        self._health_cache[provider.name] = (now, health)
-        return health
+        # Single-flight: one probe per provider per expiry; concurrent
+        # callers wait for the in-flight probe and reuse its result.
+        with self._health_lock:
+            health = self._cached_health(provider, datetime.now(timezone.utc))
+            if health is not None:
+                return health
 
-    def _iter_providers(self) -> List[MessageProvider]:
-        healthy = []
-        unhealthy = []
+            probe = self._health_probes.get(provider.name)
+            leader = probe is None
+            if leader:
+                probe = Future()
+                self._health_probes[provider.name] = probe
 
-        for provider in self.providers:
-            health = self._get_provider_health(provider)
-            if health.ready:
-                healthy.append(provider)
-            else:
-                unhealthy.append(provider)
+        if not leader:
+            return probe.result()
+
+        try:
+            now = datetime.now(timezone.utc)
+            health = provider.health()
+            with self._health_lock:
+                self._health_cache[provider.name] = (now, health)
+            probe.set_result(health)
+        except BaseException as exc:
+            probe.set_exception(exc)
+            raise
+        finally:
+            with self._health_lock:
+                self._health_probes.pop(provider.name, None)
+
+        return health
+
+    def _select_providers(self, providers, healths: List[ProviderHealth]) -> list:
+        healthy = [
+            provider for provider, health in zip(providers, healths) if health.ready
+        ]
 
         if self.require_healthy and not healthy:
             raise OrchestrationError("No healthy providers available")
 
-        return healthy or self.providers
+        selected = healthy or list(providers)
+
+        if self._breakers:
+            # Open circuits are skipped without an attempt
+            selected = [
+                provider
+                for provider in selected
+                if self._breakers[provider.name].state != CircuitState.OPEN
+            ]
+
+        if self.routing is not None:
+            selected = self.routing.order(selected)
+
+        return selected
+
+    def health_snapshot(self) -> Dict[str, ProviderHealth]:
+        """
+        Latest known health per provider, including circuit state.
+
+        Never probes: providers not checked yet are reported as ready.
+        """
+        if self.health_monitor is not None:
+            known = self.health_monitor.snapshot()
+        else:
+            with self._health_lock:
+                known = {
+                    name: health for name, (_, health) in self._health_cache.items()
+                }
+
+        snapshot = {}
+        for provider in self.providers:
+            health = known.get(provider.name) or ProviderHealth(
+                provider=provider.name,
+                ready=True,
+                details="health not checked yet",
+            )
+
+            breaker = self._breakers.get(provider.name)
+            if breaker is not None:
+                health = replace(health, circuit=breaker.state)
+
+            snapshot[provider.name] = health
+
+        return snapshot
+
+    def _iter_providers(self) -> List[MessageProvider]:
+        healths = [self._get_provider_health(provider) for provider in self.providers]
+        return self._select_providers(self.providers, healths)
 
     def _safe_call_hook(self, hook, payload) -> None:
         if not hook:
@@ -113,97 +343,280 @@ class Orchestrator:
             # Hooks must NEVER affect orchestration
             pass
 
-    def _sleep_before_retry(self, policy: RetryPolicy, attempt_index: int) -> None:
+    def _retry_delay(
+        self, policy: RetryPolicy, attempt_index: int, previous: float = 0.0
+    ) -> float:
         if policy.backoff == "none":
-            return
+            return 0.0
 
-        delay = policy.base_delay
-        if policy.backoff == "exponential":
-            delay = delay * (2**attempt_index)
+        if policy.jitter == "decorrelated":
+            # Grows from the previous delay instead of the attempt number
+            base = policy.base_delay
+            delay = random.uniform(base, max(previous, base) * 3)
+        else:
+            delay = policy.base_delay
+            if policy.backoff == "exponential":
+                delay = delay * (2**attempt_index)
 
         if policy.max_delay is not None:
             delay = min(delay, policy.max_delay)
 
-        if delay > 0:
-            time.sleep(delay)
+        if policy.jitter == "full":
+            delay = random.uniform(0, delay)
+        elif policy.jitter == "equal":
+            delay = delay / 2 + random.uniform(0, delay / 2)
 
-    def send(self, message: Message, *, trace: bool = False):
-        self._validate_message(message)
+        return delay
 
-        delivery_trace = DeliveryTrace() if trace else None
-        last_error: Optional[DeliveryError] = None
+    def _error_result(self, provider, exc: Exception) -> DeliveryResult:
+        """
+        Normalize an exception raised by a provider into a failed result.
+        """
+        if isinstance(exc, requests.RequestException):
+            return DeliveryResult(
+                success=False,
+                provider=provider.name,
+                error=DeliveryError(
+                    code=ErrorCode.PROVIDER_UNAVAILABLE,
+                    message=f"{provider.name} service unavailable",
+                    details={"exception": str(exc)},
+                ),
+            )
 
-        for provider in self._iter_providers():
-            policy = getattr(provider, "retry_policy", None) or self.retry_policy
+        return DeliveryResult(
+            success=False,
+            provider=provider.name,
+            error=DeliveryError(
+                code=ErrorCode.ALL_PROVIDERS_FAILED,
+                message=str(exc),
+            ),
+        )
 
-            for attempt_index in range(policy.max_attempts):
-                started_at = datetime.now(timezone.utc)
+    def _call_provider(
+        self, provider: MessageProvider, message: Message
+    ) -> DeliveryResult:
+        routing = self.routing
+        if routing is not None:
+            routing.on_start(provider.name)
 
-                try:
-                    result = provider.send(message)
+        try:
+            return provider.send(message)
+        except BroadcastioError:
+            # Configuration / misuse → stop immediately
+            raise
+        except Exception as exc:
+            return self._error_result(provider, exc)
+        finally:
+            if routing is not None:
+                routing.on_finish(provider.name)
 
-                except BroadcastioError:
-                    # Configuration / misuse → stop immediately
-                    raise
+    def _start_run(self, message: Message, providers: list, trace: bool) -> "_Run":
+        exporter = self.trace_exporter
+        sampled = exporter is not None and exporter.sample()
+        # Failures are only known at the end: record them all to export
+        record = (
+            trace
+            or sampled
+            or (exporter is not None and exporter.always_export_failures)
+        )
 
-                except requests.RequestException as exc:
-                    result = DeliveryResult(
-                        success=False,
-                        provider=provider.name,
-                        error=DeliveryError(
-                            code=ErrorCode.PROVIDER_UNAVAILABLE,
-                            message=f"{provider.name} service unavailable",
-                            details={"exception": str(exc)},
-                        ),
-                    )
+        run = _Run(
+            message=message,
+            providers=providers,
+            trace=DeliveryTrace() if record else None,
+        )
+        run.return_trace = trace
+        run.sampled = sampled
 
-                except Exception as exc:
-                    result = DeliveryResult(
-                        success=False,
-                        provider=provider.name,
-                        error=DeliveryError(
-                            code=ErrorCode.ALL_PROVIDERS_FAILED,
-                            message=str(exc),
-                        ),
-                    )
+        if self.metrics is not None:
+            self.metrics.message_started()
 
-                finished_at = datetime.now(timezone.utc)
+        if not providers:
+            # Every selected provider has an open circuit
+            run.last_error = DeliveryError(
+                code=ErrorCode.CIRCUIT_OPEN,
+                message="All provider circuits are open",
+            )
+            self._fail_run(run)
 
-                attempt = DeliveryAttempt(
-                    provider=provider.name,
-                    attempt=attempt_index + 1,
-                    started_at=started_at,
-                    finished_at=finished_at,
-                    success=result.success,
-                    error=result.error,
-                )
+        return run
 
-                if delivery_trace:
-                    delivery_trace.add_attempt(attempt)
+    def _skip_provider(self, run: "_Run", code: str, message: str) -> None:
+        run.last_error = run.last_error or DeliveryError(code=code, message=message)
+        self._fall_back(run)
 
-                self._safe_call_hook(self.on_attempt, attempt)
+    def _acquire_attempt(self, run: "_Run") -> Optional[float]:
+        """
+        Admission checks before an attempt on the current provider:
+        rate limits and circuit breaker.
 
-                if result.success:
-                    if delivery_trace:
-                        delivery_trace.mark_finished(success=True)
-                        result.trace = delivery_trace
+        Returns the delay (seconds) to wait before the attempt, or None
+        when the provider was skipped and the run moved on.
+        """
+        provider = run.provider
+        bucket = self._rate_buckets.get(provider.name)
 
-                    self._safe_call_hook(self.on_success, result)
-                    return result
+        if (
+            bucket is not None
+            and self.rate_limit_mode == "fallback"
+            and not bucket.try_acquire()
+        ):
+            self._skip_provider(
+                run, ErrorCode.RATE_LIMITED, f"{provider.name} rate limit reached"
+            )
+            return None
 
-                last_error = result.error
+        breaker = self._breakers.get(provider.name)
+        if breaker is not None and not breaker.allow():
+            self._skip_provider(
+                run, ErrorCode.CIRCUIT_OPEN, f"{provider.name} circuit is open"
+            )
+            return None
 
-                if (
-                    attempt_index + 1 < policy.max_attempts
-                    and last_error
-                    and policy.should_retry(last_error.code)
-                ):
-                    self._sleep_before_retry(policy, attempt_index)
-                    continue
+        delay = 0.0
+        if bucket is not None and self.rate_limit_mode == "wait":
+            delay = bucket.reserve()
+
+        # Switching provider doesn't help a recipient limit: always wait
+        if self._recipient_buckets is not None:
+            recipient_delay = self._recipient_buckets.reserve(run.message.recipient)
+            if recipient_delay > delay:
+                delay = recipient_delay
+
+        return delay
+
+    def _complete_attempt(
+        self,
+        run: "_Run",
+        result: DeliveryResult,
+        started_ns: int,
+        finished_ns: int,
+    ) -> float:
+        """
+        Record one provider attempt and advance the run. Timestamps are
+        `time.perf_counter_ns()` readings.
+
+        Returns the delay (seconds) to wait before retrying the same
+        provider. When the run is finished, `run.result` is set.
+        """
+        self._record_attempt(
+            run, run.provider, run.attempt_index, result, started_ns, finished_ns
+        )
+        return self._after_attempt(run, result)
+
+    def _record_attempt(
+        self,
+        run: "_Run",
+        provider,
+        attempt_index: int,
+        result: DeliveryResult,
+        started_ns: int,
+        finished_ns: int,
+        *,
+        observed: bool = True,
+    ) -> None:
+        """
+        Trace an attempt and report it to hooks, the circuit breaker and
+        the retry/hedge trackers. `observed=False` is for hedge losers
+        abandoned before they answered: traced only (the circuit breaker
+        gets their outcome from `_hedged_attempt()` once it lands).
+        """
+        attempt = DeliveryAttempt(
+            provider=provider.name,
+            attempt=attempt_index + 1,
+            success=result.success,
+            error=result.error,
+            started_ns=started_ns,
+            finished_ns=finished_ns,
+            anchor_ns=run.trace.anchor_ns if run.trace else None,
+        )
+
+        if run.trace:
+            run.trace.add_attempt(attempt)
+
+        self._safe_call_hook(self.on_attempt, attempt)
+
+        if not observed:
+            return
+
+        if self.metrics is not None:
+            self.metrics.record_attempt(
+                provider.name,
+                result.error.code if result.error else None,
+                attempt.duration_ms,
+                retry=attempt_index > 0,
+            )
+
+        if self.routing is not None:
+            self.routing.observe(attempt)
+
+        if self._retry_tokens is not None and attempt_index == 0:
+            self._retry_tokens.deposit()
+
+        if self._hedge is not None and result.success:
+            self._hedge.observe(provider.name, (finished_ns - started_ns) / 1e9)
+
+        self._record_circuit(provider, result)
+
+    def _record_circuit(self, provider, result: DeliveryResult) -> None:
+        breaker = self._breakers.get(provider.name)
+        if breaker is not None:
+            breaker.record(
+                result.success
+                or not self.circuit_breaker.is_failure(
+                    result.error.code if result.error else None
+                )
+            )
+
+    def _after_attempt(self, run: "_Run", result: DeliveryResult) -> float:
+        """
+        Decide what follows a recorded attempt on the current provider:
+        finish, retry (returns the delay) or fall back.
+        """
+        if result.success:
+            if run.trace:
+                self._finish_trace(run, result)
+
+            run.result = result
+            if self.metrics is not None:
+                self.metrics.message_finished(success=True)
+            self._safe_call_hook(self.on_success, result)
+            return 0.0
+
+        provider = run.provider
+        policy = run.policy(self.retry_policy)
+        attempt_index = run.attempt_index
+        breaker = self._breakers.get(provider.name)
+        run.last_error = result.error
+
+        if (
+            attempt_index + 1 < policy.max_attempts
+            and run.last_error
+            and policy.should_retry(run.last_error.code)
+            and (breaker is None or breaker.state == CircuitState.CLOSED)
+            and (self._retry_tokens is None or self._retry_tokens.try_withdraw())
+        ):
+            run.attempt_index += 1
+            run.retry_delay = self._retry_delay(policy, attempt_index, run.retry_delay)
+            return run.retry_delay
+
+        # stop retrying this provider
+        self._fall_back(run)
+        return 0.0
 
-                break  # stop retrying this provider
+    def _fall_back(self, run: "_Run") -> None:
+        """
+        Move the run to its next provider, or fail it if none is left.
+        """
+        provider = run.provider
+        run.next_provider()
+        if run.provider is None:
+            self._fail_run(run)
+        elif self.metrics is not None:
+            self.metrics.record_fallback(provider.name)
 
-        final_error = last_error or DeliveryError(
+    def _fail_run(self, run: "_Run") -> None:
+        final_error = run.last_error or DeliveryError(
             code=ErrorCode.ALL_PROVIDERS_FAILED,
             message="All providers failed",
         )
@@ -214,10 +627,733 @@ class Orchestrator:
             error=final_error,
         )
 
-        if delivery_trace:
-            delivery_trace.mark_finished(success=False)
-            final_result.trace = delivery_trace
+        if run.trace:
+            self._finish_trace(run, final_result)
 
+        run.result = final_result
+        if self.metrics is not None:
+            self.metrics.message_finished(success=False)
         self._safe_call_hook(self.on_failure, final_result)
 
-        return final_result
+    def _finish_trace(self, run: "_Run", result: DeliveryResult) -> None:
+        run.trace.mark_finished(success=result.success)
+
+        if run.return_trace:
+            result.trace = run.trace
+
+        exporter = self.trace_exporter
+        if exporter is not None and (
+            run.sampled or (not result.success and exporter.always_export_failures)
+        ):
+            exporter.export(run.trace)
+
+    def _advance(self, run: "_Run") -> float:
+        """
+        Run attempts until the run finishes or has to wait (retry backoff
+        or rate limit).
+
+        Returns the wait in seconds; the caller resumes the run with
+        `_advance()` once it has elapsed. Returns 0.0 when `run.result`
+        is set.
+        """
+        while run.result is None:
+            if not run.admitted:
+                delay = self._acquire_attempt(run)
+                if delay is None:
+                    continue
+                run.admitted = True
+                if delay > 0:
+                    return delay
+
+            run.admitted = False
+
+            if (
+                self._hedge is not None
+                and run.provider_index == 0
+                and run.attempt_index == 0
+                and len(run.providers) > 1
+            ):
+                delay = self._hedged_attempt(run)
+            else:
+                started_ns = time.perf_counter_ns()
+                result = self._call_provider(run.provider, run.message)
+                finished_ns = time.perf_counter_ns()
+
+                delay = self._complete_attempt(run, result, started_ns, finished_ns)
+
+            if delay > 0:
+                return delay
+
+        return 0.0
+
+    # ------------------------------------------------------------------
+    # Hedging
+    # ------------------------------------------------------------------
+
+    def _get_hedge_executor(self, callers: int = 0) -> ThreadPoolExecutor:
+        """
+        The pool running hedged attempts: `HedgePolicy.max_workers`
+        threads, or two per concurrent caller when `callers` (e.g. the
+        `send_many()` workers) needs more, so hedging never caps the
+        caller's concurrency. A pool outgrown this way is dropped, not
+        shut down: calls already on it finish normally.
+        """
+        workers = max(self.hedge_policy.max_workers, 2 * callers)
+        with self._hedge_executor_lock:
+            if self._hedge_executor is None or self._hedge_workers < workers:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix="broadcastio-hedge",
+                )
+                self._hedge_workers = workers
+            return self._hedge_executor
+
+    def _timed_call(
+        self, provider, message: Message, started: Optional[threading.Event] = None
+    ) -> Tuple[DeliveryResult, int, int]:
+        started_ns = time.perf_counter_ns()
+        if started is not None:
+            started.set()
+        result = self._call_provider(provider, message)
+        return result, started_ns, time.perf_counter_ns()
+
+    def _admit_hedge(self, provider) -> bool:
+        # A hedge never waits: skip it when the backup is limited or open
+        if not self._hedge.try_acquire():
+            return False
+
+        bucket = self._rate_buckets.get(provider.name)
+        if bucket is not None and not bucket.try_acquire():
+            return False
+
+        # Last: a half-open permit must only be taken for a call that is made
+        breaker = self._breakers.get(provider.name)
+        return breaker is None or breaker.allow()
+
+    def _record_abandoned(self, provider, future: Future) -> None:
+        # The call may hold a half-open permit: report its real outcome
+        if future.exception() is not None:
+            result = self._error_result(provider, future.exception())
+        else:
+            result = future.result()[0]
+        self._record_circuit(provider, result)
+
+    def _hedged_attempt(self, run: "_Run") -> float:
+        """
+        First attempt on the primary provider, raced against the next
+        provider once the hedge delay passes without an answer.
+
+        The first success wins; a loser still running is abandoned and
+        traced as `HEDGE_CANCELLED`, and its circuit breaker is updated
+        when it eventually answers. If both fail, the run continues on
+        the backup provider as if the primary's attempts were exhausted.
+        """
+        primary, backup = run.providers[0], run.providers[1]
+        self._hedge.deposit()
+        hedge_delay = self._hedge.delay(primary.name)
+
+        executor = self._get_hedge_executor()
+
+        first_ns = time.perf_counter_ns()
+        started = threading.Event()
+        first = executor.submit(self._timed_call, primary, run.message, started)
+
+        # The delay runs from the call, not from the submit: time queued
+        # on a busy pool must not make the primary look slow
+        started.wait()
+        try:
+            outcome = first.result(timeout=hedge_delay)
+        except FutureTimeoutError:
+            outcome = None
+
+        if outcome is not None or not self._admit_hedge(backup):
+            return self._complete_attempt(run, *(outcome or first.result()))
+
+        second_ns = time.perf_counter_ns()
+        second = executor.submit(self._timed_call, backup, run.message)
+        done, _ = wait([first, second], return_when=FIRST_COMPLETED)
+        winner, loser = (first, second) if first in done else (second, first)
+
+        if not winner.result()[0].success:
+            # The first answer failed: the other one may still succeed
+            if loser.result()[0].success:
+                winner, loser = loser, winner
+
+        result, _, finished_ns = winner.result()
+
+        for future, provider, submitted in (
+            (first, primary, first_ns),
+            (second, backup, second_ns),
+        ):
+            if future is loser and not future.done():
+                self._record_attempt(
+                    run,
+                    provider,
+                    0,
+                    DeliveryResult(
+                        success=False,
+                        provider=provider.name,
+                        error=DeliveryError(
+                            code=ErrorCode.HEDGE_CANCELLED,
+                            message=f"{provider.name} lost the hedge race",
+                        ),
+                    ),
+                    submitted,
+                    finished_ns,
+                    observed=False,
+                )
+                future.add_done_callback(
+                    lambda done, provider=provider: self._record_abandoned(
+                        provider, done
+                    )
+                )
+            else:
+                self._record_attempt(run, provider, 0, *future.result())
+
+        if result.success:
+            if winner is second:
+                run.next_provider()
+            return self._after_attempt(run, result)
+
+        # Both failed: the primary is done, carry on with the backup
+        if self.metrics is not None:
+            self.metrics.record_fallback(run.provider.name)
+        run.next_provider()
+        return self._after_attempt(run, second.result()[0])
+
+    def _drive(self, run: "_Run", delay: float = 0.0) -> DeliveryResult:
+        """
+        Run attempts until the run finishes, sleeping in this thread
+        between them.
+        """
+        while True:
+            if delay > 0:
+                time.sleep(delay)
+
+            delay = self._advance(run)
+            if run.result is not None:
+                return run.result
+
+    def send(self, message: Message, *, trace: bool = False) -> DeliveryResult:
+        self._validate_message(message)
+
+        if self.idempotency is not None:
+            return self._send_once(message, trace)
+
+        return self._drive(self._start_run(message, self._iter_providers(), trace))
+
+    def _send_once(self, message: Message, trace: bool) -> DeliveryResult:
+        """
+        Deliver a message at most once per `reference_id`.
+
+        A key already in the store returns the stored result without
+        calling any provider. Concurrent sends of the same key share a
+        single delivery. Only successful results are stored, so a failed
+        message can be submitted again.
+        """
+        key = message.metadata.reference_id
+        result = self.idempotency.get(key)
+        if result is not None:
+            return result
+
+        flight, leader = self._join_flight(key)
+        if not leader:
+            return flight.result()
+
+        try:
+            # Another delivery may have finished since the first lookup
+            result = self.idempotency.get(key)
+            if result is None:
+                result = self._drive(
+                    self._start_run(message, self._iter_providers(), trace)
+                )
+        except BaseException as exc:
+            self._abort_flight(key, flight, exc)
+            raise
+
+        self._land_flight(key, flight, result)
+        return result
+
+    def _join_flight(self, key: str) -> Tuple[Future, bool]:
+        """
+        The in-flight delivery of `key`, and whether the caller leads it
+        (and must land or abort it).
+        """
+        with self._idempotency_lock:
+            flight = self._idempotency_flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self._idempotency_flights[key] = Future()
+            return flight, True
+
+    def _land_flight(self, key: str, flight: Future, result: DeliveryResult) -> None:
+        try:
+            if result.success:
+                self.idempotency.put(key, result)
+        except BaseException as exc:
+            self._abort_flight(key, flight, exc)
+            raise
+
+        with self._idempotency_lock:
+            if self._idempotency_flights.get(key) is flight:
+                del self._idempotency_flights[key]
+        flight.set_result(result)
+
+    def _abort_flight(self, key: str, flight: Future, exc: BaseException) -> None:
+        with self._idempotency_lock:
+            if self._idempotency_flights.get(key) is flight:
+                del self._idempotency_flights[key]
+        flight.set_exception(exc)
+
+    # ------------------------------------------------------------------
+    # Batch delivery
+    # ------------------------------------------------------------------
+
+    def _deliver_one(
+        self,
+        index: int,
+        message: Message,
+        trace: bool,
+        validate: Callable[[Message], None],
+        leading: Optional[Set["_Run"]] = None,
+    ) -> List[Tuple[int, "_Run", float]]:
+        validate(message)
+
+        if self.idempotency is None:
+            run = self._start_run(message, self._iter_providers(), trace)
+            return self._resume(index, run)
+
+        # Same contract as `_send_once()`, but the leading run is parked
+        # between attempts like any other instead of sleeping here
+        key = message.metadata.reference_id
+        result = self.idempotency.get(key)
+        if result is None:
+            flight, leader = self._join_flight(key)
+            if not leader:
+                run = _Run(message=message, providers=[])
+                run.follows = flight
+                return [(index, run, 0.0)]
+
+            try:
+                result = self.idempotency.get(key)
+                if result is None:
+                    run = self._start_run(message, self._iter_providers(), trace)
+            except BaseException as exc:
+                self._abort_flight(key, flight, exc)
+                raise
+
+            if result is None:
+                run.flight = flight
+                if leading is not None:
+                    leading.add(run)
+                return self._resume(index, run)
+            self._land_flight(key, flight, result)
+
+        run = _Run(message=message, providers=[])
+        run.result = result
+        return [(index, run, 0.0)]
+
+    def _resume(self, index: int, run: "_Run") -> List[Tuple[int, "_Run", float]]:
+        try:
+            delay = self._advance(run)
+        except BaseException as exc:
+            if run.flight is not None:
+                key = run.message.metadata.reference_id
+                self._abort_flight(key, run.flight, exc)
+            raise
+
+        if run.result is not None and run.flight is not None:
+            self._land_flight(run.message.metadata.reference_id, run.flight, run.result)
+        return [(index, run, delay)]
+
+    def _follow(self, index: int, run: "_Run") -> Future:
+        """
+        Completes with the result of the delivery `run` follows, without
+        holding a worker while it is in flight.
+        """
+        done = Future()
+
+        def land(flight: Future) -> None:
+            try:
+                run.result = flight.result()
+            except BaseException as exc:
+                done.set_exception(exc)
+            else:
+                done.set_result([(index, run, 0.0)])
+
+        run.follows.add_done_callback(land)
+        return done
+
+    def _circuit_closed(self, provider) -> bool:
+        breaker = self._breakers.get(provider.name)
+        return breaker is None or breaker.state == CircuitState.CLOSED
+
+    def _rate_limited(self, provider) -> bool:
+        # Rate-limited messages are admitted one by one, never batched
+        return (
+            provider.name in self._rate_buckets or self._recipient_buckets is not None
+        )
+
+    def _deliver_batch(
+        self,
+        indexed: List[Tuple[int, Message]],
+        providers: list,
+        trace: bool,
+    ) -> List[Tuple[int, "_Run", float]]:
+        """
+        First attempt for a chunk of messages through the primary
+        provider's `send_batch()`.
+
+        Returns each run with its retry delay; unfinished runs continue
+        individually through the normal retry/fallback path.
+
+        Once the request may have reached the provider, some items may
+        already have been delivered whatever went wrong next (timeout,
+        5xx, unreadable response, wrong number of results): every item
+        then fails with `BATCH_OUTCOME_UNKNOWN`, without retry or
+        fallback, so no recipient gets a duplicate. Only errors raised
+        while connecting go through the normal retry/fallback path.
+        """
+        provider = providers[0]
+        messages = [message for _, message in indexed]
+        runs = [self._start_run(message, providers, trace) for message in messages]
+
+        if self.routing is not None:
+            for _ in messages:
+                self.routing.on_start(provider.name)
+
+        unknown = None
+        started_ns = time.perf_counter_ns()
+        try:
+            results = provider.send_batch(messages)
+            if len(results) != len(messages):
+                unknown = (
+                    f"{provider.name}.send_batch() returned {len(results)} results "
+                    f"for {len(messages)} messages"
+                )
+        except BroadcastioError:
+            raise
+        except Exception as exc:
+            if _request_sent(exc):
+                unknown = f"{provider.name} batch failed after sending: {exc!r}"
+            else:
+                results = [self._error_result(provider, exc) for _ in messages]
+        finally:
+            if self.routing is not None:
+                for _ in messages:
+                    self.routing.on_finish(provider.name)
+        finished_ns = time.perf_counter_ns()
+
+        if unknown is not None:
+            return [
+                (index, run, self._fail_unknown(run, unknown, started_ns, finished_ns))
+                for (index, _), run in zip(indexed, runs)
+            ]
+
+        return [
+            (index, run, self._complete_attempt(run, result, started_ns, finished_ns))
+            for (index, _), run, result in zip(indexed, runs, results)
+        ]
+
+    def _fail_unknown(
+        self, run: "_Run", message: str, started_ns: int, finished_ns: int
+    ) -> float:
+        result = DeliveryResult(
+            success=False,
+            provider=run.provider.name,
+            error=DeliveryError(code=ErrorCode.BATCH_OUTCOME_UNKNOWN, message=message),
+        )
+        self._record_attempt(
+            run, run.provider, run.attempt_index, result, started_ns, finished_ns
+        )
+        run.last_error = result.error
+        self._fail_run(run)
+        return 0.0
+
+    def _batch_providers(self) -> Optional[list]:
+        """
+        Selected providers when the next chunk can go to the primary
+        provider's `send_batch()`, otherwise None.
+        """
+        if self.idempotency is not None:
+            return None
+
+        try:
+            providers = self._iter_providers()
+        except OrchestrationError:
+            # Surfaced by the first message sent individually
+            return None
+
+        if (
+            providers
+            and hasattr(providers[0], "send_batch")
+            and self._circuit_closed(providers[0])
+            and not self._rate_limited(providers[0])
+        ):
+            return providers
+        return None
+
+    def send_many(
+        self,
+        messages: Iterable[Message],
+        *,
+        max_workers: int = 8,
+        trace: bool = False,
+        batch_size: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> List[DeliveryResult]:
+        """
+        Send many messages concurrently over a bounded thread pool.
+
+        Each message goes through the same validation, retry, fallback
+        and hook flow as `send()`. Results are returned in input order.
+        """
+        results: List[Optional[DeliveryResult]] = []
+
+        for index, result in self.iter_send_many(
+            messages,
+            max_workers=max_workers,
+            trace=trace,
+            batch_size=batch_size,
+            max_in_flight=max_in_flight,
+        ):
+            if index >= len(results):
+                results.extend([None] * (index + 1 - len(results)))
+            results[index] = result
+
+        return results  # type: ignore[return-value]
+
+    def iter_send_many(
+        self,
+        messages: Iterable[Message],
+        *,
+        max_workers: int = 8,
+        trace: bool = False,
+        batch_size: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[Tuple[int, DeliveryResult]]:
+        """
+        Stream `(index, DeliveryResult)` pairs as deliveries complete.
+
+        `messages` is consumed lazily: at most `max_in_flight` messages
+        (default `2 * max_workers`, or `max_workers * batch_size` when
+        batching) are in flight at any time, so arbitrarily large
+        iterables can be sent without materializing them. A message is
+        only taken from `messages` once it fits in that window.
+
+        Retry backoff does not hold a worker: a message waiting for its
+        next attempt (retry backoff or rate limit) is parked on
+        `retry_scheduler()` and handed back to the pool when due, so
+        workers keep sending other messages. Parked messages still count
+        as in flight: when most messages are waiting to retry, the
+        window fills up and workers idle. Raise `max_in_flight` to keep
+        them busy through retry storms, at the cost of memory and of
+        more messages waiting on a failing provider.
+
+        With idempotency enabled, each message is delivered at most once
+        per `reference_id`, as with `send()`; duplicates wait for the
+        delivery in flight without holding a worker.
+
+        `messages` can be a `Broadcast`: its content and attachment are
+        validated once, then only each recipient is checked. Indexes are
+        recipient positions.
+
+        Batching is opt-in: with `batch_size` set and a first selected
+        provider implementing `send_batch()`, first attempts are sent to
+        it in chunks of `batch_size`. Items that fail continue
+        individually through the normal retry and fallback path; a batch
+        that fails after it was sent is not retried.
+
+        Exceptions raised by `send()` (validation, misconfiguration)
+        propagate to the caller and cancel any deliveries not yet started.
+        """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValidationError("max_workers must be an integer >= 1")
+
+        if batch_size is not None and (
+            not isinstance(batch_size, int) or batch_size < 1
+        ):
+            raise ValidationError("batch_size must be None or an integer >= 1")
+
+        if max_in_flight is not None and (
+            not isinstance(max_in_flight, int) or max_in_flight < 1
+        ):
+            raise ValidationError("max_in_flight must be None or an integer >= 1")
+
+        validate = self._validate_message
+        if isinstance(messages, Broadcast):
+            self._validate_content(messages.content, messages.attachment)
+            validate = self._validate_recipient
+
+        if self._hedge is not None:
+            self._get_hedge_executor(max_workers)
+
+        iterator = iter(messages)
+        pending: Set[Future] = set()
+        # Idempotent deliveries led by this call, to abort if it stops early
+        leading: Set[_Run] = set()
+        # Runs started and not finished, parked ones included
+        in_flight = 0
+        next_index = 0
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="broadcastio"
+        )
+
+        def collect(done):
+            nonlocal in_flight
+            for future in done:
+                for index, run, delay in future.result():
+                    if run.result is not None:
+                        in_flight -= 1
+                        yield index, run.result
+                    elif run.follows is not None:
+                        pending.add(self._follow(index, run))
+                    elif delay > 0:
+                        pending.add(
+                            self.retry_scheduler().submit_later(
+                                executor, delay, self._resume, index, run
+                            )
+                        )
+                    else:
+                        pending.add(executor.submit(self._resume, index, run))
+
+        def drain(limit):
+            # Wait for deliveries until at most `limit` are in flight
+            while in_flight > limit:
+                done, not_done = wait(pending, return_when=FIRST_COMPLETED)
+                pending.intersection_update(not_done)
+                yield from collect(done)
+
+        try:
+            while True:
+                providers = self._batch_providers() if batch_size else None
+
+                if providers is None:
+                    yield from drain((max_in_flight or 2 * max_workers) - 1)
+                    chunk = list(islice(iterator, 1))
+                else:
+                    limit = max_in_flight or max_workers * batch_size
+                    yield from drain(max(limit - batch_size, 0))
+                    chunk = list(islice(iterator, batch_size))
+
+                if not chunk:
+                    break
+
+                indexed = list(enumerate(chunk, start=next_index))
+                next_index += len(chunk)
+                in_flight += len(chunk)
+
+                if providers is not None:
+                    for _, message in indexed:
+                        validate(message)
+
+                    pending.add(
+                        executor.submit(self._deliver_batch, indexed, providers, trace)
+                    )
+                else:
+                    index, message = indexed[0]
+                    pending.add(
+                        executor.submit(
+                            self._deliver_one, index, message, trace, validate, leading
+                        )
+                    )
+
+            while pending:
+                done, not_done = wait(pending, return_when=FIRST_COMPLETED)
+                pending.intersection_update(not_done)
+                yield from collect(done)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+            for run in leading:
+                if not run.flight.done():
+                    self._abort_flight(
+                        run.message.metadata.reference_id,
+                        run.flight,
+                        OrchestrationError("Delivery cancelled before it finished"),
+                    )
+
+
+def _request_sent(exc: Exception) -> bool:
+    """
+    Whether a provider exception may have come after the request was
+    sent. Only connect-phase errors (connect timeout, refused or
+    unresolvable host) are known not to have reached the provider.
+    """
+    if isinstance(exc, requests.ConnectTimeout):
+        return False
+
+    if isinstance(exc, requests.ConnectionError):
+        reason = exc.args[0] if exc.args else None
+        reason = getattr(reason, "reason", reason)  # urllib3 MaxRetryError
+        # NewConnectionError (refused, DNS) subclasses ConnectTimeoutError
+        return not isinstance(reason, urllib3.exceptions.ConnectTimeoutError)
+
+    return True
+
+
+class _Run:
+    """
+    Mutable delivery state of a single message.
+
+    Walks the selected providers in order, tracking the current retry
+    attempt. Shared by the sync and async send paths.
+    """
+
+    __slots__ = (
+        "message",
+        "providers",
+        "provider_index",
+        "attempt_index",
+        "trace",
+        "last_error",
+        "result",
+        "admitted",
+        "retry_delay",
+        "return_trace",
+        "sampled",
+        "flight",
+        "follows",
+    )
+
+    def __init__(
+        self,
+        message: Message,
+        providers: list,
+        trace: Optional[DeliveryTrace] = None,
+    ):
+        self.message = message
+        self.providers = providers
+        self.provider_index = 0
+        self.attempt_index = 0
+        self.trace = trace
+        self.last_error: Optional[DeliveryError] = None
+        self.result: Optional[DeliveryResult] = None
+        # Admission checks passed for the pending attempt
+        self.admitted = False
+        # Last backoff on the current provider (decorrelated jitter)
+        self.retry_delay = 0.0
+        # Attach the trace to the result (send(trace=True))
+        self.return_trace = trace is not None
+        # Export the trace whatever the outcome (head-based sampling)
+        self.sampled = False
+        # Idempotency: the delivery this run leads, or waits for
+        self.flight: Optional[Future] = None
+        self.follows: Optional[Future] = None
+
+    @property
+    def provider(self):
+        if self.provider_index < len(self.providers):
+            return self.providers[self.provider_index]
+        return None
+
+    def policy(self, default: RetryPolicy) -> RetryPolicy:
+        return getattr(self.provider, "retry_policy", None) or default
+
+    def next_provider(self) -> None:
+        self.provider_index += 1
+        self.attempt_index = 0
+        self.retry_delay = 0.0
@@ -0,0 +1,346 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from broadcastio.core.exceptions import BroadcastioError, ValidationError
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.result import DeliveryError, DeliveryResult
+
+
+class OutboxStatus:
+    PENDING = "pending"
+    IN_FLIGHT = "in_flight"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    message       TEXT    NOT NULL,
+    status        TEXT    NOT NULL DEFAULT 'pending',
+    worker        TEXT,
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    created_at    REAL    NOT NULL,
+    claimed_at    REAL,
+    finished_at   REAL,
+    provider      TEXT,
+    message_id    TEXT,
+    error_code    TEXT,
+    error_message TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_status_id ON outbox (status, id);
+"""
+
+
+@dataclass
+class OutboxItem:
+    id: int
+    message: Message
+    attempts: int
+
+
+class Outbox:
+    """
+    Durable outbox backed by SQLite in WAL mode.
+
+    Messages are written before delivery, claimed by workers in batches
+    and marked `sent` / `failed` from their `DeliveryResult`. If the
+    process dies, claimed rows stay `in_flight`; opening the outbox
+    again (`recover=True`) puts them back to `pending`.
+
+    Delivery is at-least-once: a message claimed just before a crash may
+    be sent again after recovery.
+
+    Connections are per thread, so one `Outbox` can be shared by worker
+    threads. With several processes on the same file, open it with
+    `recover=False` and call `recover(older_than=...)` explicitly.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        recover: bool = True,
+        timeout: float = 30.0,
+    ):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+
+        if recover:
+            self.recover()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None,  # explicit transactions below
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def __enter__(self) -> "Outbox":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def enqueue(self, message: Message) -> int:
+        """
+        Persist one message and return its outbox id.
+        """
+        conn = self._connection()
+        with _transaction(conn):
+            cursor = conn.execute(
+                "INSERT INTO outbox (message, created_at) VALUES (?, ?)",
+                (json.dumps(message.to_dict()), time.time()),
+            )
+        return cursor.lastrowid
+
+    def enqueue_many(
+        self, messages: Iterable[Message], *, batch_size: int = 1000
+    ) -> int:
+        """
+        Persist messages in bulk, one transaction per `batch_size` rows.
+        Returns the number of messages written.
+        """
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValidationError("batch_size must be an integer >= 1")
+
+        conn = self._connection()
+        total = 0
+        rows: List[Tuple[str, float]] = []
+
+        for message in messages:
+            rows.append((json.dumps(message.to_dict()), time.time()))
+            if len(rows) >= batch_size:
+                total += self._insert(conn, rows)
+                rows = []
+
+        if rows:
+            total += self._insert(conn, rows)
+
+        return total
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, rows: List[Tuple[str, float]]) -> int:
+        with _transaction(conn):
+            conn.executemany(
+                "INSERT INTO outbox (message, created_at) VALUES (?, ?)", rows
+            )
+        return len(rows)
+
+    # ------------------------------------------------------------------
+    # Claiming and recording
+    # ------------------------------------------------------------------
+
+    def claim(
+        self, limit: int = 100, *, worker: Optional[str] = None
+    ) -> List[OutboxItem]:
+        """
+        Atomically move up to `limit` pending rows to `in_flight` and
+        return them, oldest first.
+        """
+        conn = self._connection()
+        worker = worker or f"{os.getpid()}-{threading.get_ident()}"
+
+        # The write lock is held from SELECT to UPDATE: no two workers
+        # (threads or processes) can claim the same rows.
+        with _transaction(conn):
+            rows = conn.execute(
+                "SELECT id, message, attempts FROM outbox "
+                "WHERE status = ? ORDER BY id LIMIT ?",
+                (OutboxStatus.PENDING, limit),
+            ).fetchall()
+
+            if rows:
+                conn.executemany(
+                    "UPDATE outbox SET status = ?, worker = ?, claimed_at = ?, "
+                    "attempts = attempts + 1 WHERE id = ?",
+                    [(OutboxStatus.IN_FLIGHT, worker, time.time(), r[0]) for r in rows],
+                )
+
+        return [
+            OutboxItem(
+                id=row_id,
+                message=Message.from_dict(json.loads(payload)),
+                attempts=attempts + 1,
+            )
+            for row_id, payload, attempts in rows
+        ]
+
+    def record(self, item_id: int, result: DeliveryResult) -> None:
+        self.record_many([(item_id, result)])
+
+    def record_many(self, outcomes: Iterable[Tuple[int, DeliveryResult]]) -> None:
+        """
+        Store delivery outcomes in a single transaction.
+        """
+        now = time.time()
+        rows = [
+            (
+                OutboxStatus.SENT if result.success else OutboxStatus.FAILED,
+                now,
+                result.provider,
+                result.message_id,
+                result.error.code if result.error else None,
+                result.error.message if result.error else None,
+                item_id,
+            )
+            for item_id, result in outcomes
+        ]
+
+        conn = self._connection()
+        with _transaction(conn):
+            conn.executemany(
+                "UPDATE outbox SET status = ?, finished_at = ?, provider = ?, "
+                "message_id = ?, error_code = ?, error_message = ? WHERE id = ?",
+                rows,
+            )
+
+    def recover(self, *, older_than: Optional[float] = None) -> int:
+        """
+        Return `in_flight` rows to `pending`, e.g. after a crash.
+
+        With `older_than`, only rows claimed more than that many seconds
+        ago are recovered. Returns the number of rows recovered.
+        """
+        query = "UPDATE outbox SET status = ?, worker = NULL WHERE status = ?"
+        params: list = [OutboxStatus.PENDING, OutboxStatus.IN_FLIGHT]
+
+        if older_than is not None:
+            query += " AND claimed_at < ?"
+            params.append(time.time() - older_than)
+
+        conn = self._connection()
+        with _transaction(conn):
+            return conn.execute(query, params).rowcount
+
+    def counts(self) -> Dict[str, int]:
+        rows = self._connection().execute(
+            "SELECT status, COUNT(*) FROM outbox GROUP BY status"
+        )
+        return dict(rows.fetchall())
+
+    # ------------------------------------------------------------------
+    # Draining
+    # ------------------------------------------------------------------
+
+    def drain(
+        self,
+        orchestrator: Orchestrator,
+        *,
+        workers: int = 4,
+        batch_size: int = 100,
+        trace: bool = False,
+    ) -> int:
+        """
+        Deliver all pending messages with `workers` threads and return
+        how many were processed.
+
+        Each worker claims `batch_size` rows, sends them through
+        `orchestrator.send()` and records the outcomes in one transaction.
+        Messages rejected with an exception (e.g. a missing attachment)
+        are recorded as failed with the exception's error code.
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise ValidationError("workers must be an integer >= 1")
+
+        processed = [0] * workers
+        errors: List[BaseException] = []
+        run_id = uuid.uuid4().hex[:8]
+
+        def work(slot: int) -> None:
+            worker = f"{os.getpid()}-{run_id}-{slot}"
+            try:
+                while True:
+                    items = self.claim(batch_size, worker=worker)
+                    if not items:
+                        return
+
+                    self.record_many(
+                        (item.id, _send(orchestrator, item.message, trace))
+                        for item in items
+                    )
+                    processed[slot] += len(items)
+            except BaseException as exc:
+                errors.append(exc)
+
+        threads = [
+            threading.Thread(
+                target=work, args=(slot,), name=f"broadcastio-outbox-{slot}"
+            )
+            for slot in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+        return sum(processed)
+
+
+def _send(orchestrator: Orchestrator, message: Message, trace: bool) -> DeliveryResult:
+    try:
+        return orchestrator.send(message, trace=trace)
+    except BroadcastioError as exc:
+        return DeliveryResult(
+            success=False,
+            provider="none",
+            error=DeliveryError(code=exc.code, message=exc.message),
+        )
+
+
+class _transaction:
+    """
+    Explicit write transaction on an autocommit connection.
+
+    BEGIN IMMEDIATE takes the write lock up front, so concurrent writers
+    wait on `busy_timeout` instead of failing on lock upgrade.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.conn.execute("COMMIT")
+        else:
+            self.conn.execute("ROLLBACK")
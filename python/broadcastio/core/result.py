@@ -21,3 +21,15 @@ class DeliveryResult:
             "error": self.error.to_dict() if self.error else None,
             "trace": self.trace.to_dict() if self.trace else None,
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DeliveryResult":
+        error = data.get("error")
+        trace = data.get("trace")
+        return cls(
+            success=data["success"],
+            provider=data["provider"],
+            message_id=data.get("message_id"),
+            error=DeliveryError.from_dict(error) if error else None,
+            trace=DeliveryTrace.from_dict(trace) if trace else None,
+        )
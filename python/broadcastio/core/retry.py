@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import threading
+import time
 from dataclasses import dataclass
-from typing import Optional, Set
+from typing import Callable, Optional, Set
 
 from broadcastio.core.exceptions import ErrorCode, ValidationError
 
 _ALLOWED_BACKOFFS = {"none", "fixed", "exponential"}
+_ALLOWED_JITTERS = {"none", "full", "equal", "decorrelated"}
 
 
 @dataclass(frozen=True)
@@ -21,6 +24,7 @@ class RetryPolicy:
     base_delay: float = 0.0
     max_delay: Optional[float] = None
     retry_on: Optional[Set[ErrorCode]] = None
+    jitter: str = "none"  # "none" | "full" | "equal" | "decorrelated"
 
     def __post_init__(self) -> None:
         self._validate()
@@ -36,6 +40,12 @@ class RetryPolicy:
                 f"RetryPolicy.backoff must be one of {_ALLOWED_BACKOFFS}"
             )
 
+        # jitter
+        if self.jitter not in _ALLOWED_JITTERS:
+            raise ValidationError(
+                f"RetryPolicy.jitter must be one of {_ALLOWED_JITTERS}"
+            )
+
         # base_delay
         if self.base_delay < 0:
             raise ValidationError("RetryPolicy.base_delay must be >= 0")
@@ -70,3 +80,81 @@ class RetryPolicy:
             return error_code == ErrorCode.PROVIDER_UNAVAILABLE
 
         return error_code in self.retry_on
+
+
+@dataclass(frozen=True)
+class RetryBudget:
+    """
+    Caps retries relative to first attempts, across all providers of an
+    orchestrator.
+
+    Every first attempt earns `ratio` retry tokens and every retry spends
+    one. `min_per_second` tokens are added over time so low traffic can
+    still retry, and at most `max_tokens` are saved up. When the budget
+    is empty, the message stops retrying and falls back as if its
+    attempts were exhausted.
+    """
+
+    ratio: float = 0.1
+    min_per_second: float = 1.0
+    max_tokens: int = 20
+
+    def __post_init__(self) -> None:
+        if self.ratio < 0:
+            raise ValidationError("RetryBudget.ratio must be >= 0")
+
+        if self.min_per_second < 0:
+            raise ValidationError("RetryBudget.min_per_second must be >= 0")
+
+        if not isinstance(self.max_tokens, int) or self.max_tokens < 1:
+            raise ValidationError("RetryBudget.max_tokens must be an integer >= 1")
+
+
+class RetryBudgetTokens:
+    """
+    Thread-safe token balance of a `RetryBudget`. Starts full.
+    """
+
+    def __init__(
+        self,
+        budget: RetryBudget,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.budget = budget
+        self._clock = clock
+        self._tokens = float(budget.max_tokens)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, earned: float) -> None:
+        now = self._clock()
+        tokens = (
+            self._tokens + (now - self._updated) * self.budget.min_per_second + earned
+        )
+        self._tokens = min(tokens, self.budget.max_tokens)
+        self._updated = now
+
+    def deposit(self) -> None:
+        """
+        Record a first attempt.
+        """
+        with self._lock:
+            self._refill(self.budget.ratio)
+
+    def try_withdraw(self) -> bool:
+        """
+        Take a token for one retry. Returns False if the budget is spent.
+        """
+        with self._lock:
+            self._refill(0.0)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill(0.0)
+            return self._tokens
@@ -0,0 +1,277 @@
+import random
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+from broadcastio.core.exceptions import ValidationError
+from broadcastio.core.trace import DeliveryAttempt
+
+
+class RoutingStrategy:
+    """
+    Decides the order in which the selected providers are tried for a
+    message.
+
+    The Orchestrator calls `order()` with the providers left after
+    health and circuit filtering (in constructor order), `on_start()` /
+    `on_finish()` around every provider call, and reports every
+    completed attempt to `observe()`. The base class keeps the given
+    order: plain ordered fallback.
+
+    Implementations must be thread-safe.
+    """
+
+    def order(self, providers: list) -> list:
+        return providers
+
+    def observe(self, attempt: DeliveryAttempt) -> None:
+        pass
+
+    def on_start(self, provider: str) -> None:
+        pass
+
+    def on_finish(self, provider: str) -> None:
+        pass
+
+
+class _ProviderStats:
+    __slots__ = ("latency", "success", "updated")
+
+    def __init__(self, latency: float, success: float, updated: float):
+        self.latency = latency
+        self.success = success
+        self.updated = updated
+
+
+class AdaptiveRouting(RoutingStrategy):
+    """
+    Orders providers by expected cost, learned from observed attempts.
+
+    Keeps an EWMA (weight `alpha` for the newest sample) of latency and
+    success rate per provider. Expected cost is
+    `latency + (1 - success_rate) * failure_cost`, in seconds.
+
+    Providers without samples cost 0, so each one is tried before the
+    averages take over. Averages not updated for `recovery` seconds are
+    dropped: a provider routed around gets tried again eventually.
+
+    `pin` keeps one provider first while its averages stay within
+    `slo_latency` / `slo_success_rate`.
+    """
+
+    def __init__(
+        self,
+        *,
+        alpha: float = 0.2,
+        failure_cost: float = 5.0,
+        recovery: Optional[float] = 60.0,
+        pin: Optional[str] = None,
+        slo_latency: Optional[float] = None,
+        slo_success_rate: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not (0 < alpha <= 1):
+            raise ValidationError("AdaptiveRouting.alpha must be in (0, 1]")
+
+        if failure_cost < 0:
+            raise ValidationError("AdaptiveRouting.failure_cost must be >= 0")
+
+        if recovery is not None and recovery <= 0:
+            raise ValidationError("AdaptiveRouting.recovery must be None or > 0")
+
+        if slo_success_rate is not None and not (0 <= slo_success_rate <= 1):
+            raise ValidationError("AdaptiveRouting.slo_success_rate must be in [0, 1]")
+
+        self.alpha = alpha
+        self.failure_cost = failure_cost
+        self.recovery = recovery
+        self.pin = pin
+        self.slo_latency = slo_latency
+        self.slo_success_rate = slo_success_rate
+        self._clock = clock
+
+        self._stats: Dict[str, _ProviderStats] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, attempt: DeliveryAttempt) -> None:
+        latency = attempt.duration_ms / 1000
+        success = 1.0 if attempt.success else 0.0
+        now = self._clock()
+
+        with self._lock:
+            stats = self._fresh(attempt.provider, now)
+            if stats is None:
+                self._stats[attempt.provider] = _ProviderStats(latency, success, now)
+                return
+
+            alpha = self.alpha
+            stats.latency += alpha * (latency - stats.latency)
+            stats.success += alpha * (success - stats.success)
+            stats.updated = now
+
+    def _fresh(self, name: str, now: float) -> Optional[_ProviderStats]:
+        stats = self._stats.get(name)
+        if stats is None:
+            return None
+        if self.recovery is not None and now - stats.updated > self.recovery:
+            return None
+        return stats
+
+    def _cost(self, name: str, now: float) -> float:
+        stats = self._fresh(name, now)
+        if stats is None:
+            return 0.0
+        return stats.latency + (1 - stats.success) * self.failure_cost
+
+    def _within_slo(self, name: str, now: float) -> bool:
+        stats = self._fresh(name, now)
+        if stats is None:
+            return True
+        if self.slo_latency is not None and stats.latency > self.slo_latency:
+            return False
+        if self.slo_success_rate is not None and stats.success < self.slo_success_rate:
+            return False
+        return True
+
+    def order(self, providers: list) -> list:
+        now = self._clock()
+
+        with self._lock:
+            # sorted() is stable: ties keep constructor order
+            ordered = sorted(providers, key=lambda p: self._cost(p.name, now))
+
+            if self.pin is not None and self._within_slo(self.pin, now):
+                pinned = [p for p in ordered if p.name == self.pin]
+                ordered = pinned + [p for p in ordered if p.name != self.pin]
+
+        return ordered
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Current averages and expected cost per observed provider.
+        """
+        now = self._clock()
+        with self._lock:
+            return {
+                name: {
+                    "latency": stats.latency,
+                    "success_rate": stats.success,
+                    "cost": self._cost(name, now),
+                    "stale": self._fresh(name, now) is None,
+                }
+                for name, stats in self._stats.items()
+            }
+
+
+# ----------------------------------------------------------------------
+# Load balancing
+# ----------------------------------------------------------------------
+
+
+class LoadBalancer(RoutingStrategy):
+    """
+    Base class for strategies that spread traffic across providers.
+
+    `order()` moves the provider picked by `choose()` to the front; the
+    others keep their order and remain the fallback chain. Tracks the
+    number of outstanding (in-flight) calls per provider.
+    """
+
+    def __init__(self):
+        self._outstanding: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def on_start(self, provider: str) -> None:
+        with self._lock:
+            self._outstanding[provider] += 1
+
+    def on_finish(self, provider: str) -> None:
+        with self._lock:
+            self._outstanding[provider] -= 1
+
+    def outstanding(self) -> Dict[str, int]:
+        with self._lock:
+            return {name: n for name, n in self._outstanding.items() if n}
+
+    def choose(self, providers: list):
+        raise NotImplementedError
+
+    def order(self, providers: list) -> list:
+        if len(providers) < 2:
+            return providers
+
+        chosen = self.choose(providers)
+        return [chosen] + [p for p in providers if p is not chosen]
+
+
+class WeightedRoundRobin(LoadBalancer):
+    """
+    Smooth weighted round-robin: with weights `{"wa1": 3, "wa2": 1}`,
+    wa1 goes first for 3 of every 4 messages, interleaved. Providers
+    missing from `weights` weigh 1; weight 0 means fallback only.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, int]] = None):
+        super().__init__()
+
+        for name, weight in (weights or {}).items():
+            if not isinstance(weight, int) or weight < 0:
+                raise ValidationError(
+                    f"WeightedRoundRobin weight for {name!r} must be an integer >= 0"
+                )
+
+        self.weights = dict(weights or {})
+        self._current: Counter = Counter()
+
+    def choose(self, providers: list):
+        with self._lock:
+            total = 0
+            best = None
+            for provider in providers:
+                weight = self.weights.get(provider.name, 1)
+                if weight == 0:
+                    continue
+                self._current[provider.name] += weight
+                total += weight
+                if best is None or (
+                    self._current[provider.name] > self._current[best.name]
+                ):
+                    best = provider
+
+            if best is None:
+                # Only weight-0 providers are available
+                return providers[0]
+
+            self._current[best.name] -= total
+            return best
+
+
+class LeastOutstanding(LoadBalancer):
+    """
+    Picks the provider with the fewest in-flight calls; ties go to the
+    earlier provider.
+    """
+
+    def choose(self, providers: list):
+        with self._lock:
+            return min(providers, key=lambda p: self._outstanding[p.name])
+
+
+class PowerOfTwoChoices(LoadBalancer):
+    """
+    Samples two providers at random and picks the one with fewer
+    in-flight calls. Close to least-outstanding, without every sender
+    piling onto the same momentarily idle provider.
+    """
+
+    def __init__(self, *, rng: Optional[random.Random] = None):
+        super().__init__()
+        self._rng = rng or random.Random()
+
+    def choose(self, providers: list):
+        with self._lock:
+            first, second = self._rng.sample(providers, 2)
+            if self._outstanding[second.name] < self._outstanding[first.name]:
+                return second
+            return first
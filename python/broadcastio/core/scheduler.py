@@ -0,0 +1,126 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import CancelledError, Executor, Future
+from typing import Any, Callable, List, Tuple
+
+
+class RetryScheduler:
+    """
+    Timer heap that runs callbacks after a delay on one timer thread.
+
+    Used to park deliveries between retry attempts instead of sleeping
+    in a worker thread: when the backoff elapses, the delivery is handed
+    back to a worker. Callbacks run on the timer thread and must be
+    quick (e.g. submit to an executor).
+    """
+
+    def __init__(self, *, name: str = "broadcastio-retry-timer"):
+        self.name = name
+
+        # (due, sequence, callback, args)
+        self._heap: List[Tuple[float, int, Callable[..., Any], tuple]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def call_later(self, delay: float, callback: Callable[..., Any], *args) -> None:
+        """
+        Run `callback(*args)` on the timer thread after `delay` seconds.
+        """
+        due = time.monotonic() + max(delay, 0.0)
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("RetryScheduler is closed")
+
+            sequence = next(self._sequence)
+            heapq.heappush(self._heap, (due, sequence, callback, args))
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self.name, daemon=True
+                )
+                self._thread.start()
+            elif self._heap[0][1] == sequence:
+                # New earliest deadline: wake the timer to shorten its wait
+                self._condition.notify()
+
+    def submit_later(
+        self, executor: Executor, delay: float, fn: Callable[..., Any], *args
+    ) -> "Future":
+        """
+        Submit `fn(*args)` to `executor` after `delay` seconds.
+
+        Returns a future for `fn`'s result, usable as soon as this call
+        returns (e.g. with `concurrent.futures.wait`).
+        """
+        future: Future = Future()
+
+        def start() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                inner = executor.submit(fn, *args)
+            except BaseException as exc:
+                future.set_exception(exc)
+                return
+            inner.add_done_callback(lambda done: _copy_outcome(done, future))
+
+        self.call_later(delay, start)
+        return future
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._heap)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if not self._heap:
+                        if self._closed:
+                            return
+                        self._condition.wait()
+                        continue
+
+                    wait = self._heap[0][0] - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._condition.wait(wait)
+
+                _, _, callback, args = heapq.heappop(self._heap)
+
+            try:
+                callback(*args)
+            except Exception:
+                # A failing callback must not stop other timers
+                pass
+
+    def close(self, *, wait: bool = True) -> None:
+        """
+        Stop accepting timers. Timers already scheduled still fire.
+        """
+        with self._condition:
+            self._closed = True
+            thread = self._thread
+            self._condition.notify_all()
+
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+
+def _copy_outcome(source: Future, target: Future) -> None:
+    if source.cancelled():
+        # `target` is already running and can't be cancelled
+        target.set_exception(CancelledError())
+        return
+
+    exc = source.exception()
+    if exc is not None:
+        target.set_exception(exc)
+    else:
+        target.set_result(source.result())
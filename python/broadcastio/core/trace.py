@@ -1,24 +1,132 @@
+import time
 import uuid
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 from broadcastio.core.errors import DeliveryError
 
+# Timestamps are taken with perf_counter_ns() (monotonic, ns resolution),
+# so durations never go negative across NTP steps. They are mapped to
+# wall-clock time through an anchor (wall-clock minus monotonic time)
+# read when a trace starts: the clock offset is never older than the
+# trace, whatever the process uptime, NTP corrections or suspends.
+# Values built from datetimes are wall-clock nanoseconds (anchor 0).
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def wall_anchor_ns() -> int:
+    """
+    Current offset from `perf_counter_ns()` to wall-clock nanoseconds.
+    """
+    return time.time_ns() - time.perf_counter_ns()
+
+
+def _to_datetime(ns: int, anchor_ns: int) -> datetime:
+    # Whole microseconds first: k / 1e6 converts back to exactly k
+    micros = (ns + anchor_ns) // 1000
+    return datetime.fromtimestamp(micros / 1_000_000, timezone.utc)
+
+
+def _from_datetime(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND * 1000
+
 
-@dataclass
 class DeliveryAttempt:
-    provider: str
-    attempt: int
-    started_at: datetime
-    finished_at: datetime
-    success: bool
-    error: Optional[DeliveryError] = None
+    """
+    One provider attempt.
+
+    `started_ns` / `finished_ns` are `time.perf_counter_ns()` readings;
+    `started_at` / `finished_at` are UTC datetimes derived through
+    `anchor_ns` (the trace's anchor, or read on first use when none is
+    given). It can also be built from `started_at` / `finished_at`
+    datetimes.
+
+    Attempts compare equal at the precision they serialize to:
+    wall-clock microseconds and the exact duration.
+    """
+
+    __slots__ = (
+        "provider",
+        "attempt",
+        "success",
+        "error",
+        "started_ns",
+        "finished_ns",
+        "_anchor_ns",
+    )
+
+    def __init__(
+        self,
+        provider: str,
+        attempt: int,
+        started_at: Optional[datetime] = None,
+        finished_at: Optional[datetime] = None,
+        success: bool = False,
+        error: Optional[DeliveryError] = None,
+        *,
+        started_ns: Optional[int] = None,
+        finished_ns: Optional[int] = None,
+        anchor_ns: Optional[int] = None,
+    ):
+        if started_ns is None:
+            anchor_ns = 0
+            started_ns = _from_datetime(started_at)
+            if finished_ns is None and finished_at is not None:
+                finished_ns = _from_datetime(finished_at)
+        if finished_ns is None:
+            finished_ns = started_ns
+
+        self.provider = provider
+        self.attempt = attempt
+        self.success = success
+        self.error = error
+        self.started_ns = started_ns
+        self.finished_ns = finished_ns
+        self._anchor_ns = anchor_ns
+
+    @property
+    def anchor_ns(self) -> int:
+        if self._anchor_ns is None:
+            self._anchor_ns = wall_anchor_ns()
+        return self._anchor_ns
 
     @property
-    def duration_ms(self) -> int:
-        delta = self.finished_at - self.started_at
-        return int(delta.total_seconds() * 1000)
+    def started_at(self) -> datetime:
+        return _to_datetime(self.started_ns, self.anchor_ns)
+
+    @property
+    def finished_at(self) -> datetime:
+        return _to_datetime(self.finished_ns, self.anchor_ns)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.finished_ns - self.started_ns) / 1_000_000
+
+    def _key(self) -> tuple:
+        return (
+            self.provider,
+            self.attempt,
+            self.success,
+            self.error,
+            (self.started_ns + self.anchor_ns) // 1000,
+            self.finished_ns - self.started_ns,
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DeliveryAttempt):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __repr__(self) -> str:
+        return (
+            f"DeliveryAttempt(provider={self.provider!r}, attempt={self.attempt}, "
+            f"success={self.success}, duration_ms={self.duration_ms}, "
+            f"error={self.error!r})"
+        )
 
     def to_dict(self) -> dict:
         return {
@@ -31,27 +139,142 @@ class DeliveryAttempt:
             "error": self.error.to_dict() if self.error else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "DeliveryAttempt":
+        error = data.get("error")
+        started_ns = _from_datetime(datetime.fromisoformat(data["started_at"]))
+
+        # duration_ms keeps sub-microsecond precision; finished_at doesn't
+        duration_ms = data.get("duration_ms")
+        if duration_ms is not None:
+            finished_ns = started_ns + round(duration_ms * 1_000_000)
+        else:
+            finished_ns = _from_datetime(datetime.fromisoformat(data["finished_at"]))
+
+        return cls(
+            provider=data["provider"],
+            attempt=data["attempt"],
+            success=data["success"],
+            error=DeliveryError.from_dict(error) if error else None,
+            started_ns=started_ns,
+            finished_ns=finished_ns,
+            anchor_ns=0,
+        )
+
 
-@dataclass
 class DeliveryTrace:
-    trace_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    finished_at: Optional[datetime] = None
-    success: Optional[bool] = None
-    attempts: List[DeliveryAttempt] = field(default_factory=list)
+    """
+    Attempts made for one message and its final outcome.
+
+    Creating a trace only reads the clocks: `trace_id` is generated on
+    first access and datetimes are derived on demand, through the wall
+    clock anchor (`anchor_ns`) read when the trace starts.
+    """
+
+    __slots__ = (
+        "_trace_id",
+        "success",
+        "attempts",
+        "started_ns",
+        "finished_ns",
+        "anchor_ns",
+    )
+
+    def __init__(
+        self,
+        trace_id: Optional[str] = None,
+        started_at: Optional[datetime] = None,
+        finished_at: Optional[datetime] = None,
+        success: Optional[bool] = None,
+        attempts: Optional[List[DeliveryAttempt]] = None,
+        *,
+        started_ns: Optional[int] = None,
+        finished_ns: Optional[int] = None,
+    ):
+        if started_ns is not None:
+            anchor_ns = wall_anchor_ns()
+        elif started_at is not None:
+            anchor_ns = 0
+            started_ns = _from_datetime(started_at)
+            if finished_ns is None and finished_at is not None:
+                finished_ns = _from_datetime(finished_at)
+        else:
+            # One reading of each clock: the anchor and the start
+            wall_ns = time.time_ns()
+            started_ns = time.perf_counter_ns()
+            anchor_ns = wall_ns - started_ns
+
+        self._trace_id = trace_id
+        self.success = success
+        self.attempts = attempts if attempts is not None else []
+        self.started_ns = started_ns
+        self.finished_ns = finished_ns
+        self.anchor_ns = anchor_ns
+
+    @property
+    def trace_id(self) -> str:
+        if self._trace_id is None:
+            self._trace_id = str(uuid.uuid4())
+        return self._trace_id
+
+    @property
+    def started_at(self) -> datetime:
+        return _to_datetime(self.started_ns, self.anchor_ns)
+
+    @property
+    def finished_at(self) -> Optional[datetime]:
+        if self.finished_ns is None:
+            return None
+        return _to_datetime(self.finished_ns, self.anchor_ns)
 
     def add_attempt(self, attempt: DeliveryAttempt) -> None:
         self.attempts.append(attempt)
 
     def mark_finished(self, *, success: bool) -> None:
         self.success = success
-        self.finished_at = datetime.now(timezone.utc)
+        if self.anchor_ns:
+            self.finished_ns = time.perf_counter_ns()
+        else:
+            # Built from datetimes: timestamps are wall-clock
+            self.finished_ns = time.time_ns()
+
+    def _key(self) -> tuple:
+        return (
+            self.trace_id,
+            self.started_at,
+            self.finished_at,
+            self.success,
+            self.attempts,
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DeliveryTrace):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __repr__(self) -> str:
+        return (
+            f"DeliveryTrace(trace_id={self.trace_id!r}, success={self.success}, "
+            f"attempts={self.attempts!r})"
+        )
 
     def to_dict(self) -> dict:
+        finished_at = self.finished_at
         return {
             "trace_id": self.trace_id,
             "started_at": self.started_at.isoformat(),
-            "finished_at": (self.finished_at.isoformat() if self.finished_at else None),
+            "finished_at": finished_at.isoformat() if finished_at else None,
             "success": self.success,
             "attempts": [a.to_dict() for a in self.attempts],
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DeliveryTrace":
+        finished_at = data.get("finished_at")
+        return cls(
+            trace_id=data["trace_id"],
+            started_at=datetime.fromisoformat(data["started_at"]),
+            finished_at=datetime.fromisoformat(finished_at) if finished_at else None,
+            success=data.get("success"),
+            attempts=[DeliveryAttempt.from_dict(a) for a in data.get("attempts", [])],
+        )
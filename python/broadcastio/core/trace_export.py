@@ -0,0 +1,235 @@
+import json
+import os
+import random
+import threading
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+from broadcastio.core.exceptions import ValidationError
+from broadcastio.core.trace import DeliveryTrace
+
+TraceSink = Callable[[List[dict]], None]
+
+
+class RotatingJsonlSink:
+    """
+    Appends trace records to a JSONL file, one record per line.
+
+    When the file would grow past `max_bytes`, it is renamed to
+    `path.1` (`path.1` to `path.2`, ...) and a new file is started; at
+    most `backup_count` old files are kept.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_bytes: int = 100 * 1024 * 1024,
+        backup_count: int = 5,
+    ):
+        if not isinstance(max_bytes, int) or max_bytes < 1:
+            raise ValidationError("max_bytes must be an integer >= 1")
+
+        if not isinstance(backup_count, int) or backup_count < 0:
+            raise ValidationError("backup_count must be an integer >= 0")
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._file = open(path, "ab")
+        self._size = self._file.tell()
+
+    def __call__(self, records: List[dict]) -> None:
+        data = "".join(
+            json.dumps(record, separators=(",", ":")) + "\n" for record in records
+        ).encode("utf-8")
+
+        if self._size and self._size + len(data) > self.max_bytes:
+            self._rotate()
+
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+
+    def _rotate(self) -> None:
+        self._file.close()
+
+        if self.backup_count == 0:
+            os.remove(self.path)
+        else:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+
+        self._file = open(self.path, "ab")
+        self._size = 0
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class TraceExporter:
+    """
+    Exports delivery traces in the background.
+
+    Passed to `Orchestrator(trace_exporter=...)`. Sampling is decided
+    when a message starts (head-based): `sample_rate` of messages are
+    exported, plus every failed message when `always_export_failures`.
+
+    Finished traces go into a bounded in-memory queue and are never
+    written on the sending thread. A worker thread converts them with
+    `DeliveryTrace.to_dict()` and hands them to `sink` in batches of up
+    to `batch_size`, at least every `flush_interval` seconds. When the
+    queue is full, traces are dropped and counted in `dropped`.
+    """
+
+    def __init__(
+        self,
+        sink: TraceSink,
+        *,
+        sample_rate: float = 1.0,
+        always_export_failures: bool = True,
+        max_queue: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        rng: Optional[random.Random] = None,
+    ):
+        if not (0 <= sample_rate <= 1):
+            raise ValidationError("sample_rate must be in [0, 1]")
+
+        if not isinstance(max_queue, int) or max_queue < 1:
+            raise ValidationError("max_queue must be an integer >= 1")
+
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValidationError("batch_size must be an integer >= 1")
+
+        if flush_interval <= 0:
+            raise ValidationError("flush_interval must be > 0")
+
+        self.sink = sink
+        self.sample_rate = sample_rate
+        self.always_export_failures = always_export_failures
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._random = (rng or random.Random()).random
+
+        self._queue: Deque[DeliveryTrace] = deque()
+        self._wakeup = threading.Event()
+        self._counter_lock = threading.Lock()
+        # Serializes sink calls between the worker and flush()
+        self._sink_lock = threading.Lock()
+        self._dropped = 0
+        self._exported = 0
+        self._failed = 0
+        self._closed = False
+
+        self._thread = threading.Thread(
+            target=self._run, name="broadcastio-trace-exporter", daemon=True
+        )
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Called by the Orchestrator
+    # ------------------------------------------------------------------
+
+    def sample(self) -> bool:
+        """
+        Head-based decision for a new message.
+        """
+        rate = self.sample_rate
+        return rate >= 1 or (rate > 0 and self._random() < rate)
+
+    def export(self, trace: DeliveryTrace) -> bool:
+        """
+        Queue a finished trace. Never blocks; returns False when the
+        trace was dropped.
+        """
+        queue = self._queue
+        if self._closed or len(queue) >= self.max_queue:
+            with self._counter_lock:
+                self._dropped += 1
+            return False
+
+        queue.append(trace)
+        if len(queue) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write every queued trace to the sink now.
+        """
+        queue = self._queue
+        with self._sink_lock:
+            while queue:
+                batch = []
+                while queue and len(batch) < self.batch_size:
+                    batch.append(queue.popleft().to_dict())
+
+                try:
+                    self.sink(batch)
+                except Exception:
+                    # A failing sink must not stop the exporter
+                    with self._counter_lock:
+                        self._failed += len(batch)
+                    continue
+
+                with self._counter_lock:
+                    self._exported += len(batch)
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def exported(self) -> int:
+        return self._exported
+
+    @property
+    def failed(self) -> int:
+        """
+        Traces lost because the sink raised.
+        """
+        return self._failed
+
+    def close(self) -> None:
+        """
+        Stop the worker, flush what is queued and close the sink (if it
+        has a `close()`). Traces exported afterwards are dropped.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+        self.flush()
+
+        close = getattr(self.sink, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "TraceExporter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
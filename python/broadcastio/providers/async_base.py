@@ -0,0 +1,70 @@
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from typing import Optional
+
+from broadcastio.core.health import ProviderHealth
+from broadcastio.core.message import Message
+from broadcastio.core.result import DeliveryResult
+from broadcastio.core.retry import RetryPolicy
+from broadcastio.providers.base import MessageProvider
+
+
+class AsyncMessageProvider(ABC):
+    """
+    Base class for asyncio-native message providers.
+
+    Same contract as `MessageProvider`, with coroutine methods.
+    """
+
+    name: str  # provider identifier, e.g. "whatsapp"
+
+    # Whether attachments must carry a `provider_path`
+    requires_provider_path: bool = True
+
+    @abstractmethod
+    async def send(self, message: Message) -> DeliveryResult:
+        """
+        Send a message through this provider.
+
+        Must return a DeliveryResult.
+        Must NOT raise exceptions for normal failures.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def health(self) -> ProviderHealth:
+        """
+        Return current provider health status.
+        Used by the orchestrator to decide whether to use this provider.
+        """
+        raise NotImplementedError
+
+
+class SyncProviderAdapter(AsyncMessageProvider):
+    """
+    Runs a synchronous `MessageProvider` in an executor.
+
+    Lets existing providers be used by `AsyncOrchestrator` unchanged.
+    """
+
+    def __init__(self, provider: MessageProvider, executor: Optional[Executor] = None):
+        self.provider = provider
+        self.executor = executor
+        self.name = provider.name
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        return getattr(self.provider, "retry_policy", None)
+
+    @property
+    def requires_provider_path(self) -> bool:
+        return getattr(self.provider, "requires_provider_path", True)
+
+    async def send(self, message: Message) -> DeliveryResult:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.provider.send, message)
+
+    async def health(self) -> ProviderHealth:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.provider.health)
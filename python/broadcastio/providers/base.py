@@ -13,6 +13,10 @@ class MessageProvider(ABC):
 
     name: str  # provider identifier, e.g. "whatsapp"
 
+    # Whether attachments must carry a `provider_path`; checked by the
+    # orchestrator before delivery
+    requires_provider_path: bool = True
+
     @abstractmethod
     def send(self, message: Message) -> DeliveryResult:
         """
@@ -1,25 +1,149 @@
+import json
+import mimetypes
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Set, Tuple
+
 import requests
+from requests.adapters import HTTPAdapter
 
-from broadcastio.core.exceptions import ProviderError
+from broadcastio.core.attachment import Attachment, AttachmentCache, map_file
+from broadcastio.core.exceptions import AttachmentError, ProviderError
 from broadcastio.providers.base import MessageProvider
 from broadcastio.core.message import Message
 from broadcastio.core.result import DeliveryResult, DeliveryError
 from broadcastio.core.health import ProviderHealth
 
+_ATTACHMENT_MODES = {"path", "upload"}
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Stand-ins for the per-recipient fields of a broadcast payload template
+_RECIPIENT_MARK = "\x00recipient\x00"
+_REFERENCE_MARK = "\x00reference_id\x00"
+
 
 class WhatsAppProvider(MessageProvider):
+    """
+    Provider backed by the broadcastio Node.js WhatsApp service.
+
+    Owns a pooled `requests.Session`, so connections to the service are
+    kept alive and reused across sends and health probes. Call `close()`
+    (or use the provider as a context manager) to release them.
+
+    Attachments are sent one of two ways (`attachment_mode`):
+
+    - "path": the service reads `Attachment.provider_path` from a volume
+      shared with this process
+    - "upload": the file is streamed once to the service's `/media`
+      endpoint, keyed by its SHA-256, and later sends reference it by
+      hash. `provider_path` is not needed.
+    """
+
     name = "whatsapp"
 
-    def __init__(self, base_url: str, timeout: int = 5):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 5,
+        *,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        session: Optional[requests.Session] = None,
+        attachment_mode: str = "path",
+        attachment_cache: Optional[AttachmentCache] = None,
+    ):
         if not base_url:
             raise ProviderError("WhatsAppProvider base_url is not configured")
 
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ProviderError(
+                "WhatsAppProvider pool_connections and pool_maxsize must be >= 1"
+            )
+
+        if attachment_mode not in _ATTACHMENT_MODES:
+            raise ProviderError(
+                f"WhatsAppProvider attachment_mode must be one of {_ATTACHMENT_MODES}"
+            )
+
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.connect_timeout = (
+            connect_timeout if connect_timeout is not None else timeout
+        )
+        self.read_timeout = read_timeout if read_timeout is not None else timeout
+
+        self._owns_session = session is None
+        self.session = session or self._build_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
+
+        # Upload mode: hashes once per file version, media known to the
+        # service, and uploads in progress shared by concurrent senders
+        self.attachment_mode = attachment_mode
+        self.requires_provider_path = attachment_mode == "path"
+        self.attachment_cache = attachment_cache or AttachmentCache()
+        self._uploaded: Set[str] = set()
+        self._uploads: Dict[str, Future] = {}
+        self._uploads_lock = threading.Lock()
+
+        # Broadcast -> encoded payload around recipient and reference_id
+        self._templates: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def _build_session(
+        *,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+        keep_alive: bool,
+    ) -> requests.Session:
+        session = requests.Session()
+
+        # pool_connections: number of per-host pools kept
+        # pool_maxsize: connections kept alive per host
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+    @property
+    def _timeouts(self):
+        return (self.connect_timeout, self.read_timeout)
+
+    def close(self) -> None:
+        """
+        Release pooled connections. Sessions passed in by the caller are
+        left open.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "WhatsAppProvider":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def health(self) -> ProviderHealth:
         try:
-            resp = requests.get(f"{self.base_url}/health", timeout=self.timeout)
+            resp = self.session.get(f"{self.base_url}/health", timeout=self._timeouts)
             resp.raise_for_status()
             data = resp.json()
 
@@ -30,7 +154,16 @@ class WhatsAppProvider(MessageProvider):
         except Exception as exc:
             return ProviderHealth(provider=self.name, ready=False, details=str(exc))
 
-    def send(self, message: Message) -> DeliveryResult:
+    def stats(self) -> dict:
+        """
+        Counters reported by the service's `/stats` endpoint, e.g.
+        `stats()["media_cache"]["hits"]`. Transport errors raise.
+        """
+        resp = self.session.get(f"{self.base_url}/stats", timeout=self._timeouts)
+        resp.raise_for_status()
+        return resp.json()
+
+    def _payload(self, message: Message) -> dict:
         payload = {
             "recipient": message.recipient,
             "content": message.content,
@@ -43,18 +176,140 @@ class WhatsAppProvider(MessageProvider):
         }
 
         if message.attachment:
-            payload["attachment"] = {
-                "path": message.attachment.provider_path,
-                "filename": message.attachment.filename,
-                "mime_type": message.attachment.mime_type,
-            }
+            payload["attachment"] = self._attachment_payload(message.attachment)
+
+        return payload
+
+    def _encode(self, message: Message) -> bytes:
+        """
+        JSON request body for `message`.
+
+        Messages of a `Broadcast` share everything but the recipient and
+        the reference_id, so the payload is encoded once per broadcast and
+        only those two fields are encoded per message.
+        """
+        broadcast = getattr(message, "broadcast", None)
+        if broadcast is None:
+            return json.dumps(self._payload(message)).encode()
 
-        resp = requests.post(
-            f"{self.base_url}/send", json=payload, timeout=self.timeout
+        template = self._templates.get(broadcast)
+        if template is None:
+            template = self._templates[broadcast] = self._template(message)
+        elif message.attachment and self.attachment_mode == "upload":
+            # Re-uploads if the media was forgotten after a failed send
+            self.upload(message.attachment.host_path)
+
+        if not template:
+            return json.dumps(self._payload(message)).encode()
+
+        head, middle, tail = template
+        return b"".join(
+            (
+                head,
+                json.dumps(message.recipient).encode(),
+                middle,
+                json.dumps(message.metadata.reference_id).encode(),
+                tail,
+            )
         )
+
+    def _template(self, message: Message) -> Tuple[bytes, ...]:
+        payload = self._payload(message)
+        if payload["metadata"]["reference_id"] != message.metadata.reference_id:
+            # Overridden through metadata.extra: nothing to substitute
+            return ()
+
+        payload["recipient"] = _RECIPIENT_MARK
+        payload["metadata"]["reference_id"] = _REFERENCE_MARK
+        encoded = json.dumps(payload).encode()
+
+        recipient = json.dumps(_RECIPIENT_MARK).encode()
+        reference = json.dumps(_REFERENCE_MARK).encode()
+        if encoded.count(recipient) != 1 or encoded.count(reference) != 1:
+            return ()
+
+        head, rest = encoded.split(recipient)
+        if reference in head:
+            return ()
+        middle, tail = rest.split(reference)
+        return head, middle, tail
+
+    def _attachment_payload(self, attachment: Attachment) -> dict:
+        if self.attachment_mode == "path":
+            if not attachment.provider_path:
+                raise AttachmentError("Attachment provider_path is required")
+            return {
+                "path": attachment.provider_path,
+                "filename": attachment.filename,
+                "mime_type": attachment.mime_type,
+            }
+
+        return {
+            "media_id": self.upload(attachment.host_path),
+            "filename": attachment.filename,
+            "mime_type": attachment.mime_type
+            or mimetypes.guess_type(attachment.filename or attachment.host_path)[0],
+        }
+
+    def upload(self, host_path: str) -> str:
+        """
+        Make sure the service stores the file at `host_path` and return
+        its media ID (hex SHA-256).
+
+        Each file version is uploaded at most once: known media is
+        skipped, media already on the service (`HEAD /media/<id>`) is not
+        sent again, and concurrent callers share one upload.
+        """
+        media_id = self.attachment_cache.sha256(host_path)
+        if media_id in self._uploaded:
+            return media_id
+
+        with self._uploads_lock:
+            flight = self._uploads.get(media_id)
+            leader = flight is None
+            if leader:
+                flight = self._uploads[media_id] = Future()
+
+        if not leader:
+            return flight.result()
+
+        try:
+            url = f"{self.base_url}/media/{media_id}"
+            resp = self.session.head(url, timeout=self._timeouts)
+            if resp.status_code == 404:
+                self._put_media(url, host_path)
+            else:
+                resp.raise_for_status()
+
+            self._uploaded.add(media_id)
+            flight.set_result(media_id)
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        finally:
+            with self._uploads_lock:
+                self._uploads.pop(media_id, None)
+
+        return media_id
+
+    def _put_media(self, url: str, host_path: str) -> None:
+        # The memory map is streamed by the HTTP client in blocks: the
+        # file is never read into memory as a whole
+        with open(host_path, "rb") as fh, map_file(fh) as data:
+            resp = self.session.put(
+                url,
+                data=data,
+                headers={"Content-Type": "application/octet-stream"},
+                timeout=self._timeouts,
+            )
         resp.raise_for_status()
-        data = resp.json()
 
+    def _forget_uploads(self) -> None:
+        # The service may have lost its media (e.g. restarted without a
+        # volume): check again before the next send
+        self._uploaded.clear()
+
+    def _parse_result(self, data: dict) -> DeliveryResult:
         if data.get("success"):
             return DeliveryResult(
                 success=True,
@@ -71,3 +326,43 @@ class WhatsAppProvider(MessageProvider):
                 message=error.get("message", "Unknown error"),
             ),
         )
+
+    def send(self, message: Message) -> DeliveryResult:
+        uploaded = message.attachment is not None and self.attachment_mode == "upload"
+        try:
+            resp = self.session.post(
+                f"{self.base_url}/send",
+                data=self._encode(message),
+                headers=_JSON_HEADERS,
+                timeout=self._timeouts,
+            )
+            resp.raise_for_status()
+            result = self._parse_result(resp.json())
+        except Exception:
+            if uploaded:
+                self._forget_uploads()
+            raise
+
+        if uploaded and not result.success:
+            self._forget_uploads()
+        return result
+
+    def send_batch(self, messages: List[Message]) -> List[DeliveryResult]:
+        """
+        Send several messages in one request to `/send/batch`.
+
+        Returns one DeliveryResult per message, in order. Transport
+        errors raise, exactly like `send()`.
+
+        The service sends the items one after another, so the read
+        timeout is `read_timeout` per message.
+        """
+        body = b",".join(self._encode(message) for message in messages)
+        resp = self.session.post(
+            f"{self.base_url}/send/batch",
+            data=b'{"messages":[' + body + b"]}",
+            headers=_JSON_HEADERS,
+            timeout=(self.connect_timeout, self.read_timeout * len(messages)),
+        )
+        resp.raise_for_status()
+        return [self._parse_result(item) for item in resp.json().get("results", [])]
@@ -1,3 +1,7 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 from broadcastio.core.exceptions import ErrorCode
 from broadcastio.core.health import ProviderHealth
 from broadcastio.core.result import DeliveryError, DeliveryResult
@@ -34,3 +38,115 @@ class FlakyProvider(MessageProvider):
             provider=self.name,
             message_id="ok",
         )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Room for bursts of concurrent connections (the default backlog is 5)
+    request_queue_size = 128
+
+
+class StubWhatsAppService:
+    """
+    Minimal in-process stand-in for the Node WhatsApp service.
+
+    Speaks HTTP/1.1 with keep-alive and records every request and the
+    client address (one per TCP connection) it came from. Files uploaded
+    to `/media/<id>` are kept in `media`.
+    """
+
+    def __init__(self, routes=None):
+        self.requests = []
+        self.media = {}
+        self.clients = set()
+        self.routes = {
+            ("GET", "/health"): lambda body: (200, {"ready": True}),
+            ("POST", "/send"): lambda body: (
+                200,
+                {"success": True, "message_id": f"wa-{body['recipient']}"},
+            ),
+        }
+        self.routes.update(routes or {})
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self, method):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                if raw and self.headers.get("Content-Type") == "application/json":
+                    body = json.loads(raw)
+                else:
+                    body = raw or None
+
+                stub.requests.append((method, self.path, body))
+                stub.clients.add(self.client_address)
+
+                route = stub.routes.get((method, self.path))
+                if route:
+                    status, data = route(body)
+                elif self.path.startswith("/media/"):
+                    status, data = stub._media(method, self.path[7:], body)
+                else:
+                    status, data = 404, {"error": "not found"}
+
+                # Raw bytes go out as-is, e.g. to send a malformed body
+                encoded = data if isinstance(data, bytes) else json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                if method != "HEAD":
+                    self.wfile.write(encoded)
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+            def do_HEAD(self):
+                self._handle("HEAD")
+
+            def do_PUT(self):
+                self._handle("PUT")
+
+        self.server = _StubServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.05,), daemon=True
+        )
+
+    def _media(self, method, media_id, body):
+        if method == "PUT":
+            self.media[media_id] = body or b""
+            return 201, {"media_id": media_id}
+        if media_id in self.media:
+            return 200, {"media_id": media_id}
+        return 404, {"error": "not found"}
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from tests.helpers import FlakyProvider
+
+from broadcastio.core.async_orchestrator import AsyncOrchestrator
+from broadcastio.core.exceptions import ErrorCode, ValidationError
+from broadcastio.core.health import ProviderHealth
+from broadcastio.core.message import Message
+from broadcastio.core.result import DeliveryError, DeliveryResult
+from broadcastio.core.retry import RetryPolicy
+from broadcastio.providers.async_base import AsyncMessageProvider
+from broadcastio.providers.dummy import DummyProvider
+
+
+class AsyncEchoProvider(AsyncMessageProvider):
+    name = "async_echo"
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    async def health(self) -> ProviderHealth:
+        return ProviderHealth(provider=self.name, ready=True)
+
+    async def send(self, message):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return DeliveryResult(
+            success=True,
+            provider=self.name,
+            message_id=message.content,
+        )
+
+
+class AsyncDownProvider(AsyncMessageProvider):
+    name = "async_down"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def health(self) -> ProviderHealth:
+        return ProviderHealth(provider=self.name, ready=True)
+
+    async def send(self, message):
+        self.calls += 1
+        return DeliveryResult(
+            success=False,
+            provider=self.name,
+            error=DeliveryError(
+                code=ErrorCode.PROVIDER_UNAVAILABLE,
+                message="down",
+            ),
+        )
+
+
+def test_async_send_with_async_provider():
+    orch = AsyncOrchestrator([AsyncEchoProvider()])
+
+    result = asyncio.run(orch.send(Message(recipient="123", content="hi"), trace=True))
+
+    assert result.success
+    assert result.message_id == "hi"
+    assert len(result.trace.attempts) == 1
+
+
+def test_async_send_adapts_sync_provider():
+    orch = AsyncOrchestrator([DummyProvider()])
+
+    result = asyncio.run(orch.send(Message(recipient="123", content="hi")))
+
+    assert result.success
+    assert result.provider == "dummy"
+
+
+def test_async_retry_then_fallback():
+    primary = AsyncDownProvider()
+    fallback = FlakyProvider(fail_times=1)
+
+    orch = AsyncOrchestrator(
+        [primary, fallback],
+        retry_policy=RetryPolicy(max_attempts=2, backoff="fixed", base_delay=0.01),
+    )
+
+    result = asyncio.run(orch.send(Message(recipient="123", content="hi"), trace=True))
+
+    assert result.success
+    assert primary.calls == 2
+    assert fallback.calls == 2
+    assert [a.attempt for a in result.trace.attempts] == [1, 2, 1, 2]
+
+
+def test_async_send_many_order_and_concurrency_cap():
+    provider = AsyncEchoProvider(delay=0.01)
+    orch = AsyncOrchestrator([provider], max_concurrency=4)
+
+    messages = [Message(recipient="123", content=str(i)) for i in range(20)]
+    results = asyncio.run(orch.send_many(messages))
+
+    assert [r.message_id for r in results] == [str(i) for i in range(20)]
+    assert 1 < provider.max_active <= 4
+
+
+def test_async_validation_error_raises():
+    orch = AsyncOrchestrator([AsyncEchoProvider()])
+
+    with pytest.raises(ValidationError):
+        asyncio.run(orch.send(Message(recipient="", content="hi")))
+
+
+def test_async_rejects_invalid_max_concurrency():
+    with pytest.raises(ValidationError):
+        AsyncOrchestrator([AsyncEchoProvider()], max_concurrency=0)
@@ -0,0 +1,128 @@
+import hashlib
+import os
+import tempfile
+
+import pytest
+
+from broadcastio.core.attachment import Attachment, AttachmentCache
+from broadcastio.core.exceptions import AttachmentError
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from tests.helpers import FakeClock, FlakyProvider
+
+
+@pytest.fixture
+def report():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "report.xlsx")
+        with open(path, "wb") as fh:
+            fh.write(b"quarterly numbers")
+        yield path
+
+
+def test_check_is_cached_within_ttl(report):
+    clock = FakeClock()
+    cache = AttachmentCache(ttl=5, clock=clock)
+
+    first = cache.check(report)
+    for _ in range(100):
+        assert cache.check(report) == first
+
+    assert first.size == len(b"quarterly numbers")
+    assert cache.stat_calls == 1
+    assert cache.hits == 100
+
+
+def test_missing_file_is_not_cached(report):
+    cache = AttachmentCache()
+
+    assert cache.check(report + ".missing") is None
+    assert cache.check(os.path.dirname(report)) is None
+    assert len(cache) == 0
+
+
+def test_unchanged_file_keeps_its_hash_after_ttl(report):
+    clock = FakeClock()
+    cache = AttachmentCache(ttl=5, clock=clock)
+
+    digest = cache.sha256(report)
+    clock.now = 10
+    assert cache.sha256(report) == digest
+
+    assert digest == hashlib.sha256(b"quarterly numbers").hexdigest()
+    assert cache.stat_calls == 2
+    assert cache.hashes == 1
+
+
+def test_changed_file_is_revalidated_after_ttl(report):
+    clock = FakeClock()
+    cache = AttachmentCache(ttl=5, clock=clock)
+    cache.sha256(report)
+
+    with open(report, "ab") as fh:
+        fh.write(b" (revised)")
+
+    # Within the TTL the cached version is still served
+    assert cache.check(report).size == len(b"quarterly numbers")
+
+    clock.now = 10
+    assert cache.check(report).size == len(b"quarterly numbers (revised)")
+    assert cache.sha256(report) == (
+        hashlib.sha256(b"quarterly numbers (revised)").hexdigest()
+    )
+    assert cache.hashes == 2
+
+
+def test_deleted_file_detected_after_ttl(report):
+    clock = FakeClock()
+    cache = AttachmentCache(ttl=5, clock=clock)
+    cache.check(report)
+    os.remove(report)
+
+    clock.now = 10
+    assert cache.check(report) is None
+    with pytest.raises(AttachmentError):
+        cache.sha256(report)
+
+
+def test_least_recently_used_paths_evicted(report):
+    cache = AttachmentCache(max_entries=1)
+    other = report + ".copy"
+    with open(other, "wb") as fh:
+        fh.write(b"x")
+
+    cache.check(report)
+    cache.check(other)
+
+    assert len(cache) == 1
+    assert cache.check(other) is not None
+    assert cache.stat_calls == 2
+
+
+def test_orchestrator_validates_repeated_attachment_once(report):
+    cache = AttachmentCache()
+    orch = Orchestrator([FlakyProvider(fail_times=0)], attachment_cache=cache)
+    attachment = Attachment(host_path=report, provider_path="/shared/report.xlsx")
+    messages = [
+        Message(recipient=str(i), content="", attachment=attachment) for i in range(200)
+    ]
+
+    results = orch.send_many(messages, max_workers=4)
+
+    assert all(r.success for r in results)
+    # Workers racing the first lookup may each stat once
+    assert cache.stat_calls <= 4
+
+
+def test_orchestrator_rejects_missing_attachment(report):
+    orch = Orchestrator(
+        [FlakyProvider(fail_times=0)], attachment_cache=AttachmentCache()
+    )
+    message = Message(
+        recipient="1",
+        content="",
+        attachment=Attachment(host_path=report + ".missing", provider_path="/x"),
+    )
+
+    with pytest.raises(AttachmentError):
+        orch.send(message)
@@ -0,0 +1,125 @@
+import os
+import tempfile
+
+import pytest
+
+from broadcastio.core.attachment import Attachment, AttachmentCache
+from broadcastio.core.broadcast import Broadcast, BroadcastMessage
+from broadcastio.core.exceptions import AttachmentError, ValidationError
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.providers.whatsapp import WhatsAppProvider
+from tests.helpers import FlakyProvider, StubWhatsAppService
+
+
+@pytest.fixture
+def report():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "report.pdf")
+        with open(path, "wb") as fh:
+            fh.write(b"%PDF")
+        yield path
+
+
+def test_messages_share_content_and_number_reference_ids():
+    broadcast = Broadcast(
+        "x" * 10_000,
+        ["a", "b", "c"],
+        metadata={"reference_id": "campaign-7", "tags": ["promo"], "team": "ops"},
+    )
+
+    messages = list(broadcast)
+
+    assert [m.recipient for m in messages] == ["a", "b", "c"]
+    assert [m.metadata.reference_id for m in messages] == [
+        "campaign-7:0",
+        "campaign-7:1",
+        "campaign-7:2",
+    ]
+    assert all(isinstance(m, BroadcastMessage) for m in messages)
+    assert all(m.content is broadcast.content for m in messages)
+    assert all(m.metadata.tags is broadcast.metadata.tags for m in messages)
+    assert messages[2].metadata.extra == {"team": "ops"}
+
+
+def test_broadcast_requires_content_or_attachment():
+    with pytest.raises(ValidationError):
+        Broadcast("", ["a"])
+
+    with pytest.raises(ValidationError):
+        Broadcast("hello", "a")
+
+
+def test_recipients_are_consumed_lazily():
+    consumed = []
+
+    def recipients():
+        for i in range(1000):
+            consumed.append(i)
+            yield str(i)
+
+    orch = Orchestrator([FlakyProvider(fail_times=0)])
+    stream = orch.iter_send_many(Broadcast("hello", recipients()), max_workers=2)
+
+    next(stream)
+    assert len(consumed) < 1000
+
+    results = dict(stream)
+    assert len(results) == 999
+
+
+def test_attachment_checked_once_for_all_recipients(report):
+    cache = AttachmentCache()
+    orch = Orchestrator([FlakyProvider(fail_times=0)], attachment_cache=cache)
+    broadcast = Broadcast(
+        "", [str(i) for i in range(100)], attachment=Attachment(report, "/x")
+    )
+
+    results = orch.send_many(broadcast, max_workers=4)
+
+    assert len(results) == 100 and all(r.success for r in results)
+    assert cache.stat_calls + cache.hits == 1
+
+
+def test_missing_attachment_fails_before_any_send(report):
+    provider = FlakyProvider(fail_times=0)
+    broadcast = Broadcast("", ["1"], attachment=Attachment(report + ".gone", "/x"))
+
+    with pytest.raises(AttachmentError):
+        Orchestrator([provider]).send_many(broadcast)
+
+    assert provider.calls == 0
+
+
+def test_empty_recipient_is_rejected():
+    with pytest.raises(ValidationError):
+        Orchestrator([FlakyProvider(fail_times=0)]).send_many(
+            Broadcast("hello", ["1", ""])
+        )
+
+
+def test_whatsapp_payload_matches_individual_messages():
+    broadcast = Broadcast(
+        'quote " and é', ["1", "2", "3"], metadata={"priority": 8, "team": "ops"}
+    )
+    routes = {
+        ("POST", "/send/batch"): lambda body: (
+            200,
+            {"results": [{"success": True} for _ in body["messages"]]},
+        )
+    }
+
+    with StubWhatsAppService(routes) as service:
+        with WhatsAppProvider(service.url) as wa:
+            results = Orchestrator([wa]).send_many(broadcast, batch_size=50)
+            single = wa.send(next(iter(Broadcast("solo", ["9"]))))
+            # Recipients are a list, so the broadcast can be iterated again
+            expected = [
+                wa._payload(Message(m.recipient, m.content, m.metadata))
+                for m in broadcast
+            ]
+
+    assert all(r.success for r in results) and single.success
+    bodies = {path: body for method, path, body in service.requests if body}
+    assert bodies["/send/batch"]["messages"] == expected
+    assert bodies["/send"]["recipient"] == "9"
@@ -0,0 +1,208 @@
+import csv
+import json
+import os
+import tempfile
+
+import pytest
+
+from broadcastio.core.campaign import (
+    Campaign,
+    normalize_recipient,
+    read_rows,
+)
+from broadcastio.core.exceptions import ValidationError
+from broadcastio.core.idempotency import MemoryIdempotencyStore
+from broadcastio.core.orchestrator import Orchestrator
+from tests.helpers import FlakyProvider
+
+
+@pytest.fixture
+def tmp():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=["phone", "name"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _read_jsonl(path):
+    with open(path, encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh]
+
+
+def test_normalize_recipient():
+    assert normalize_recipient(" +62 (812) 345-678 ") == "62812345678"
+    assert normalize_recipient(62812345678) == "62812345678"
+    assert normalize_recipient("12345@c.us") == "12345@c.us"
+    assert normalize_recipient("n/a") is None
+    assert normalize_recipient("") is None
+    assert normalize_recipient(None) is None
+
+
+def test_read_rows_streams_jsonl(tmp):
+    path = os.path.join(tmp, "recipients.jsonl")
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write('{"phone": "1"}\n\n{"phone": "2"}\n')
+
+    rows = read_rows(path)
+
+    assert next(rows) == {"phone": "1"}
+    assert list(rows) == [{"phone": "2"}]
+
+
+def test_unknown_format_rejected(tmp):
+    with pytest.raises(ValidationError):
+        list(read_rows(os.path.join(tmp, "recipients.txt")))
+
+
+def test_run_dedupes_and_writes_results(tmp):
+    source = os.path.join(tmp, "recipients.csv")
+    output = os.path.join(tmp, "results.jsonl")
+    _write_csv(
+        source,
+        [
+            {"phone": "+1 555 0100", "name": "Ann"},
+            {"phone": "1-555-0100", "name": "Ann again"},
+            {"phone": "", "name": "Nobody"},
+            {"phone": "1 555 0101", "name": "Bob"},
+        ],
+    )
+
+    campaign = Campaign(
+        Orchestrator([FlakyProvider(fail_times=0)]),
+        "hello",
+        recipient_field="phone",
+        campaign_id="c1",
+    )
+    summary = campaign.run(source, output)
+
+    assert (summary.rows, summary.invalid, summary.duplicates) == (4, 1, 1)
+    assert (summary.sent, summary.failed) == (2, 0)
+
+    records = sorted(_read_jsonl(output), key=lambda r: r["index"])
+    assert [(r["index"], r["recipient"]) for r in records] == [
+        (0, "15550100"),
+        (1, "15550101"),
+    ]
+    assert all(r["success"] and r["provider"] == "flaky" for r in records)
+
+
+def test_content_built_per_row_and_csv_output(tmp):
+    source = os.path.join(tmp, "recipients.csv")
+    output = os.path.join(tmp, "results.csv")
+    _write_csv(
+        source, [{"phone": "101", "name": "Ann"}, {"phone": "102", "name": "Bob"}]
+    )
+
+    sent = []
+
+    class Recording(FlakyProvider):
+        def send(self, message):
+            sent.append((message.content, message.metadata.reference_id))
+            return super().send(message)
+
+    campaign = Campaign(
+        Orchestrator([Recording(fail_times=0)]),
+        lambda row: f"Hi {row['name']}",
+        recipient_field="phone",
+        campaign_id="c2",
+        batch_size=None,
+    )
+    campaign.run(source, output)
+
+    assert sorted(sent) == [("Hi Ann", "c2:101"), ("Hi Bob", "c2:102")]
+    with open(output, newline="", encoding="utf-8") as fh:
+        records = list(csv.DictReader(fh))
+    assert sorted(r["recipient"] for r in records) == ["101", "102"]
+
+
+def test_bad_rows_are_counted_not_fatal(tmp):
+    source = os.path.join(tmp, "recipients.csv")
+    output = os.path.join(tmp, "results.jsonl")
+    _write_csv(
+        source,
+        [{"phone": str(100 + i), "name": f"n{i}"} for i in range(20)]
+        + [{"phone": "200", "name": ""}, {"phone": "201", "name": "boom"}]
+        + [{"phone": str(300 + i), "name": f"m{i}"} for i in range(20)],
+    )
+
+    def content(row):
+        if row["name"] == "boom":
+            raise KeyError("code")
+        return row["name"]
+
+    campaign = Campaign(
+        Orchestrator([FlakyProvider(fail_times=0)]),
+        content,
+        recipient_field="phone",
+        max_workers=2,
+    )
+    summary = campaign.run(source, output)
+
+    assert (summary.rows, summary.invalid, summary.sent) == (42, 2, 40)
+    records = _read_jsonl(output)
+    assert sorted(r["index"] for r in records) == list(range(40))
+    assert {"200", "201"}.isdisjoint(r["recipient"] for r in records)
+
+
+def test_rows_are_consumed_lazily():
+    consumed = []
+
+    def rows():
+        for i in range(10_000):
+            consumed.append(i)
+            yield {"recipient": str(i)}
+
+    campaign = Campaign(
+        Orchestrator([FlakyProvider(fail_times=0)]), "hello", max_workers=2
+    )
+    results = campaign.iter_results(rows())
+
+    next(results)
+    assert len(consumed) < 1000
+
+    assert sum(1 for _ in results) == 9_999
+
+
+def test_rerun_with_idempotency_skips_delivered(tmp):
+    source = os.path.join(tmp, "recipients.csv")
+    _write_csv(source, [{"phone": str(i), "name": ""} for i in range(5)])
+
+    provider = FlakyProvider(fail_times=0)
+    orch = Orchestrator([provider], idempotency=MemoryIdempotencyStore())
+
+    for run in range(2):
+        Campaign(orch, "hello", recipient_field="phone", campaign_id="c3").run(
+            source, os.path.join(tmp, f"results-{run}.jsonl")
+        )
+
+    assert provider.calls == 5
+
+
+def test_rerun_after_fixing_a_row_keeps_keys_per_recipient(tmp):
+    source = os.path.join(tmp, "recipients.csv")
+    sent = []
+
+    class Recording(FlakyProvider):
+        def send(self, message):
+            sent.append((message.recipient, message.metadata.reference_id))
+            return super().send(message)
+
+    orch = Orchestrator([Recording(fail_times=0)], idempotency=MemoryIdempotencyStore())
+
+    _write_csv(source, [{"phone": "bad", "name": ""}, {"phone": "222", "name": ""}])
+    Campaign(orch, "hello", recipient_field="phone", campaign_id="c4").run(
+        source, os.path.join(tmp, "first.jsonl")
+    )
+
+    # The fixed row now comes first: positions shift, keys must not
+    _write_csv(source, [{"phone": "111", "name": ""}, {"phone": "222", "name": ""}])
+    Campaign(orch, "hello", recipient_field="phone", campaign_id="c4").run(
+        source, os.path.join(tmp, "second.jsonl")
+    )
+
+    assert sent == [("222", "c4:222"), ("111", "c4:111")]
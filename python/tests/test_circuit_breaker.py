@@ -0,0 +1,166 @@
+import time
+
+import pytest
+
+from tests.helpers import FakeClock, FlakyProvider
+
+from broadcastio.core.circuit import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitState,
+)
+from broadcastio.core.exceptions import ErrorCode, ValidationError
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.retry import RetryPolicy
+from broadcastio.providers.dummy import DummyProvider
+
+
+def _breaker(**policy):
+    clock = FakeClock()
+    changes = []
+    breaker = CircuitBreaker(
+        "p",
+        CircuitBreakerPolicy(**policy),
+        on_change=changes.append,
+        clock=clock,
+    )
+    return breaker, clock, changes
+
+
+def test_opens_after_consecutive_failures():
+    breaker, _, changes = _breaker(failure_threshold=3, failure_rate_threshold=None)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.allow() is False
+    assert [(c.previous, c.current) for c in changes] == [("closed", "open")]
+
+
+def test_opens_on_failure_rate():
+    breaker, _, _ = _breaker(
+        failure_threshold=100,
+        failure_rate_threshold=0.5,
+        window_size=10,
+        min_calls=4,
+    )
+
+    for success in (True, False, True, False):
+        breaker.record(success)
+
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_half_open_limits_trials_and_closes_on_success():
+    breaker, clock, changes = _breaker(
+        failure_threshold=1, cooldown=10, half_open_max_calls=2
+    )
+    breaker.record_failure()
+
+    clock.now = 10
+    assert breaker.allow() is True
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    breaker.record_success()
+    breaker.record_success()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert [c.current for c in changes] == ["open", "half_open", "closed"]
+
+
+def test_half_open_failure_reopens():
+    breaker, clock, _ = _breaker(failure_threshold=1, cooldown=10)
+    breaker.record_failure()
+
+    clock.now = 10
+    assert breaker.allow() is True
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.allow() is False
+
+
+def test_invalid_policy_raises():
+    with pytest.raises(ValidationError):
+        CircuitBreakerPolicy(failure_rate_threshold=1.5)
+
+    with pytest.raises(ValidationError):
+        CircuitBreakerPolicy(window_size=5, min_calls=10)
+
+
+def test_open_provider_is_skipped_without_retries():
+    primary = FlakyProvider(fail_times=1000)
+    changes = []
+
+    orch = Orchestrator(
+        [primary, DummyProvider()],
+        retry_policy=RetryPolicy(max_attempts=3, backoff="fixed", base_delay=0.05),
+        circuit_breaker=CircuitBreakerPolicy(
+            failure_threshold=2, failure_rate_threshold=None, cooldown=60
+        ),
+        on_circuit_change=changes.append,
+    )
+
+    # Second failure opens the circuit: no third retry, no sleep
+    result = orch.send(Message(recipient="1", content="hi"), trace=True)
+    assert result.provider == "dummy"
+    assert primary.calls == 2
+
+    started = time.perf_counter()
+    for _ in range(5):
+        result = orch.send(Message(recipient="1", content="hi"), trace=True)
+        assert result.provider == "dummy"
+        assert [a.provider for a in result.trace.attempts] == ["dummy"]
+
+    assert primary.calls == 2
+    assert time.perf_counter() - started < 0.05
+    assert [c.current for c in changes] == ["open"]
+    assert orch.health_snapshot()["flaky"].circuit == CircuitState.OPEN
+
+
+def test_half_open_trial_closes_circuit_after_recovery():
+    primary = FlakyProvider(fail_times=1)
+
+    orch = Orchestrator(
+        [primary, DummyProvider()],
+        circuit_breaker=CircuitBreakerPolicy(
+            failure_threshold=1, failure_rate_threshold=None, cooldown=0.05
+        ),
+    )
+
+    assert orch.send(Message(recipient="1", content="hi")).provider == "dummy"
+    assert orch.health_snapshot()["flaky"].circuit == CircuitState.OPEN
+
+    time.sleep(0.06)
+
+    assert orch.send(Message(recipient="1", content="hi")).provider == "flaky"
+    assert orch.health_snapshot()["flaky"].circuit == CircuitState.CLOSED
+
+
+def test_all_circuits_open_fails_fast():
+    orch = Orchestrator(
+        [FlakyProvider(fail_times=1000)],
+        circuit_breaker=CircuitBreakerPolicy(
+            failure_threshold=1, failure_rate_threshold=None, cooldown=60
+        ),
+    )
+
+    orch.send(Message(recipient="1", content="hi"))
+    result = orch.send(Message(recipient="1", content="hi"))
+
+    assert not result.success
+    assert result.error.code == ErrorCode.CIRCUIT_OPEN
+
+
+def test_logical_failures_do_not_trip_circuit():
+    breaker, _, _ = _breaker(failure_threshold=1)
+    policy = breaker.policy
+
+    assert policy.is_failure(ErrorCode.PROVIDER_UNAVAILABLE)
+    assert not policy.is_failure("WHATSAPP_REJECTED")
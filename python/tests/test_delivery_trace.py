@@ -1,9 +1,12 @@
+import time
+from datetime import datetime, timedelta, timezone
+
 from broadcastio.core.exceptions import ErrorCode
 from broadcastio.core.health import ProviderHealth
 from broadcastio.core.message import Message
 from broadcastio.core.orchestrator import Orchestrator
 from broadcastio.core.result import DeliveryError, DeliveryResult
-from broadcastio.core.trace import DeliveryTrace
+from broadcastio.core.trace import DeliveryAttempt, DeliveryTrace
 from broadcastio.providers.base import MessageProvider
 from broadcastio.providers.dummy import DummyProvider
 
@@ -113,3 +116,64 @@ def test_delivery_trace_serialization():
     assert "started_at" in data
     assert "finished_at" in data
     assert isinstance(data["attempts"], list)
+
+
+def test_attempt_duration_is_monotonic_and_sub_millisecond():
+    orch = Orchestrator([DummyProvider()])
+
+    result = orch.send(Message(recipient="test", content="hello"), trace=True)
+
+    attempt = result.trace.attempts[0]
+    assert isinstance(attempt.duration_ms, float)
+    assert attempt.duration_ms >= 0
+    assert attempt.finished_at >= attempt.started_at
+    assert attempt.started_at.tzinfo is not None
+
+
+def test_attempt_from_datetimes():
+    started = datetime(2025, 1, 10, 10, 12, tzinfo=timezone.utc)
+    attempt = DeliveryAttempt(
+        provider="wa",
+        attempt=1,
+        started_at=started,
+        finished_at=started + timedelta(milliseconds=500),
+        success=True,
+    )
+
+    assert attempt.duration_ms == 500
+    assert attempt.started_at == started
+    assert attempt.to_dict()["started_at"] == "2025-01-10T10:12:00+00:00"
+
+
+def test_trace_is_slotted_and_lazy():
+    trace = DeliveryTrace()
+
+    assert not hasattr(trace, "__dict__")
+    assert trace._trace_id is None
+    assert trace.trace_id == trace.trace_id
+    assert trace.finished_at is None
+
+
+def test_trace_round_trips_through_dict():
+    orch = Orchestrator([AlwaysFailProvider(), DummyProvider()])
+
+    trace = orch.send(Message(recipient="test", content="hello"), trace=True).trace
+    restored = DeliveryTrace.from_dict(trace.to_dict())
+
+    assert restored == trace
+    assert restored.attempts[0].duration_ms == trace.attempts[0].duration_ms
+
+
+def test_wall_clock_anchor_is_taken_per_trace(monkeypatch):
+    orch = Orchestrator([DummyProvider()])
+    message = Message(recipient="test", content="hello")
+    before = orch.send(message, trace=True).trace
+
+    # The wall clock is stepped forward an hour (NTP, resume from suspend)
+    real_time_ns = time.time_ns
+    monkeypatch.setattr(time, "time_ns", lambda: real_time_ns() + 3600 * 10**9)
+    after = orch.send(message, trace=True).trace
+
+    assert after.started_at - before.started_at >= timedelta(minutes=59)
+    assert after.attempts[0].started_at >= after.started_at
+    assert after.attempts[0].anchor_ns == after.anchor_ns
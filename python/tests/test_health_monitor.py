@@ -0,0 +1,115 @@
+import time
+
+from broadcastio.core.health import HealthMonitor, ProviderHealth
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.result import DeliveryResult
+from broadcastio.providers.base import MessageProvider
+
+
+class ProbedProvider(MessageProvider):
+    def __init__(self, name: str, ready: bool = True, probe_delay: float = 0.0):
+        self.name = name
+        self.ready = ready
+        self.probe_delay = probe_delay
+        self.probes = 0
+
+    def health(self) -> ProviderHealth:
+        self.probes += 1
+        time.sleep(self.probe_delay)
+        return ProviderHealth(provider=self.name, ready=self.ready)
+
+    def send(self, message):
+        return DeliveryResult(success=True, provider=self.name, message_id="ok")
+
+
+class BrokenHealthProvider(ProbedProvider):
+    def health(self):
+        raise RuntimeError("boom")
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_refresh_probes_providers_in_parallel():
+    providers = [ProbedProvider(f"p{i}", probe_delay=0.2) for i in range(4)]
+    monitor = HealthMonitor(interval=60)
+    monitor.watch(providers)
+
+    started = time.perf_counter()
+    with monitor:
+        elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.6
+    assert all(p.probes == 1 for p in providers)
+
+
+def test_send_reads_snapshot_without_probing():
+    provider = ProbedProvider("primary")
+
+    with Orchestrator([provider], health_monitor=HealthMonitor(interval=60)) as orch:
+        for _ in range(10):
+            assert orch.send(Message(recipient="1", content="hi")).success
+
+    assert provider.probes == 1
+
+
+def test_unhealthy_snapshot_skips_provider():
+    down = ProbedProvider("down", ready=False)
+    up = ProbedProvider("up")
+
+    with Orchestrator([down, up], health_monitor=HealthMonitor(interval=60)) as orch:
+        result = orch.send(Message(recipient="1", content="hi"))
+
+    assert result.provider == "up"
+
+
+def test_stale_snapshot_is_served_and_revalidated():
+    provider = ProbedProvider("primary")
+    monitor = HealthMonitor(interval=60, stale_after=0.05)
+    monitor.watch([provider])
+
+    with monitor:
+        provider.ready = False
+        time.sleep(0.1)
+
+        # Stale value is returned immediately...
+        assert monitor.get(provider).ready is True
+
+        # ...and refreshed in the background
+        assert _wait_for(lambda: monitor.get(provider).ready is False)
+
+
+def test_unknown_provider_is_optimistically_ready():
+    monitor = HealthMonitor(interval=60)
+
+    health = monitor.get(ProbedProvider("new"))
+
+    assert health.ready is True
+
+
+def test_failing_probe_marks_provider_unready():
+    provider = BrokenHealthProvider("broken")
+    monitor = HealthMonitor(interval=60)
+    monitor.watch([provider])
+
+    with monitor:
+        health = monitor.get(provider)
+
+    assert health.ready is False
+    assert health.details == "boom"
+
+
+def test_orchestrator_close_stops_owned_monitor():
+    monitor = HealthMonitor(interval=60)
+    orch = Orchestrator([ProbedProvider("p")], health_monitor=monitor)
+
+    assert monitor.running
+    orch.close()
+    assert not monitor.running
@@ -1,3 +1,6 @@
+import threading
+import time
+
 import pytest
 
 from broadcastio.core.exceptions import ErrorCode, OrchestrationError
@@ -186,3 +189,78 @@ def test_health_cache_disabled_when_ttl_none():
     orch.send(msg)
 
     assert calls["count"] == 2
+
+
+class SlowProbeProvider(HealthySuccessProvider):
+    def __init__(self, name: str):
+        self.name = name
+        self.probes = 0
+        self._lock = threading.Lock()
+
+    def health(self):
+        with self._lock:
+            self.probes += 1
+        time.sleep(0.05)
+        return super().health()
+
+
+def _send_concurrently(orch, senders: int = 64):
+    barrier = threading.Barrier(senders)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(orch.send(Message(recipient="test", content="hello")))
+
+    threads = [threading.Thread(target=worker) for _ in range(senders)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+def test_health_probe_is_single_flight_under_concurrency():
+    providers = [SlowProbeProvider("a"), SlowProbeProvider("b")]
+    orch = Orchestrator(providers=providers, health_ttl=0.3)
+
+    results = _send_concurrently(orch)
+
+    assert len(results) == 64
+    assert all(r.success for r in results)
+    assert [p.probes for p in providers] == [1, 1]
+
+    # After expiry, exactly one more probe per provider
+    time.sleep(0.35)
+    _send_concurrently(orch)
+
+    assert [p.probes for p in providers] == [2, 2]
+
+
+def test_concurrent_callers_share_failed_probe():
+    class ExplodingProvider(SlowProbeProvider):
+        def health(self):
+            super().health()
+            raise RuntimeError("probe failed")
+
+    provider = ExplodingProvider("boom")
+    orch = Orchestrator(providers=[provider], health_ttl=60)
+    errors = []
+    barrier = threading.Barrier(16)
+
+    def worker():
+        barrier.wait()
+        try:
+            orch.send(Message(recipient="test", content="hello"))
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 16
+    assert provider.probes < 16
@@ -0,0 +1,250 @@
+import threading
+import time
+
+import pytest
+
+from broadcastio.core.async_orchestrator import AsyncOrchestrator
+from broadcastio.core.circuit import CircuitBreakerPolicy, CircuitState
+from broadcastio.core.exceptions import ErrorCode, ValidationError
+from broadcastio.core.health import ProviderHealth
+from broadcastio.core.hedge import HedgePolicy, HedgeTracker
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.ratelimit import RateLimit
+from broadcastio.core.result import DeliveryError, DeliveryResult
+from broadcastio.providers.base import MessageProvider
+from broadcastio.providers.dummy import DummyProvider
+
+
+class TimedProvider(MessageProvider):
+    def __init__(self, name, delay=0.0, success=True):
+        self.name = name
+        self.delay = delay
+        self.success = success
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def health(self) -> ProviderHealth:
+        return ProviderHealth(provider=self.name, ready=True)
+
+    def send(self, message):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.delay)
+
+        if self.success:
+            return DeliveryResult(success=True, provider=self.name, message_id="ok")
+
+        return DeliveryResult(
+            success=False,
+            provider=self.name,
+            error=DeliveryError(code=ErrorCode.PROVIDER_UNAVAILABLE, message="down"),
+        )
+
+
+def _send(orch):
+    return orch.send(Message(recipient="1", content="hi"), trace=True)
+
+
+def test_policy_requires_delay_or_percentile():
+    with pytest.raises(ValidationError):
+        HedgePolicy()
+
+    with pytest.raises(ValidationError):
+        HedgePolicy(percentile=100)
+
+
+def test_fast_primary_is_not_hedged():
+    backup = TimedProvider("backup")
+    orch = Orchestrator(
+        [TimedProvider("primary"), backup], hedge_policy=HedgePolicy(delay=0.1)
+    )
+
+    result = _send(orch)
+
+    assert result.provider == "primary"
+    assert backup.calls == 0
+    assert len(result.trace.attempts) == 1
+    orch.close()
+
+
+def test_slow_primary_loses_to_hedge():
+    orch = Orchestrator(
+        [TimedProvider("primary", delay=0.5), TimedProvider("backup")],
+        hedge_policy=HedgePolicy(delay=0.05),
+    )
+
+    started = time.monotonic()
+    result = _send(orch)
+
+    assert time.monotonic() - started < 0.3
+    assert result.provider == "backup"
+    assert [(a.provider, a.success) for a in result.trace.attempts] == [
+        ("primary", False),
+        ("backup", True),
+    ]
+    assert result.trace.attempts[0].error.code == ErrorCode.HEDGE_CANCELLED
+    orch.close()
+
+
+def test_primary_can_still_win_after_hedge():
+    orch = Orchestrator(
+        [TimedProvider("primary", delay=0.1), TimedProvider("backup", delay=0.5)],
+        hedge_policy=HedgePolicy(delay=0.02),
+    )
+
+    result = _send(orch)
+
+    assert result.provider == "primary"
+    assert [a.provider for a in result.trace.attempts] == ["primary", "backup"]
+    assert result.trace.attempts[1].error.code == ErrorCode.HEDGE_CANCELLED
+    orch.close()
+
+
+def test_failed_hedge_waits_for_primary():
+    orch = Orchestrator(
+        [
+            TimedProvider("primary", delay=0.1),
+            TimedProvider("backup", success=False),
+        ],
+        hedge_policy=HedgePolicy(delay=0.02),
+    )
+
+    result = _send(orch)
+
+    assert result.provider == "primary"
+    assert [a.success for a in result.trace.attempts] == [True, False]
+    orch.close()
+
+
+def test_both_failing_falls_back_past_the_hedge():
+    third = DummyProvider()
+    orch = Orchestrator(
+        [
+            TimedProvider("primary", delay=0.1, success=False),
+            TimedProvider("backup", success=False),
+            third,
+        ],
+        hedge_policy=HedgePolicy(delay=0.02),
+    )
+
+    result = _send(orch)
+
+    assert result.provider == "dummy"
+    assert [a.provider for a in result.trace.attempts] == [
+        "primary",
+        "backup",
+        "dummy",
+    ]
+    orch.close()
+
+
+def test_hedge_rate_is_capped():
+    backup = TimedProvider("backup")
+    orch = Orchestrator(
+        [TimedProvider("primary", delay=0.03), backup],
+        hedge_policy=HedgePolicy(delay=0.0, max_rate=0.25, burst=1),
+    )
+
+    for _ in range(20):
+        _send(orch)
+
+    # One saved token, then 0.25 per send: far from hedging every send
+    assert backup.calls <= 1 + 20 * 0.25
+    orch.close()
+
+
+def _half_open_backup(orch):
+    breaker = orch._breakers["backup"]
+    breaker.record_failure()
+    assert breaker.state == CircuitState.HALF_OPEN
+    return breaker
+
+
+def test_rate_limited_hedge_keeps_half_open_permit():
+    orch = Orchestrator(
+        [TimedProvider("primary", delay=0.1), TimedProvider("backup")],
+        hedge_policy=HedgePolicy(delay=0.01),
+        circuit_breaker=CircuitBreakerPolicy(failure_threshold=1, cooldown=0),
+        rate_limits={"backup": RateLimit(rate=0.001)},
+    )
+    breaker = _half_open_backup(orch)
+    orch._rate_buckets["backup"].try_acquire()
+
+    # The backup is rate limited: no hedge, and no trial permit taken
+    assert _send(orch).provider == "primary"
+    assert breaker.allow()
+    orch.close()
+
+
+def test_abandoned_hedge_still_reports_to_circuit_breaker():
+    backup = TimedProvider("backup", delay=0.2)
+    orch = Orchestrator(
+        [TimedProvider("primary", delay=0.05), backup],
+        hedge_policy=HedgePolicy(delay=0.01),
+        circuit_breaker=CircuitBreakerPolicy(failure_threshold=1, cooldown=0),
+    )
+    breaker = _half_open_backup(orch)
+
+    result = _send(orch)
+
+    assert result.provider == "primary"
+    assert result.trace.attempts[-1].error.code == ErrorCode.HEDGE_CANCELLED
+    # The abandoned trial call closes the circuit once it answers
+    deadline = time.monotonic() + 2
+    while breaker.state != CircuitState.CLOSED and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert breaker.state == CircuitState.CLOSED
+    orch.close()
+
+
+def test_learned_percentile_delay():
+    tracker = HedgeTracker(HedgePolicy(delay=1.0, percentile=90, min_samples=10))
+
+    assert tracker.delay("wa") == 1.0
+
+    for ms in range(1, 101):
+        tracker.observe("wa", ms / 1000)
+
+    assert tracker.delay("wa") == pytest.approx(0.091)
+
+
+def test_async_orchestrator_rejects_hedging():
+    with pytest.raises(ValidationError):
+        AsyncOrchestrator([DummyProvider()], hedge_policy=HedgePolicy(delay=0.1))
+
+
+def test_hedge_pool_does_not_cap_send_many():
+    primary = TimedProvider("primary", delay=0.1)
+    backup = TimedProvider("backup")
+    orch = Orchestrator(
+        [primary, backup], hedge_policy=HedgePolicy(delay=1.0, max_workers=4)
+    )
+    messages = [Message(recipient="1", content="hi") for _ in range(32)]
+
+    started = time.monotonic()
+    results = orch.send_many(messages, max_workers=32)
+
+    # 4 hedge threads would run the 32 sends in 8 waves of 0.1s
+    assert time.monotonic() - started < 0.5
+    assert all(r.provider == "primary" for r in results)
+    assert backup.calls == 0
+    orch.close()
+
+
+def test_hedge_delay_excludes_time_queued_on_the_pool():
+    backup = TimedProvider("backup")
+    orch = Orchestrator(
+        [TimedProvider("primary", delay=0.03), backup],
+        hedge_policy=HedgePolicy(delay=0.12, max_workers=2, burst=100),
+    )
+
+    threads = [threading.Thread(target=_send, args=(orch,)) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Sends queue behind each other, but every primary answers in 0.03s
+    assert backup.calls == 0
+    orch.close()
@@ -0,0 +1,178 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+from tests.helpers import FakeClock, FlakyProvider
+
+from broadcastio.core.async_orchestrator import AsyncOrchestrator
+from broadcastio.core.health import ProviderHealth
+from broadcastio.core.idempotency import (
+    MemoryIdempotencyStore,
+    SQLiteIdempotencyStore,
+)
+from broadcastio.core.message import Message, MessageMetadata
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.result import DeliveryResult
+from broadcastio.providers.base import MessageProvider
+
+
+class SlowCountingProvider(MessageProvider):
+    name = "slow"
+
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def health(self) -> ProviderHealth:
+        return ProviderHealth(provider=self.name, ready=True)
+
+    def send(self, message):
+        with self.lock:
+            self.calls += 1
+        time.sleep(0.05)
+        return DeliveryResult(success=True, provider=self.name, message_id="m-1")
+
+
+def _message(reference_id="job-1"):
+    return Message(
+        recipient="123",
+        content="hello",
+        metadata=MessageMetadata(reference_id=reference_id),
+    )
+
+
+def test_duplicate_returns_original_result_without_provider_call():
+    provider = FlakyProvider(fail_times=0)
+    orch = Orchestrator([provider], idempotency=MemoryIdempotencyStore())
+
+    first = orch.send(_message())
+    second = orch.send(_message())
+
+    assert second is first
+    assert provider.calls == 1
+
+
+def test_different_keys_are_delivered():
+    provider = FlakyProvider(fail_times=0)
+    orch = Orchestrator([provider], idempotency=MemoryIdempotencyStore())
+
+    orch.send(_message("a"))
+    orch.send(_message("b"))
+
+    assert provider.calls == 2
+
+
+def test_failures_are_not_remembered():
+    provider = FlakyProvider(fail_times=1)
+    orch = Orchestrator([provider], idempotency=MemoryIdempotencyStore())
+
+    assert orch.send(_message()).success is False
+    assert orch.send(_message()).success is True
+    assert provider.calls == 2
+
+
+def test_concurrent_duplicates_collapse_into_one_delivery():
+    provider = SlowCountingProvider()
+    orch = Orchestrator([provider], idempotency=MemoryIdempotencyStore())
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(orch.send(_message())))
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert provider.calls == 1
+    assert len(results) == 10
+    assert all(result is results[0] for result in results)
+
+
+def test_send_many_deduplicates():
+    provider = SlowCountingProvider()
+    orch = Orchestrator([provider], idempotency=MemoryIdempotencyStore())
+
+    results = orch.send_many([_message() for _ in range(6)], max_workers=3)
+
+    assert provider.calls == 1
+    assert all(r.success for r in results)
+
+
+def test_memory_store_is_bounded_lru():
+    store = MemoryIdempotencyStore(max_entries=2)
+    result = DeliveryResult(success=True, provider="p")
+
+    store.put("a", result)
+    store.put("b", result)
+    store.get("a")  # a is now most recently used
+    store.put("c", result)
+
+    assert len(store) == 2
+    assert store.get("b") is None
+    assert store.get("a") is result
+
+
+def test_memory_store_expires_entries():
+    clock = FakeClock()
+    store = MemoryIdempotencyStore(ttl=10, clock=clock)
+    store.put("a", DeliveryResult(success=True, provider="p"))
+
+    clock.now = 9.9
+    assert store.get("a") is not None
+
+    clock.now = 10.0
+    assert store.get("a") is None
+    assert len(store) == 0
+
+
+def test_sqlite_store_is_shared_between_instances():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "keys.db")
+        first = Orchestrator(
+            [FlakyProvider(fail_times=0)], idempotency=SQLiteIdempotencyStore(path)
+        )
+        other_provider = FlakyProvider(fail_times=0)
+        second = Orchestrator(
+            [other_provider], idempotency=SQLiteIdempotencyStore(path)
+        )
+
+        original = first.send(_message(), trace=True)
+        duplicate = second.send(_message())
+
+        assert other_provider.calls == 0
+        assert duplicate == original
+        assert duplicate.trace.attempts[0].provider == "flaky"
+
+        first.idempotency.close()
+        second.idempotency.close()
+
+
+def test_sqlite_store_purges_expired_keys():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteIdempotencyStore(os.path.join(tmp, "keys.db"), ttl=0.01)
+        store.put("a", DeliveryResult(success=True, provider="p"))
+        time.sleep(0.02)
+
+        assert store.get("a") is None
+        assert store.purge() == 1
+        store.close()
+
+
+def test_async_concurrent_duplicates_collapse():
+    provider = SlowCountingProvider()  # runs in the executor
+
+    async def main():
+        orch = AsyncOrchestrator([provider], idempotency=MemoryIdempotencyStore())
+        results = await asyncio.gather(*(orch.send(_message()) for _ in range(5)))
+        again = await orch.send(_message())
+        return results, again
+
+    results, again = asyncio.run(main())
+
+    assert provider.calls == 1
+    assert all(r is results[0] for r in results)
+    assert again is results[0]
@@ -1,3 +1,10 @@
+import copy
+import dataclasses
+import pickle
+import threading
+import tracemalloc
+import uuid
+
 import pytest
 
 from broadcastio.core.message import Message, MessageMetadata
@@ -91,3 +98,103 @@ def test_metadata_invalid_type_raises():
             content="hello",
             metadata=42,  # invalid
         )
+
+
+def test_reference_id_generated_lazily_and_stable(monkeypatch):
+    generated = []
+    uuid4 = uuid.uuid4
+    monkeypatch.setattr(uuid, "uuid4", lambda: generated.append(1) or uuid4())
+
+    meta = MessageMetadata()
+
+    assert generated == []
+    assert meta.reference_id == meta.reference_id
+    assert len(meta.reference_id) == 36
+    assert generated == [1]
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda m: pickle.loads(pickle.dumps(m))],
+)
+def test_copies_keep_the_lazy_reference_id(clone):
+    message = Message(recipient="123", content="hello")
+
+    copied = clone(message)
+
+    assert copied.metadata == message.metadata
+    assert copied.metadata.reference_id == message.metadata.reference_id
+
+
+def test_asdict_converts_metadata():
+    message = Message(recipient="123", content="hello", metadata={"tags": ["a"]})
+
+    metadata = dataclasses.asdict(message)["metadata"]
+
+    assert metadata["reference_id"] == message.metadata.reference_id
+    assert metadata["tags"] == ["a"]
+
+
+def test_reference_id_agrees_across_threads():
+    meta = MessageMetadata()
+    seen = []
+    barrier = threading.Barrier(8)
+
+    def read():
+        barrier.wait()
+        seen.append(meta.reference_id)
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(seen)) == 1
+
+
+def test_default_tags_and_extra_are_shared_and_read_only():
+    first = Message(recipient="123", content="hello")
+    second = Message(recipient="456", content="hello")
+
+    assert first.metadata.tags is second.metadata.tags
+    assert first.metadata.extra is second.metadata.extra
+
+    with pytest.raises(TypeError):
+        first.metadata.tags.append("alert")
+    with pytest.raises(TypeError):
+        first.metadata.extra["region"] = "apac"
+
+    first.metadata.tags = ["alert"]
+    assert second.metadata.tags == []
+
+
+def test_metadata_dict_without_extra_shares_empty_extra():
+    msg = Message(recipient="123", content="hello", metadata={"priority": 2})
+
+    assert msg.metadata.extra is Message(recipient="1", content="x").metadata.extra
+
+
+def test_message_is_slotted():
+    msg = Message(recipient="123", content="hello")
+
+    assert not hasattr(msg, "__dict__")
+    assert not hasattr(msg.metadata, "__dict__")
+
+
+def test_bytes_per_message_for_large_campaign():
+    count = 100_000
+    recipients = [f"62812{i:07d}" for i in range(count)]
+    content = "Your order has shipped"
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        messages = [Message(recipient=r, content=content) for r in recipients]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(messages) == count
+    # Message + MessageMetadata, no per-message tags/extra/uuid
+    assert (after - before) / count < 200
@@ -0,0 +1,133 @@
+import threading
+
+from broadcastio.core.message import Message
+from broadcastio.core.metrics import BUCKET_BOUNDS, Metrics
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.retry import RetryPolicy
+from tests.helpers import FlakyProvider
+
+
+class NamedFlaky(FlakyProvider):
+    def __init__(self, name, fail_times):
+        super().__init__(fail_times)
+        self.name = name
+
+
+MESSAGE = Message(recipient="123", content="hello")
+
+
+def test_bucket_bounds_are_log_linear():
+    assert BUCKET_BOUNDS[:6] == (0.5, 1, 1.25, 1.5, 1.75, 2)
+    assert list(BUCKET_BOUNDS) == sorted(BUCKET_BOUNDS)
+
+
+def test_record_attempt_counts_codes_and_latency():
+    metrics = Metrics()
+    metrics.record_attempt("wa", None, 3)
+    metrics.record_attempt("wa", "PROVIDER_UNAVAILABLE", 120, retry=True)
+    metrics.record_attempt("wa", None, 100_000)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["attempts"] == {"wa": {"PROVIDER_UNAVAILABLE": 1, "ok": 2}}
+    assert snapshot["retries"] == {"wa": 1}
+
+    latency = snapshot["latency_ms"]["wa"]
+    assert latency["count"] == 3
+    assert latency["sum_ms"] == 100_123
+    assert latency["buckets"] == {"3": 1, "128": 1, "+Inf": 1}
+
+
+def test_orchestrator_records_retries_fallbacks_and_outcomes():
+    metrics = Metrics()
+    orch = Orchestrator(
+        [NamedFlaky("wa", fail_times=10), NamedFlaky("email", fail_times=1)],
+        retry_policy=RetryPolicy(max_attempts=2),
+        metrics=metrics,
+    )
+
+    assert orch.send(MESSAGE).success
+
+    snapshot = metrics.snapshot()
+    assert snapshot["attempts"] == {
+        "email": {"PROVIDER_UNAVAILABLE": 1, "ok": 1},
+        "wa": {"PROVIDER_UNAVAILABLE": 2},
+    }
+    assert snapshot["retries"] == {"email": 1, "wa": 1}
+    assert snapshot["fallbacks"] == {"wa": 1}
+    assert snapshot["messages"] == {"success": 1}
+    assert snapshot["in_flight"] == 0
+
+
+def test_failed_message_counted():
+    metrics = Metrics()
+    orch = Orchestrator(
+        [NamedFlaky("wa", fail_times=10)],
+        retry_policy=RetryPolicy(max_attempts=1),
+        metrics=metrics,
+    )
+
+    assert not orch.send(MESSAGE).success
+    assert metrics.snapshot()["messages"] == {"failure": 1}
+    assert metrics.snapshot()["fallbacks"] == {}
+
+
+def test_in_flight_gauge_spans_threads():
+    metrics = Metrics()
+    metrics.message_started()
+    metrics.message_started()
+
+    done = threading.Thread(target=metrics.message_finished, args=(True,))
+    done.start()
+    done.join()
+
+    assert metrics.snapshot()["in_flight"] == 1
+
+
+def test_shards_from_many_threads_are_merged():
+    metrics = Metrics()
+
+    def worker():
+        for _ in range(1000):
+            metrics.record_attempt("wa", None, 5)
+
+    # More threads than the shard limit: exited shards get folded
+    for _ in range(10):
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert metrics.snapshot()["attempts"] == {"wa": {"ok": 100_000}}
+    assert len(metrics._shards) <= 64
+
+
+def test_send_many_counts_every_message():
+    metrics = Metrics()
+    orch = Orchestrator([NamedFlaky("wa", fail_times=0)], metrics=metrics)
+
+    results = orch.send_many([MESSAGE] * 50, max_workers=4)
+
+    assert all(r.success for r in results)
+    snapshot = metrics.snapshot()
+    assert snapshot["messages"] == {"success": 50}
+    assert snapshot["latency_ms"]["wa"]["count"] == 50
+
+
+def test_prometheus_export():
+    metrics = Metrics()
+    metrics.record_attempt("wa", None, 1)
+    metrics.record_attempt("wa", "RATE_LIMITED", 1.2, retry=True)
+    metrics.record_fallback("wa")
+
+    text = metrics.to_prometheus()
+
+    assert "# TYPE broadcastio_attempts_total counter" in text
+    assert 'broadcastio_attempts_total{provider="wa",code="ok"} 1' in text
+    assert 'broadcastio_attempt_duration_ms_bucket{provider="wa",le="1"} 1' in text
+    assert 'broadcastio_attempt_duration_ms_bucket{provider="wa",le="1.25"} 2' in text
+    assert 'broadcastio_attempt_duration_ms_bucket{provider="wa",le="+Inf"} 2' in text
+    assert 'broadcastio_attempt_duration_ms_count{provider="wa"} 2' in text
+    assert 'broadcastio_retries_total{provider="wa"} 1' in text
+    assert 'broadcastio_fallbacks_total{provider="wa"} 1' in text
+    assert "broadcastio_in_flight 0" in text
@@ -0,0 +1,155 @@
+import os
+import tempfile
+import threading
+
+import pytest
+
+from tests.helpers import FlakyProvider
+
+from broadcastio.core.attachment import Attachment
+from broadcastio.core.exceptions import ErrorCode
+from broadcastio.core.message import Message, MessageMetadata
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.outbox import Outbox, OutboxStatus
+from broadcastio.core.result import DeliveryError, DeliveryResult
+from broadcastio.providers.dummy import DummyProvider
+
+
+@pytest.fixture
+def outbox_path():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield os.path.join(tmp, "outbox.db")
+
+
+def _messages(count):
+    return [Message(recipient=str(i), content=f"hello {i}") for i in range(count)]
+
+
+def test_enqueue_roundtrips_metadata_and_attachment(outbox_path):
+    message = Message(
+        recipient="123",
+        content="report",
+        metadata=MessageMetadata(
+            priority=9, reference_id="ref-1", tags=["prod"], extra={"k": "v"}
+        ),
+        attachment=Attachment(
+            host_path="a.xlsx", provider_path="/app/a.xlsx", filename="a.xlsx"
+        ),
+    )
+
+    with Outbox(outbox_path) as outbox:
+        outbox.enqueue(message)
+        [item] = outbox.claim(10)
+
+    assert item.message == message
+    assert item.attempts == 1
+
+
+def test_enqueue_many_and_claim_in_batches(outbox_path):
+    with Outbox(outbox_path) as outbox:
+        assert outbox.enqueue_many(_messages(25), batch_size=10) == 25
+
+        first = outbox.claim(10)
+        second = outbox.claim(10)
+
+        assert [i.message.recipient for i in first] == [str(i) for i in range(10)]
+        assert [i.message.recipient for i in second] == [str(i) for i in range(10, 20)]
+        assert outbox.counts() == {
+            OutboxStatus.PENDING: 5,
+            OutboxStatus.IN_FLIGHT: 20,
+        }
+
+
+def test_concurrent_claims_never_overlap(outbox_path):
+    with Outbox(outbox_path) as outbox:
+        outbox.enqueue_many(_messages(500))
+        claimed = []
+        lock = threading.Lock()
+
+        def worker():
+            while True:
+                items = outbox.claim(7)
+                if not items:
+                    return
+                with lock:
+                    claimed.extend(item.id for item in items)
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sorted(claimed) == sorted(set(claimed))
+    assert len(claimed) == 500
+
+
+def test_record_outcomes(outbox_path):
+    with Outbox(outbox_path) as outbox:
+        outbox.enqueue_many(_messages(2))
+        ok, bad = outbox.claim(2)
+
+        outbox.record_many(
+            [
+                (ok.id, DeliveryResult(success=True, provider="p", message_id="m")),
+                (
+                    bad.id,
+                    DeliveryResult(
+                        success=False,
+                        provider="none",
+                        error=DeliveryError(code="X", message="no"),
+                    ),
+                ),
+            ]
+        )
+
+        assert outbox.counts() == {OutboxStatus.SENT: 1, OutboxStatus.FAILED: 1}
+
+
+def test_in_flight_rows_are_recovered_on_restart(outbox_path):
+    outbox = Outbox(outbox_path)
+    outbox.enqueue_many(_messages(5))
+    outbox.claim(3)
+    outbox.close()  # simulated crash: 3 rows left in flight
+
+    with Outbox(outbox_path) as reopened:
+        assert reopened.counts() == {OutboxStatus.PENDING: 5}
+        assert [i.attempts for i in reopened.claim(5)] == [2, 2, 2, 1, 1]
+
+
+def test_recover_older_than_keeps_recent_claims(outbox_path):
+    with Outbox(outbox_path) as outbox:
+        outbox.enqueue_many(_messages(2))
+        outbox.claim(2)
+
+        assert outbox.recover(older_than=60) == 0
+        assert outbox.recover() == 2
+
+
+def test_drain_delivers_everything(outbox_path):
+    provider = FlakyProvider(fail_times=0)
+    orch = Orchestrator([provider])
+
+    with Outbox(outbox_path) as outbox:
+        outbox.enqueue_many(_messages(120))
+        assert outbox.drain(orch, workers=4, batch_size=16) == 120
+        assert outbox.counts() == {OutboxStatus.SENT: 120}
+
+    assert provider.calls == 120
+
+
+def test_drain_records_rejected_messages_as_failed(outbox_path):
+    orch = Orchestrator([DummyProvider()])
+    missing = Attachment(host_path="does/not/exist", provider_path="/app/x")
+
+    with Outbox(outbox_path) as outbox:
+        outbox.enqueue(Message(recipient="1", content="hi", attachment=missing))
+        outbox.drain(orch, workers=1)
+
+        row = (
+            outbox._connection()
+            .execute("SELECT status, error_code FROM outbox")
+            .fetchone()
+        )
+
+    assert row == (OutboxStatus.FAILED, ErrorCode.ATTACHMENT_NOT_FOUND)
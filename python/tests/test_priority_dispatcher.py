@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+
+from broadcastio.core.dispatcher import PriorityDispatcher
+from broadcastio.core.exceptions import OrchestrationError, ValidationError
+from broadcastio.core.health import ProviderHealth
+from broadcastio.core.message import Message, MessageMetadata
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.result import DeliveryResult
+from broadcastio.providers.base import MessageProvider
+
+
+class GatedProvider(MessageProvider):
+    """
+    Blocks every send until the gate opens; records delivery order.
+    """
+
+    name = "gated"
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.order = []
+
+    def health(self) -> ProviderHealth:
+        return ProviderHealth(provider=self.name, ready=True)
+
+    def send(self, message):
+        self.started.set()
+        self.gate.wait()
+        self.order.append(message.content)
+        return DeliveryResult(success=True, provider=self.name, message_id="ok")
+
+
+def _message(content: str, priority: int) -> Message:
+    return Message(
+        recipient="1",
+        content=content,
+        metadata=MessageMetadata(priority=priority),
+    )
+
+
+def _blocked_dispatcher(provider, **kwargs):
+    dispatcher = PriorityDispatcher(Orchestrator([provider]), workers=1, **kwargs)
+    # Occupy the single worker so the following messages queue up
+    first = dispatcher.submit(_message("blocker", 5))
+    provider.started.wait()
+    return dispatcher, first
+
+
+def test_higher_priority_is_delivered_first():
+    provider = GatedProvider()
+    dispatcher, _ = _blocked_dispatcher(provider)
+
+    futures = [
+        dispatcher.submit(_message("p3-a", 3)),
+        dispatcher.submit(_message("p10", 10)),
+        dispatcher.submit(_message("p3-b", 3)),
+        dispatcher.submit(_message("p7", 7)),
+    ]
+
+    assert dispatcher.queue_depths() == {3: 2, 7: 1, 10: 1}
+
+    provider.gate.set()
+    results = [f.result(timeout=5) for f in futures]
+    dispatcher.close()
+
+    assert all(r.success for r in results)
+    assert provider.order == ["blocker", "p10", "p7", "p3-a", "p3-b"]
+    assert dispatcher.queue_depths() == {}
+
+
+def test_aging_prevents_starvation(monkeypatch):
+    import broadcastio.core.dispatcher as dispatcher_module
+
+    now = {"t": 1000.0}
+    monkeypatch.setattr(dispatcher_module.time, "monotonic", lambda: now["t"])
+
+    provider = GatedProvider()
+    dispatcher, _ = _blocked_dispatcher(provider, aging=1.0)
+
+    dispatcher.submit(_message("old-low", 1))
+    # 10 seconds later a higher-priority message arrives
+    now["t"] += 10
+    dispatcher.submit(_message("new-high", 9))
+
+    provider.gate.set()
+    dispatcher.close()
+
+    assert provider.order == ["blocker", "old-low", "new-high"]
+
+
+def test_exceptions_are_set_on_future():
+    with PriorityDispatcher(Orchestrator([GatedProvider()])) as dispatcher:
+        future = dispatcher.submit(Message(recipient="", content="x"))
+
+        with pytest.raises(ValidationError):
+            future.result(timeout=5)
+
+
+def test_close_can_cancel_pending():
+    provider = GatedProvider()
+    dispatcher, first = _blocked_dispatcher(provider)
+    pending = dispatcher.submit(_message("later", 5))
+
+    dispatcher.close(wait=False, cancel_pending=True)
+    provider.gate.set()
+
+    assert first.result(timeout=5).success
+    assert pending.cancelled()
+
+    with pytest.raises(OrchestrationError):
+        dispatcher.submit(_message("rejected", 5))
@@ -0,0 +1,135 @@
+import threading
+import time
+
+import pytest
+
+from tests.helpers import FakeClock, FlakyProvider
+
+from broadcastio.core.exceptions import ErrorCode, ValidationError
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.ratelimit import KeyedTokenBuckets, RateLimit, TokenBucket
+from broadcastio.providers.dummy import DummyProvider
+
+
+def test_bucket_allows_burst_then_refills():
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimit(rate=2, burst=3), clock=clock)
+
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    clock.now = 0.5
+    assert bucket.try_acquire() is True
+    assert bucket.try_acquire() is False
+
+
+def test_reserve_queues_waiters_without_polling():
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimit(rate=10, burst=1), clock=clock)
+
+    delays = [bucket.reserve() for _ in range(4)]
+
+    assert delays == pytest.approx([0.0, 0.1, 0.2, 0.3])
+
+
+def test_bucket_is_thread_safe():
+    bucket = TokenBucket(RateLimit(rate=0.001, burst=100))
+    acquired = []
+
+    def worker():
+        acquired.extend(bucket.try_acquire() for _ in range(50))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert acquired.count(True) == 100
+
+
+def test_keyed_buckets_evict_least_recently_used():
+    buckets = KeyedTokenBuckets(RateLimit(rate=1), max_keys=2)
+
+    a = buckets.bucket("a")
+    buckets.bucket("b")
+    buckets.bucket("a")
+    buckets.bucket("c")
+
+    assert len(buckets) == 2
+    assert buckets.bucket("a") is a
+
+
+def test_invalid_limits_raise():
+    with pytest.raises(ValidationError):
+        RateLimit(rate=0)
+
+    with pytest.raises(ValidationError):
+        Orchestrator([DummyProvider()], rate_limits={"typo": RateLimit(rate=1)})
+
+    with pytest.raises(ValidationError):
+        Orchestrator([DummyProvider()], rate_limit_mode="drop")
+
+
+def test_wait_mode_paces_sends():
+    orch = Orchestrator(
+        [DummyProvider()],
+        rate_limits={"dummy": RateLimit(rate=50, burst=1)},
+    )
+
+    started = time.perf_counter()
+    for i in range(6):
+        assert orch.send(Message(recipient=str(i), content="hi")).success
+
+    assert time.perf_counter() - started >= 0.09
+
+
+def test_fallback_mode_routes_to_next_provider():
+    primary = FlakyProvider(fail_times=0)
+
+    orch = Orchestrator(
+        [primary, DummyProvider()],
+        rate_limits={"flaky": RateLimit(rate=0.001, burst=2)},
+        rate_limit_mode="fallback",
+    )
+
+    providers = [
+        orch.send(Message(recipient="1", content="hi")).provider for _ in range(4)
+    ]
+
+    assert providers == ["flaky", "flaky", "dummy", "dummy"]
+    assert primary.calls == 2
+
+
+def test_fallback_mode_fails_when_every_provider_is_limited():
+    orch = Orchestrator(
+        [DummyProvider()],
+        rate_limits={"dummy": RateLimit(rate=0.001, burst=1)},
+        rate_limit_mode="fallback",
+    )
+
+    assert orch.send(Message(recipient="1", content="hi")).success
+    result = orch.send(Message(recipient="1", content="hi"))
+
+    assert not result.success
+    assert result.error.code == ErrorCode.RATE_LIMITED
+
+
+def test_recipient_limit_only_delays_same_recipient():
+    orch = Orchestrator(
+        [DummyProvider()],
+        recipient_rate_limit=RateLimit(rate=20, burst=1),
+    )
+
+    started = time.perf_counter()
+    for i in range(5):
+        orch.send(Message(recipient=str(i), content="hi"))
+    distinct = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(3):
+        orch.send(Message(recipient="same", content="hi"))
+    repeated = time.perf_counter() - started
+
+    assert distinct < 0.05
+    assert repeated >= 0.09
@@ -0,0 +1,180 @@
+import random
+import threading
+
+import pytest
+
+from tests.helpers import FakeClock, FlakyProvider, StubWhatsAppService
+
+from broadcastio.core.exceptions import ValidationError
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.retry import RetryBudget, RetryBudgetTokens, RetryPolicy
+from broadcastio.providers.dummy import DummyProvider
+from broadcastio.providers.whatsapp import WhatsAppProvider
+
+
+def _delays(policy, attempts=200):
+    orch = Orchestrator([DummyProvider()])
+    return [orch._retry_delay(policy, 2) for _ in range(attempts)]
+
+
+def test_invalid_jitter_rejected():
+    with pytest.raises(ValidationError):
+        RetryPolicy(jitter="random")
+
+
+def test_full_jitter_spreads_over_whole_delay():
+    delays = _delays(RetryPolicy(backoff="exponential", base_delay=1, jitter="full"))
+
+    assert all(0 <= d <= 4 for d in delays)
+    assert min(delays) < 1 and max(delays) > 3
+
+
+def test_equal_jitter_keeps_half_the_delay():
+    delays = _delays(RetryPolicy(backoff="exponential", base_delay=1, jitter="equal"))
+
+    assert all(2 <= d <= 4 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_decorrelated_jitter_grows_from_previous_delay():
+    orch = Orchestrator([DummyProvider()])
+    policy = RetryPolicy(
+        backoff="exponential", base_delay=1, max_delay=10, jitter="decorrelated"
+    )
+
+    delays = [orch._retry_delay(policy, 0, previous=2.0) for _ in range(200)]
+
+    assert all(1 <= d <= 6 for d in delays)
+    assert max(orch._retry_delay(policy, 0, previous=9.0) for _ in range(50)) <= 10
+
+
+def test_jitter_keeps_attempt_numbering():
+    provider = FlakyProvider(fail_times=2)
+    policy = RetryPolicy(
+        max_attempts=3, backoff="fixed", base_delay=0.01, jitter="decorrelated"
+    )
+    orch = Orchestrator([provider], retry_policy=policy)
+
+    result = orch.send(Message(recipient="1", content="hi"), trace=True)
+
+    assert result.success
+    assert [a.attempt for a in result.trace.attempts] == [1, 2, 3]
+
+
+def test_budget_tokens_earned_by_first_attempts():
+    clock = FakeClock()
+    tokens = RetryBudgetTokens(
+        RetryBudget(ratio=0.5, min_per_second=0, max_tokens=2), clock=clock
+    )
+
+    assert [tokens.try_withdraw() for _ in range(3)] == [True, True, False]
+
+    tokens.deposit()
+    tokens.deposit()
+    assert tokens.try_withdraw() is True
+    assert tokens.try_withdraw() is False
+
+
+def test_budget_refills_over_time():
+    clock = FakeClock()
+    tokens = RetryBudgetTokens(
+        RetryBudget(ratio=0, min_per_second=2, max_tokens=1), clock=clock
+    )
+    tokens.try_withdraw()
+
+    clock.now = 0.4
+    assert tokens.try_withdraw() is False
+    clock.now = 0.6
+    assert tokens.try_withdraw() is True
+
+
+def test_budget_caps_retry_storm():
+    provider = FlakyProvider(fail_times=10_000)
+    orch = Orchestrator(
+        [provider],
+        retry_policy=RetryPolicy(max_attempts=3),
+        retry_budget=RetryBudget(ratio=0.1, min_per_second=0, max_tokens=5),
+    )
+
+    for i in range(100):
+        orch.send(Message(recipient="1", content=str(i)))
+
+    # Without a budget: 300 calls. With it: 100 first attempts + 5 saved
+    # tokens + 0.1 per first attempt.
+    assert provider.calls <= 100 + 5 + 10
+    assert provider.calls >= 100 + 5
+
+
+def test_exhausted_budget_falls_back():
+    orch = Orchestrator(
+        [FlakyProvider(fail_times=10_000), DummyProvider()],
+        retry_policy=RetryPolicy(max_attempts=3),
+        retry_budget=RetryBudget(ratio=0, min_per_second=0, max_tokens=1),
+    )
+
+    first = orch.send(Message(recipient="1", content="a"), trace=True)
+    second = orch.send(Message(recipient="1", content="b"), trace=True)
+
+    assert first.provider == "dummy" and len(first.trace.attempts) == 3
+    assert second.provider == "dummy" and len(second.trace.attempts) == 2
+
+
+def _retry_wave(jitter: str, count: int = 40) -> int:
+    """
+    Simulate a Node service restart: the first request for every
+    recipient fails with 503, the retry succeeds. Returns the largest
+    number of retries scheduled within any 5ms window (a tenth of the
+    base delay), measured from the failure that caused each one: the
+    arrival times at the stub would depend on machine load.
+    """
+    lock = threading.Lock()
+    seen = set()
+    delays = []
+
+    def send(body):
+        with lock:
+            if body["recipient"] not in seen:
+                seen.add(body["recipient"])
+                return 503, {"error": "restarting"}
+        return 200, {"success": True, "message_id": body["recipient"]}
+
+    policy = RetryPolicy(
+        max_attempts=2, backoff="exponential", base_delay=0.05, jitter=jitter
+    )
+
+    with StubWhatsAppService({("POST", "/send"): send}) as stub:
+        with WhatsAppProvider(stub.url, pool_maxsize=count) as provider:
+            orch = Orchestrator([provider], retry_policy=policy)
+            retry_delay = orch._retry_delay
+
+            def recording_delay(*args):
+                delay = retry_delay(*args)
+                with lock:
+                    delays.append(delay)
+                return delay
+
+            orch._retry_delay = recording_delay
+            messages = [Message(recipient=str(i), content="hi") for i in range(count)]
+            results = orch.send_many(messages, max_workers=count, batch_size=None)
+            orch.close()
+
+    assert all(r.success for r in results)
+    assert len(delays) == count
+
+    delays.sort()
+    return max(
+        sum(1 for d in delays[i:] if d - start < 0.005)
+        for i, start in enumerate(delays)
+    )
+
+
+def test_jitter_smooths_retry_wave_against_stub():
+    random.seed(7)
+    lockstep = _retry_wave("none")
+    smoothed = _retry_wave("full")
+
+    # Without jitter every retry is due at the same moment; full jitter
+    # spreads them over the whole backoff.
+    assert lockstep == 40
+    assert smoothed <= lockstep / 4
@@ -0,0 +1,231 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from broadcastio.core.dispatcher import PriorityDispatcher
+from broadcastio.core.exceptions import ErrorCode
+from broadcastio.core.health import ProviderHealth
+from broadcastio.core.idempotency import MemoryIdempotencyStore
+from broadcastio.core.message import Message, MessageMetadata
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.result import DeliveryError, DeliveryResult
+from broadcastio.core.retry import RetryPolicy
+from broadcastio.core.scheduler import RetryScheduler
+from broadcastio.providers.base import MessageProvider
+
+
+class FailOncePerMessageProvider(MessageProvider):
+    """
+    First attempt of every message fails, the retry succeeds.
+    """
+
+    name = "fail_once"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.seen = set()
+        self.delivered = []
+
+    def health(self) -> ProviderHealth:
+        return ProviderHealth(provider=self.name, ready=True)
+
+    def send(self, message):
+        with self.lock:
+            first = message.content not in self.seen
+            self.seen.add(message.content)
+            if not first:
+                self.delivered.append(message.content)
+
+        if first and message.content.startswith("flaky"):
+            return DeliveryResult(
+                success=False,
+                provider=self.name,
+                error=DeliveryError(
+                    code=ErrorCode.PROVIDER_UNAVAILABLE, message="try later"
+                ),
+            )
+
+        if first:
+            with self.lock:
+                self.delivered.append(message.content)
+
+        return DeliveryResult(
+            success=True, provider=self.name, message_id=message.content
+        )
+
+
+def test_scheduler_fires_in_deadline_order():
+    scheduler = RetryScheduler()
+    fired = []
+    done = threading.Event()
+
+    scheduler.call_later(0.06, fired.append, "late")
+    scheduler.call_later(0.02, fired.append, "early")
+    scheduler.call_later(0.08, done.set)
+
+    assert done.wait(1)
+    assert fired == ["early", "late"]
+    scheduler.close()
+
+
+def test_submit_later_runs_on_executor():
+    scheduler = RetryScheduler()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        started = time.monotonic()
+        future = scheduler.submit_later(executor, 0.05, lambda x: x * 2, 21)
+
+        assert future.result(timeout=1) == 42
+        assert time.monotonic() - started >= 0.05
+
+    scheduler.close()
+
+
+def test_send_many_backoff_does_not_block_workers():
+    policy = RetryPolicy(max_attempts=2, backoff="fixed", base_delay=0.2)
+    orch = Orchestrator([FailOncePerMessageProvider()], retry_policy=policy)
+    messages = [Message(recipient="1", content=f"flaky-{i}") for i in range(5)]
+
+    started = time.monotonic()
+    results = orch.send_many(messages, max_workers=1, batch_size=None, trace=True)
+    elapsed = time.monotonic() - started
+
+    # Two runs fit in the window, parked ones included: three rounds of
+    # backoff run side by side, instead of 5 * 0.2s asleep in the worker
+    assert elapsed < 0.9
+    assert all(r.success for r in results)
+    assert [[a.attempt for a in r.trace.attempts] for r in results] == [[1, 2]] * 5
+    orch.close()
+
+
+def test_dispatcher_worker_moves_on_during_backoff():
+    provider = FailOncePerMessageProvider()
+    policy = RetryPolicy(max_attempts=2, backoff="fixed", base_delay=0.2)
+    orch = Orchestrator([provider], retry_policy=policy)
+
+    with PriorityDispatcher(orch, workers=1) as dispatcher:
+        flaky = dispatcher.submit(Message(recipient="1", content="flaky"))
+        time.sleep(0.05)
+        assert dispatcher.retrying == 1
+
+        quick = dispatcher.submit(Message(recipient="1", content="quick"))
+        assert quick.result(timeout=0.1).success
+
+        assert flaky.result(timeout=1).success
+
+    assert provider.delivered == ["quick", "flaky"]
+    orch.close()
+
+
+def test_dispatcher_close_waits_for_retries():
+    policy = RetryPolicy(max_attempts=2, backoff="fixed", base_delay=0.05)
+    orch = Orchestrator([FailOncePerMessageProvider()], retry_policy=policy)
+
+    dispatcher = PriorityDispatcher(orch, workers=2)
+    futures = [
+        dispatcher.submit(Message(recipient="1", content=f"flaky-{i}"))
+        for i in range(4)
+    ]
+    dispatcher.close()
+
+    assert all(f.done() and f.result().success for f in futures)
+    orch.close()
+
+
+def test_send_many_window_counts_parked_runs():
+    policy = RetryPolicy(max_attempts=2, backoff="fixed", base_delay=0.1)
+    orch = Orchestrator([FailOncePerMessageProvider()], retry_policy=policy)
+    pulled = []
+
+    def messages():
+        for i in range(100):
+            pulled.append(i)
+            yield Message(recipient="1", content=f"flaky-{i}")
+
+    stream = orch.iter_send_many(messages(), max_workers=2, batch_size=None)
+    next(stream)
+
+    # Every run is parked on its first failure; none may be pulled beyond
+    # the window of 2 * max_workers
+    assert len(pulled) <= 4 + 1
+    assert orch.retry_scheduler().pending <= 4
+
+    stream.close()
+    orch.close()
+
+
+def test_send_many_max_in_flight_widens_the_window():
+    policy = RetryPolicy(max_attempts=2, backoff="fixed", base_delay=0.1)
+    orch = Orchestrator([FailOncePerMessageProvider()], retry_policy=policy)
+    pulled = []
+
+    def messages():
+        for i in range(100):
+            pulled.append(i)
+            yield Message(recipient="1", content=f"flaky-{i}")
+
+    stream = orch.iter_send_many(messages(), max_workers=2, max_in_flight=10)
+    next(stream)
+
+    assert 10 <= len(pulled) <= 10 + 1
+
+    stream.close()
+    orch.close()
+
+
+def test_send_many_idempotent_backoff_does_not_block_workers():
+    policy = RetryPolicy(max_attempts=2, backoff="fixed", base_delay=0.2)
+    orch = Orchestrator(
+        [FailOncePerMessageProvider()],
+        retry_policy=policy,
+        idempotency=MemoryIdempotencyStore(),
+    )
+    messages = [Message(recipient="1", content=f"flaky-{i}") for i in range(5)]
+
+    started = time.monotonic()
+    results = orch.send_many(messages, max_workers=1, max_in_flight=5)
+    elapsed = time.monotonic() - started
+
+    # All five back off side by side, instead of 5 * 0.2s in the worker
+    assert elapsed < 0.5
+    assert all(r.success for r in results)
+    orch.close()
+
+
+def test_send_many_idempotent_duplicates_share_one_delivery():
+    provider = FailOncePerMessageProvider()
+    policy = RetryPolicy(max_attempts=2, backoff="fixed", base_delay=0.1)
+    orch = Orchestrator(
+        [provider], retry_policy=policy, idempotency=MemoryIdempotencyStore()
+    )
+    metadata = MessageMetadata(reference_id="order-1")
+    messages = [
+        Message(recipient="1", content="flaky", metadata=metadata) for _ in range(3)
+    ]
+
+    # One worker: waiting duplicates must not hold it from the retry
+    results = orch.send_many(messages, max_workers=1)
+
+    assert [r.message_id for r in results] == ["flaky"] * 3
+    assert provider.delivered == ["flaky"]
+    orch.close()
+
+
+def test_closing_idempotent_stream_releases_parked_keys():
+    policy = RetryPolicy(max_attempts=2, backoff="fixed", base_delay=0.2)
+    orch = Orchestrator(
+        [FailOncePerMessageProvider()],
+        retry_policy=policy,
+        idempotency=MemoryIdempotencyStore(),
+    )
+    messages = [Message(recipient="1", content="quick")] + [
+        Message(recipient="1", content=f"flaky-{i}") for i in range(3)
+    ]
+
+    stream = orch.iter_send_many(messages, max_workers=2)
+    next(stream)
+    stream.close()
+
+    # Parked deliveries were abandoned: their keys can be sent again
+    assert orch._idempotency_flights == {}
+    assert orch.send(messages[1]).success
+    orch.close()
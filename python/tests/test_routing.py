@@ -0,0 +1,251 @@
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from broadcastio.core.exceptions import ValidationError
+from broadcastio.core.health import ProviderHealth
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.result import DeliveryResult
+from broadcastio.core.retry import RetryPolicy
+from broadcastio.core.routing import (
+    AdaptiveRouting,
+    LeastOutstanding,
+    PowerOfTwoChoices,
+    RoutingStrategy,
+    WeightedRoundRobin,
+)
+from broadcastio.core.trace import DeliveryAttempt
+from broadcastio.providers.base import MessageProvider
+from tests.helpers import FakeClock
+
+
+class NamedProvider(MessageProvider):
+    def __init__(self, name, delay=0.0):
+        self.name = name
+        self.delay = delay
+        self.calls = 0
+
+    def health(self) -> ProviderHealth:
+        return ProviderHealth(provider=self.name, ready=True)
+
+    def send(self, message):
+        self.calls += 1
+        time.sleep(self.delay)
+        return DeliveryResult(success=True, provider=self.name, message_id="ok")
+
+
+def _attempt(provider, ms, success=True):
+    started = datetime.now(timezone.utc)
+    return DeliveryAttempt(
+        provider=provider,
+        attempt=1,
+        started_at=started,
+        finished_at=started + timedelta(milliseconds=ms),
+        success=success,
+    )
+
+
+def _names(providers):
+    return [p.name for p in providers]
+
+
+PROVIDERS = [NamedProvider("wa"), NamedProvider("email")]
+
+
+def test_base_strategy_keeps_fallback_order():
+    assert RoutingStrategy().order(PROVIDERS) == PROVIDERS
+
+
+def test_invalid_alpha_rejected():
+    with pytest.raises(ValidationError):
+        AdaptiveRouting(alpha=0)
+
+
+def test_unmeasured_providers_keep_constructor_order():
+    assert _names(AdaptiveRouting().order(PROVIDERS)) == ["wa", "email"]
+
+
+def test_slow_provider_is_routed_around():
+    routing = AdaptiveRouting(alpha=0.5)
+    routing.observe(_attempt("wa", 900))
+    routing.observe(_attempt("email", 100))
+
+    assert _names(routing.order(PROVIDERS)) == ["email", "wa"]
+
+
+def test_failures_raise_expected_cost():
+    routing = AdaptiveRouting(alpha=0.5, failure_cost=5)
+    routing.observe(_attempt("wa", 50, success=False))
+    routing.observe(_attempt("email", 400))
+
+    assert _names(routing.order(PROVIDERS)) == ["email", "wa"]
+    assert routing.snapshot()["wa"]["cost"] == pytest.approx(5.05)
+
+
+def test_ewma_moves_gradually():
+    routing = AdaptiveRouting(alpha=0.2)
+    routing.observe(_attempt("wa", 100))
+    routing.observe(_attempt("wa", 600))
+
+    assert routing.snapshot()["wa"]["latency"] == pytest.approx(0.2)
+
+
+def test_pin_stays_first_within_slo():
+    routing = AdaptiveRouting(pin="wa", slo_latency=1.0, slo_success_rate=0.9)
+    routing.observe(_attempt("wa", 800))
+    routing.observe(_attempt("email", 100))
+
+    assert _names(routing.order(PROVIDERS)) == ["wa", "email"]
+
+    for _ in range(10):
+        routing.observe(_attempt("wa", 3000))
+
+    assert _names(routing.order(PROVIDERS)) == ["email", "wa"]
+
+
+def test_stale_averages_are_dropped():
+    clock = FakeClock()
+    routing = AdaptiveRouting(recovery=60, clock=clock)
+    routing.observe(_attempt("wa", 5000))
+    routing.observe(_attempt("email", 100))
+
+    assert _names(routing.order(PROVIDERS)) == ["email", "wa"]
+
+    clock.now = 30
+    routing.observe(_attempt("email", 100))
+    clock.now = 61
+
+    # wa gets a trial again; its next sample replaces the old average
+    assert _names(routing.order(PROVIDERS)) == ["wa", "email"]
+    routing.observe(_attempt("wa", 50))
+    assert routing.snapshot()["wa"]["latency"] == pytest.approx(0.05)
+
+
+def test_orchestrator_routes_around_degraded_provider():
+    slow = NamedProvider("wa", delay=0.03)
+    fast = NamedProvider("email")
+    orch = Orchestrator([slow, fast], routing=AdaptiveRouting())
+
+    results = [orch.send(Message(recipient="1", content="hi")) for _ in range(20)]
+
+    assert results[0].provider == "wa"
+    assert {r.provider for r in results[2:]} == {"email"}
+    assert slow.calls == 1
+
+
+def test_weighted_round_robin_is_smooth():
+    routing = WeightedRoundRobin({"wa": 2, "email": 1})
+
+    firsts = [routing.order(PROVIDERS)[0].name for _ in range(6)]
+
+    assert firsts == ["wa", "email", "wa", "wa", "email", "wa"]
+
+
+def test_weighted_round_robin_keeps_fallback_chain():
+    routing = WeightedRoundRobin()
+
+    orders = [_names(routing.order(PROVIDERS)) for _ in range(2)]
+
+    assert orders == [["wa", "email"], ["email", "wa"]]
+
+
+def test_zero_weight_is_fallback_only():
+    routing = WeightedRoundRobin({"wa": 0})
+
+    assert {routing.order(PROVIDERS)[0].name for _ in range(5)} == {"email"}
+    assert _names(routing.order(PROVIDERS[:1])) == ["wa"]
+
+
+def test_negative_weight_rejected():
+    with pytest.raises(ValidationError):
+        WeightedRoundRobin({"wa": -1})
+
+
+def test_least_outstanding_prefers_idle_provider():
+    routing = LeastOutstanding()
+    routing.on_start("wa")
+
+    assert _names(routing.order(PROVIDERS)) == ["email", "wa"]
+    assert routing.outstanding() == {"wa": 1}
+
+    routing.on_finish("wa")
+    assert _names(routing.order(PROVIDERS)) == ["wa", "email"]
+
+
+def test_power_of_two_choices_picks_less_loaded_of_sample():
+    providers = [NamedProvider(f"wa{i}") for i in range(4)]
+    routing = PowerOfTwoChoices(rng=random.Random(7))
+    for _ in range(5):
+        routing.on_start("wa0")
+
+    firsts = Counter(routing.order(providers)[0].name for _ in range(300))
+
+    # Any other provider in the sample is idler than wa0
+    assert firsts["wa0"] == 0
+    assert set(firsts) == {"wa1", "wa2", "wa3"}
+
+
+def test_orchestrator_spreads_load_with_weights():
+    wa1, wa2 = NamedProvider("wa1"), NamedProvider("wa2")
+    orch = Orchestrator([wa1, wa2], routing=WeightedRoundRobin({"wa1": 3}))
+
+    for _ in range(40):
+        orch.send(Message(recipient="1", content="hi"))
+
+    assert (wa1.calls, wa2.calls) == (30, 10)
+
+
+class GateProvider(NamedProvider):
+    def __init__(self, name):
+        super().__init__(name)
+        self.gate = threading.Event()
+
+    def send(self, message):
+        self.calls += 1
+        self.gate.wait()
+        return super().send(message)
+
+
+def test_orchestrator_least_outstanding_avoids_busy_provider():
+    busy, idle = GateProvider("busy"), NamedProvider("idle")
+    orch = Orchestrator([busy, idle], routing=LeastOutstanding())
+
+    blocked = threading.Thread(
+        target=orch.send, args=(Message(recipient="1", content="hi"),)
+    )
+    blocked.start()
+    while busy.calls == 0:
+        time.sleep(0.001)
+
+    results = [orch.send(Message(recipient="1", content="hi")) for _ in range(3)]
+
+    busy.gate.set()
+    blocked.join()
+    assert {r.provider for r in results} == {"idle"}
+
+
+def test_load_balancing_composes_with_retries():
+    class FailingOnce(NamedProvider):
+        def send(self, message):
+            self.calls += 1
+            if self.calls == 1:
+                raise requests.ConnectionError("down")
+            return DeliveryResult(success=True, provider=self.name)
+
+    flaky = FailingOnce("wa1")
+    orch = Orchestrator(
+        [flaky, NamedProvider("wa2")],
+        routing=WeightedRoundRobin(),
+        retry_policy=RetryPolicy(max_attempts=2),
+    )
+
+    result = orch.send(Message(recipient="1", content="hi"), trace=True)
+
+    assert result.provider == "wa1"
+    assert [a.provider for a in result.trace.attempts] == ["wa1", "wa1"]
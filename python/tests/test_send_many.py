@@ -0,0 +1,254 @@
+import threading
+import time
+
+import pytest
+import requests
+import urllib3
+
+from broadcastio.core.exceptions import ErrorCode, ValidationError
+from broadcastio.core.health import ProviderHealth
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.result import DeliveryError, DeliveryResult
+from broadcastio.core.retry import RetryPolicy
+from broadcastio.providers.base import MessageProvider
+from broadcastio.providers.dummy import DummyProvider
+
+
+class SlowProvider(MessageProvider):
+    name = "slow"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def health(self) -> ProviderHealth:
+        return ProviderHealth(provider=self.name, ready=True)
+
+    def send(self, message):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+        # Later messages finish first
+        time.sleep(0.01 * (5 - int(message.content) % 5))
+
+        with self.lock:
+            self.active -= 1
+
+        return DeliveryResult(
+            success=True,
+            provider=self.name,
+            message_id=message.content,
+        )
+
+
+class FailingProvider(MessageProvider):
+    name = "failing"
+
+    def health(self) -> ProviderHealth:
+        return ProviderHealth(provider=self.name, ready=True)
+
+    def send(self, message):
+        return DeliveryResult(
+            success=False,
+            provider=self.name,
+            error=DeliveryError(
+                code=ErrorCode.PROVIDER_UNAVAILABLE,
+                message="down",
+            ),
+        )
+
+
+def _messages(count):
+    return [Message(recipient="123", content=str(i)) for i in range(count)]
+
+
+def test_send_many_preserves_input_order():
+    orch = Orchestrator([SlowProvider()])
+
+    results = orch.send_many(_messages(20), max_workers=4)
+
+    assert [r.message_id for r in results] == [str(i) for i in range(20)]
+    assert all(r.success for r in results)
+
+
+def test_send_many_is_bounded_and_concurrent():
+    provider = SlowProvider()
+    orch = Orchestrator([provider])
+
+    orch.send_many(_messages(20), max_workers=3)
+
+    assert 1 < provider.max_active <= 3
+
+
+def test_iter_send_many_yields_every_index_once():
+    orch = Orchestrator([SlowProvider()])
+
+    pairs = list(orch.iter_send_many(iter(_messages(10)), max_workers=4))
+
+    assert sorted(index for index, _ in pairs) == list(range(10))
+    assert all(result.message_id == str(index) for index, result in pairs)
+
+
+def test_send_many_keeps_fallback_and_hooks():
+    successes = []
+    attempts = []
+
+    orch = Orchestrator(
+        [FailingProvider(), DummyProvider()],
+        on_attempt=attempts.append,
+        on_success=successes.append,
+    )
+
+    results = orch.send_many(_messages(5), max_workers=2, trace=True)
+
+    assert all(r.provider == "dummy" for r in results)
+    assert all(len(r.trace.attempts) == 2 for r in results)
+    assert len(successes) == 5
+    assert len(attempts) == 10
+
+
+def test_send_many_propagates_validation_errors():
+    orch = Orchestrator([DummyProvider()])
+
+    messages = _messages(3) + [Message(recipient="", content="bad")]
+
+    with pytest.raises(ValidationError):
+        orch.send_many(messages, max_workers=2)
+
+
+def test_send_many_rejects_invalid_max_workers():
+    orch = Orchestrator([DummyProvider()])
+
+    with pytest.raises(ValidationError):
+        orch.send_many(_messages(1), max_workers=0)
+
+
+class BatchProvider(MessageProvider):
+    """
+    Fails every odd-numbered message on its first (batched) attempt.
+    """
+
+    name = "batch"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.batches = []
+        self.single_calls = []
+
+    def health(self) -> ProviderHealth:
+        return ProviderHealth(provider=self.name, ready=True)
+
+    def send_batch(self, messages):
+        with self.lock:
+            self.batches.append([m.content for m in messages])
+
+        return [
+            DeliveryResult(
+                success=int(m.content) % 2 == 0,
+                provider=self.name,
+                message_id=m.content,
+                error=(
+                    None
+                    if int(m.content) % 2 == 0
+                    else DeliveryError(
+                        code=ErrorCode.PROVIDER_UNAVAILABLE, message="busy"
+                    )
+                ),
+            )
+            for m in messages
+        ]
+
+    def send(self, message):
+        with self.lock:
+            self.single_calls.append(message.content)
+
+        return DeliveryResult(
+            success=True, provider=self.name, message_id=message.content
+        )
+
+
+def test_send_many_uses_send_batch_and_retries_failed_items():
+    provider = BatchProvider()
+    orch = Orchestrator([provider], retry_policy=RetryPolicy(max_attempts=2))
+
+    results = orch.send_many(_messages(10), batch_size=4, trace=True)
+
+    assert [len(batch) for batch in provider.batches] == [4, 4, 2]
+    assert sorted(provider.single_calls, key=int) == ["1", "3", "5", "7", "9"]
+    assert all(r.success for r in results)
+    assert [r.message_id for r in results] == [str(i) for i in range(10)]
+    assert [len(r.trace.attempts) for r in results] == [1, 2] * 5
+
+
+def test_send_many_batch_failures_fall_back():
+    provider = BatchProvider()
+    orch = Orchestrator([provider, DummyProvider()])
+
+    results = orch.send_many(_messages(4), batch_size=4)
+
+    assert [r.provider for r in results] == ["batch", "dummy", "batch", "dummy"]
+    assert provider.single_calls == []
+
+
+def test_send_many_batching_is_opt_in():
+    provider = BatchProvider()
+    orch = Orchestrator([provider])
+
+    orch.send_many(_messages(4))
+
+    assert provider.batches == []
+    assert len(provider.single_calls) == 4
+
+
+class UnknownOutcomeProvider(BatchProvider):
+    """
+    A batch provider whose batch outcome is unknown: it either times out
+    or returns the wrong number of results.
+    """
+
+    def __init__(self, timeout: bool):
+        super().__init__()
+        self.timeout = timeout
+
+    def send_batch(self, messages):
+        results = super().send_batch(messages)
+        if self.timeout:
+            raise requests.ReadTimeout("read timed out")
+        return results[:-1]
+
+
+@pytest.mark.parametrize("timeout", [True, False])
+def test_send_many_unknown_batch_outcome_fails_items_without_retry(timeout):
+    provider = UnknownOutcomeProvider(timeout)
+    orch = Orchestrator(
+        [provider, DummyProvider()], retry_policy=RetryPolicy(max_attempts=3)
+    )
+
+    results = orch.send_many(_messages(6), batch_size=3, trace=True)
+
+    assert len(results) == 6
+    assert not any(r.success for r in results)
+    assert {r.error.code for r in results} == {ErrorCode.BATCH_OUTCOME_UNKNOWN}
+    assert [len(r.trace.attempts) for r in results] == [1] * 6
+    assert provider.single_calls == []
+
+
+class RefusedBatchProvider(BatchProvider):
+    def send_batch(self, messages):
+        refused = urllib3.exceptions.NewConnectionError(None, "refused")
+        raise requests.ConnectionError(
+            urllib3.exceptions.MaxRetryError(None, "/send/batch", refused)
+        )
+
+
+def test_send_many_batch_refused_on_connect_falls_back():
+    provider = RefusedBatchProvider()
+    orch = Orchestrator([provider, DummyProvider()])
+
+    results = orch.send_many(_messages(4), batch_size=4)
+
+    # Nothing was sent: the items go through the normal fallback path
+    assert [r.provider for r in results] == ["dummy"] * 4
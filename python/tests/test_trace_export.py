@@ -0,0 +1,158 @@
+import json
+import os
+import random
+import tempfile
+
+import pytest
+
+from broadcastio.core.exceptions import ValidationError
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.core.retry import RetryPolicy
+from broadcastio.core.trace import DeliveryTrace
+from broadcastio.core.trace_export import RotatingJsonlSink, TraceExporter
+from tests.helpers import FlakyProvider
+
+MESSAGE = Message(recipient="123", content="hello")
+
+
+class ListSink:
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, records):
+        self.batches.append(records)
+
+    @property
+    def records(self):
+        return [record for batch in self.batches for record in batch]
+
+
+def _exporter(sink, **options):
+    options.setdefault("flush_interval", 60)
+    return TraceExporter(sink, **options)
+
+
+def test_invalid_sample_rate_rejected():
+    with pytest.raises(ValidationError):
+        TraceExporter(ListSink(), sample_rate=1.5)
+
+
+def test_exports_every_trace_without_attaching_it():
+    sink = ListSink()
+    with _exporter(sink) as exporter:
+        orch = Orchestrator([FlakyProvider(fail_times=0)], trace_exporter=exporter)
+        results = [orch.send(MESSAGE) for _ in range(3)]
+
+    assert all(r.trace is None for r in results)
+    assert len(sink.records) == 3
+    assert sink.records[0]["success"] is True
+    assert sink.records[0]["attempts"][0]["provider"] == "flaky"
+    assert exporter.exported == 3
+
+
+def test_unsampled_failures_are_still_exported():
+    sink = ListSink()
+    with _exporter(sink, sample_rate=0) as exporter:
+        orch = Orchestrator(
+            [FlakyProvider(fail_times=1)],
+            retry_policy=RetryPolicy(max_attempts=1),
+            trace_exporter=exporter,
+        )
+        failed = orch.send(MESSAGE)
+        succeeded = orch.send(MESSAGE)
+
+    assert not failed.success and succeeded.success
+    assert [r["success"] for r in sink.records] == [False]
+
+
+def test_failures_follow_the_sample_rate_when_not_forced():
+    sink = ListSink()
+    with _exporter(sink, sample_rate=0, always_export_failures=False) as exporter:
+        orch = Orchestrator(
+            [FlakyProvider(fail_times=1)],
+            retry_policy=RetryPolicy(max_attempts=1),
+            trace_exporter=exporter,
+        )
+        orch.send(MESSAGE)
+
+    assert sink.records == []
+
+
+def test_sample_rate_is_head_based():
+    sink = ListSink()
+    with _exporter(sink, sample_rate=0.25, rng=random.Random(7)) as exporter:
+        orch = Orchestrator([FlakyProvider(fail_times=0)], trace_exporter=exporter)
+        for _ in range(2000):
+            orch.send(MESSAGE)
+
+    assert 400 <= len(sink.records) <= 600
+
+
+def test_trace_requested_by_caller_is_attached_and_exported():
+    sink = ListSink()
+    with _exporter(sink) as exporter:
+        orch = Orchestrator([FlakyProvider(fail_times=0)], trace_exporter=exporter)
+        result = orch.send(MESSAGE, trace=True)
+
+    assert sink.records == [result.trace.to_dict()]
+
+
+def test_full_queue_drops_and_counts():
+    sink = ListSink()
+    exporter = _exporter(sink, max_queue=2)
+
+    accepted = [exporter.export(DeliveryTrace()) for _ in range(5)]
+
+    assert accepted == [True, True, False, False, False]
+    assert exporter.dropped == 3
+    assert exporter.pending == 2
+
+    exporter.close()
+    assert len(sink.records) == 2
+
+
+def test_batches_are_capped_and_flushed_in_background():
+    sink = ListSink()
+    exporter = TraceExporter(sink, batch_size=10, flush_interval=0.05)
+
+    for _ in range(25):
+        exporter.export(DeliveryTrace())
+
+    exporter.close()
+    assert [len(batch) for batch in sink.batches][:2] == [10, 10]
+    assert len(sink.records) == 25
+
+
+def test_failing_sink_is_counted():
+    def sink(records):
+        raise OSError("disk full")
+
+    exporter = _exporter(sink)
+    exporter.export(DeliveryTrace())
+    exporter.close()
+
+    assert exporter.failed == 1
+    assert exporter.exported == 0
+
+
+def test_rotating_jsonl_sink():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "traces.jsonl")
+        sink = RotatingJsonlSink(path, max_bytes=200, backup_count=2)
+
+        for i in range(10):
+            sink([{"trace_id": str(i), "padding": "x" * 50}])
+        sink.close()
+
+        assert sorted(os.listdir(tmp)) == [
+            "traces.jsonl",
+            "traces.jsonl.1",
+            "traces.jsonl.2",
+        ]
+        with open(path, encoding="utf-8") as fh:
+            lines = [json.loads(line) for line in fh]
+        assert lines[-1]["trace_id"] == "9"
+        assert all(
+            os.path.getsize(os.path.join(tmp, f)) <= 200 for f in os.listdir(tmp)
+        )
@@ -32,5 +32,18 @@ def test_orchestrator_signature():
             "on_attempt",
             "on_success",
             "on_failure",
+            "health_monitor",
+            "circuit_breaker",
+            "on_circuit_change",
+            "rate_limits",
+            "recipient_rate_limit",
+            "rate_limit_mode",
+            "idempotency",
+            "retry_budget",
+            "hedge_policy",
+            "routing",
+            "metrics",
+            "trace_exporter",
+            "attachment_cache",
         ]
     )
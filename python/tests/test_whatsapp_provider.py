@@ -0,0 +1,250 @@
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from tests.helpers import StubWhatsAppService
+
+from broadcastio.core.attachment import Attachment
+from broadcastio.core.exceptions import AttachmentError, ErrorCode, ProviderError
+from broadcastio.core.message import Message
+from broadcastio.core.orchestrator import Orchestrator
+from broadcastio.providers.whatsapp import WhatsAppProvider
+
+
+def test_send_and_health_reuse_one_connection():
+    with StubWhatsAppService() as service:
+        with WhatsAppProvider(service.url) as wa:
+            assert wa.health().ready is True
+
+            for i in range(5):
+                result = wa.send(Message(recipient=str(i), content="hello"))
+                assert result.success
+                assert result.message_id == f"wa-{i}"
+
+    assert len(service.requests) == 6
+    assert len(service.clients) == 1
+
+
+def test_keep_alive_disabled_opens_new_connections():
+    with StubWhatsAppService() as service:
+        with WhatsAppProvider(service.url, keep_alive=False) as wa:
+            for i in range(3):
+                assert wa.send(Message(recipient=str(i), content="hello")).success
+
+    assert len(service.clients) == 3
+
+
+def test_separate_connect_and_read_timeouts():
+    wa = WhatsAppProvider("http://localhost:1", timeout=5, connect_timeout=0.5)
+
+    assert wa._timeouts == (0.5, 5)
+    wa.close()
+
+
+def test_logical_failure_is_returned():
+    routes = {
+        ("POST", "/send"): lambda body: (
+            200,
+            {"success": False, "error": {"code": "WHATSAPP_REJECTED", "message": "no"}},
+        )
+    }
+
+    with StubWhatsAppService(routes) as service:
+        with WhatsAppProvider(service.url) as wa:
+            result = wa.send(Message(recipient="1", content="hello"))
+
+    assert not result.success
+    assert result.error.code == "WHATSAPP_REJECTED"
+
+
+def test_external_session_is_not_closed():
+    session = requests.Session()
+    closed = []
+    session.close = lambda: closed.append(True)
+
+    with WhatsAppProvider("http://localhost:1", session=session):
+        pass
+
+    assert closed == []
+
+
+def test_invalid_pool_size_raises():
+    with pytest.raises(ProviderError):
+        WhatsAppProvider("http://localhost:1", pool_maxsize=0)
+
+
+def test_send_batch_returns_per_item_results():
+    def batch(body):
+        return 200, {
+            "success": True,
+            "results": [
+                (
+                    {"success": True, "message_id": f"wa-{m['recipient']}"}
+                    if m["content"] != "bad"
+                    else {"success": False, "error": {"code": "INVALID_MESSAGE"}}
+                )
+                for m in body["messages"]
+            ],
+        }
+
+    with StubWhatsAppService({("POST", "/send/batch"): batch}) as service:
+        with WhatsAppProvider(service.url, read_timeout=2) as wa:
+            post = wa.session.post
+            timeouts = []
+
+            def recording_post(*args, **kwargs):
+                timeouts.append(kwargs["timeout"])
+                return post(*args, **kwargs)
+
+            wa.session.post = recording_post
+            results = wa.send_batch(
+                [
+                    Message(recipient="1", content="hello"),
+                    Message(recipient="2", content="bad"),
+                ]
+            )
+
+    assert [r.success for r in results] == [True, False]
+    assert results[0].message_id == "wa-1"
+    assert results[1].error.code == "INVALID_MESSAGE"
+    assert len(service.requests) == 1
+    # The read timeout scales with the number of messages
+    assert timeouts == [(wa.connect_timeout, 4)]
+
+
+@pytest.mark.parametrize(
+    "response",
+    [(502, {"error": "bad gateway"}), (200, b"<html>proxy error</html>")],
+    ids=["5xx", "bad-json"],
+)
+def test_batch_failing_after_delivery_is_not_resent(response):
+    delivered = []
+
+    def batch(body):
+        delivered.extend(m["recipient"] for m in body["messages"])
+        return response
+
+    with StubWhatsAppService({("POST", "/send/batch"): batch}) as service:
+        with WhatsAppProvider(service.url) as wa:
+            messages = [Message(recipient=str(i), content="hi") for i in range(4)]
+            results = Orchestrator([wa]).send_many(messages, batch_size=4)
+
+    assert {r.error.code for r in results} == {ErrorCode.BATCH_OUTCOME_UNKNOWN}
+    assert sorted(delivered) == ["0", "1", "2", "3"]
+    assert [path for _, path, _ in service.requests].count("/send") == 0
+
+
+def test_stats_returns_service_counters():
+    counters = {"hits": 9, "misses": 1, "evictions": 0}
+    routes = {("GET", "/stats"): lambda body: (200, {"media_cache": counters})}
+
+    with StubWhatsAppService(routes) as service:
+        with WhatsAppProvider(service.url) as wa:
+            assert wa.stats()["media_cache"] == counters
+
+
+@pytest.fixture
+def report():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "report.pdf")
+        with open(path, "wb") as fh:
+            fh.write(b"%PDF quarterly numbers")
+        yield path
+
+
+def test_path_mode_requires_provider_path(report):
+    message = Message(recipient="1", content="", attachment=Attachment(report))
+
+    with WhatsAppProvider("http://localhost:1") as wa:
+        with pytest.raises(AttachmentError):
+            wa.send(message)
+
+
+def test_upload_mode_uploads_each_file_once(report):
+    digest = hashlib.sha256(b"%PDF quarterly numbers").hexdigest()
+    attachment = Attachment(report, filename="report.pdf")
+
+    with StubWhatsAppService() as service:
+        with WhatsAppProvider(service.url, attachment_mode="upload") as wa:
+            for i in range(5):
+                message = Message(recipient=str(i), content="", attachment=attachment)
+                assert wa.send(message).success
+
+    assert service.media == {digest: b"%PDF quarterly numbers"}
+    methods = [method for method, _, _ in service.requests]
+    assert methods == ["HEAD", "PUT"] + ["POST"] * 5
+
+    sent = service.requests[-1][2]["attachment"]
+    assert sent == {
+        "media_id": digest,
+        "filename": "report.pdf",
+        "mime_type": "application/pdf",
+    }
+
+
+def test_upload_skipped_when_service_has_media(report):
+    with StubWhatsAppService() as service:
+        digest = hashlib.sha256(b"%PDF quarterly numbers").hexdigest()
+        service.media[digest] = b"%PDF quarterly numbers"
+
+        with WhatsAppProvider(service.url, attachment_mode="upload") as wa:
+            assert wa.upload(report) == digest
+
+    assert [method for method, _, _ in service.requests] == ["HEAD"]
+
+
+def test_concurrent_senders_share_one_upload(report):
+    attachment = Attachment(report)
+    messages = [
+        Message(recipient=str(i), content="", attachment=attachment) for i in range(20)
+    ]
+
+    with StubWhatsAppService() as service:
+        with WhatsAppProvider(service.url, attachment_mode="upload") as wa:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(wa.send, messages))
+
+    assert all(r.success for r in results)
+    assert [method for method, _, _ in service.requests].count("PUT") == 1
+
+
+def test_failed_send_rechecks_media(report):
+    routes = {
+        ("POST", "/send"): lambda body: (
+            200,
+            {"success": False, "error": {"code": "MEDIA_NOT_FOUND", "message": "no"}},
+        )
+    }
+    message = Message(recipient="1", content="", attachment=Attachment(report))
+
+    with StubWhatsAppService(routes) as service:
+        with WhatsAppProvider(service.url, attachment_mode="upload") as wa:
+            wa.send(message)
+            wa.send(message)
+
+    methods = [method for method, _, _ in service.requests]
+    assert methods == ["HEAD", "PUT", "POST", "HEAD", "POST"]
+
+
+def test_invalid_attachment_mode_raises():
+    with pytest.raises(ProviderError):
+        WhatsAppProvider("http://localhost:1", attachment_mode="inline")
+
+
+def test_orchestrator_requires_provider_path_in_path_mode(report):
+    message = Message(recipient="1", content="", attachment=Attachment(report))
+
+    with StubWhatsAppService() as service:
+        with WhatsAppProvider(service.url) as wa:
+            with pytest.raises(AttachmentError):
+                Orchestrator([wa]).send_many([message, message])
+
+        with WhatsAppProvider(service.url, attachment_mode="upload") as wa:
+            assert Orchestrator([wa]).send(message).success
+
+    sends = [path for _, path, _ in service.requests if path.startswith("/send")]
+    assert sends == ["/send"]